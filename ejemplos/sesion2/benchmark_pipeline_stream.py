@@ -0,0 +1,87 @@
+# benchmark_pipeline_stream.py
+"""
+Pipeline en streaming sobre un catálogo generado de N filas (50M por defecto).
+
+Las filas se generan al vuelo (o se leen de --csv) y el resultado se escribe en
+--salida (os.devnull por defecto). Se imprime el pico de memoria (RSS) cada 10%
+para comprobar que se mantiene constante.
+
+Uso:
+    python benchmark_pipeline_stream.py --filas 50000000
+    python benchmark_pipeline_stream.py --filas 1000000 --csv /tmp/catalogo.csv --salida /tmp/out.jsonl
+"""
+import argparse
+import os
+import random
+import resource
+import sys
+import time
+from typing import Iterator
+
+from pipeline_stream import (Fila, Rechazos, con_stock, descuento, encadenar, escribir_csv, escribir_jsonl,
+                             leer_csv, normalizar_nombres, validar_precios)
+
+CATEGORIAS = ("perifericos", "monitores", "cables", "otros")
+
+
+def generar_catalogo(n: int, semilla: int = 1) -> Iterator[Fila]:
+    """Filas "sucias" como las de un CSV real: espacios, mayúsculas, comas decimales, stock 0."""
+    rnd = random.Random(semilla)
+    for i in range(n):
+        precio = f"{rnd.uniform(1, 500):.2f}"
+        yield {
+            "nombre": f"  Producto {i} ",
+            "precio": precio.replace(".", ",") if i % 3 == 0 else f" {precio} ",
+            "stock": str(rnd.randrange(0, 50)),
+            "categoria": CATEGORIAS[i % 4],
+        }
+
+
+def _rss_mb() -> float:
+    # ru_maxrss: KiB en Linux, bytes en macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def con_progreso(filas: Iterator[Fila], total: int, t0: float) -> Iterator[Fila]:
+    paso = max(1, total // 10)
+    for i, fila in enumerate(filas, 1):
+        if i % paso == 0:
+            dt = time.perf_counter() - t0
+            print(f"  {i:>12,} filas  {i / dt:>10,.0f} filas/s  pico RSS {_rss_mb():7.1f} MB", flush=True)
+        yield fila
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=50_000_000)
+    parser.add_argument("--csv", help="genera el catálogo en este CSV y lo lee desde disco")
+    parser.add_argument("--salida", default=os.devnull)
+    args = parser.parse_args()
+
+    if args.csv:
+        t0 = time.perf_counter()
+        escribir_csv(generar_catalogo(args.filas), args.csv)
+        print(f"CSV generado en {time.perf_counter() - t0:.1f} s")
+        fuente = leer_csv(args.csv)
+    else:
+        fuente = generar_catalogo(args.filas)
+
+    print(f"RSS inicial {_rss_mb():.1f} MB")
+    t0 = time.perf_counter()
+    rechazos = Rechazos(guardar=0)
+    filas = encadenar(
+        con_progreso(fuente, args.filas, t0),
+        normalizar_nombres,
+        validar_precios(rechazos),
+        con_stock,
+        descuento(10.0),
+    )
+    escritas = escribir_jsonl(filas, args.salida)
+    dt = time.perf_counter() - t0
+    print(f"{args.filas:,} filas leídas, {escritas:,} escritas ({rechazos.n:,} rechazadas) en {dt:.1f} s "
+          f"({args.filas / dt:,.0f} filas/s), pico RSS {_rss_mb():.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# benchmark_precios.py
+"""
+Parseo de N precios "sucios": bucle con float() celda a celda frente a
+parsear_precios (un proceso) y parsear_precios_paralelo (pool de procesos).
+
+Uso:
+    python benchmark_precios.py --filas 2000000 --workers 4
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from precios import parsear_precios, parsear_precios_paralelo
+
+
+def generar_precios(n: int, semilla: int = 1) -> List[str]:
+    rnd = random.Random(semilla)
+    formatos = (
+        lambda p: f"{p:.2f}",
+        lambda p: f" {p:.2f} ",
+        lambda p: f"{p:.2f}".replace(".", ","),
+        lambda p: f"{p:,.2f} €".replace(",", "X").replace(".", ",").replace("X", "."),
+        lambda p: f"${p:,.2f}",
+    )
+    return [formatos[i % 5](rnd.uniform(1, 5000)) if i % 1000 else "n/d" for i in range(n)]
+
+
+def bucle_float(valores: List[str]) -> List[float]:
+    """Lo que hacía to_float celda a celda (se salta las que no entiende)."""
+    res = []
+    for s in valores:
+        try:
+            res.append(float(s.strip().replace(",", ".")))
+        except ValueError:
+            res.append(float("nan"))
+    return res
+
+
+def medir(nombre: str, fn, n: int) -> None:
+    t0 = time.perf_counter()
+    fn()
+    dt = time.perf_counter() - t0
+    print(f"{nombre:<28} {dt:7.2f} s  {n / dt:>12,.0f} precios/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=2_000_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--tam-bloque", type=int, default=200_000)
+    args = parser.parse_args()
+
+    valores = generar_precios(args.filas)
+    res = parsear_precios(valores)
+    print(f"{args.filas:,} precios, {res.n_errores:,} inválidos")
+    fallos = sum(v != v for v in bucle_float(valores))
+    print(f"(float() celda a celda no entiende {fallos:,} de ellos)")
+    medir("float() celda a celda", lambda: bucle_float(valores), args.filas)
+    medir("parsear_precios", lambda: parsear_precios(valores), args.filas)
+    medir("parsear_precios_paralelo",
+          lambda: parsear_precios_paralelo(valores, procesos=args.workers, tam_bloque=args.tam_bloque),
+          args.filas)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# catalogo_columnar.py
+"""
+Backend columnar (NumPy) del catálogo de pipeline.py.
+
+En lugar de una lista de dicts (un dict por fila), el catálogo se guarda como
+columnas: nombres, categorías como códigos enteros, precios float64 y stock
+int64. Los KPIs, el descuento y los totales por categoría se calculan con
+operaciones vectorizadas (np.bincount / np.add.reduceat), sin bucles Python.
+
+Nota: np.dot/np.sum no suman en el mismo orden que un bucle Python, así
+que en casos justo en el límite de redondeo el último céntimo puede diferir del
+de kpis_catalogo (que suma en orden y usa round()).
+"""
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def redondear_2(x: np.ndarray) -> np.ndarray:
+    """
+    round(v, 2) elemento a elemento. np.round(x, 2) hace rint(x * 100) / 100 y en
+    los casos casi empatados (p. ej. 1.15 * 0.9) no coincide con round(); esos
+    pocos elementos se redondean con round() y el resto queda vectorizado.
+    """
+    escalado = x * 100.0
+    res = np.rint(escalado) / 100.0
+    dudosos = np.flatnonzero(np.abs(escalado - np.floor(escalado) - 0.5) < 1e-6)
+    if dudosos.size:
+        res[dudosos] = [round(v, 2) for v in x[dudosos].tolist()]
+    return res
+
+
+@dataclass(frozen=True)
+class CatalogoColumnar:
+    nombres: np.ndarray                 # dtype str/object
+    categorias: np.ndarray              # int32: índice en nombres_categoria
+    nombres_categoria: Tuple[str, ...]
+    precios: np.ndarray                 # float64
+    stock: np.ndarray                   # int64
+    precio_final: Optional[np.ndarray] = None
+
+    # ------------------ Construcción ------------------
+    @classmethod
+    def desde_listas(cls, nombres: Sequence[str], precios: Sequence[float], stock: Sequence[int],
+                     categorias: Optional[Sequence[str]] = None) -> "CatalogoColumnar":
+        n = len(nombres)
+        if not (len(precios) == len(stock) == n) or (categorias is not None and len(categorias) != n):
+            raise ValueError("Las columnas deben tener la misma longitud")
+        if categorias is None:
+            categorias = ["otros"] * n
+        nombres_cat, codigos = np.unique(np.asarray(categorias, dtype=str), return_inverse=True)
+        return cls(
+            nombres=np.asarray(nombres, dtype=str),
+            categorias=codigos.astype(np.int32),
+            nombres_categoria=tuple(nombres_cat.tolist()),
+            precios=np.asarray(precios, dtype=np.float64),
+            stock=np.asarray(stock, dtype=np.int64),
+        )
+
+    @classmethod
+    def desde_items(cls, items: Iterable[Dict[str, Any]]) -> "CatalogoColumnar":
+        """Convierte la lista de dicts de combinar_catalogo(_con_categoria)."""
+        items = list(items)
+        cat = cls.desde_listas(
+            [it["nombre"] for it in items],
+            [it["precio"] for it in items],
+            [it["stock"] for it in items],
+            [it.get("categoria", "otros") for it in items],
+        )
+        if any("precio_final" in it for it in items):
+            finales = np.fromiter((it.get("precio_final", it["precio"]) for it in items),
+                                  dtype=np.float64, count=len(items))
+            cat = replace(cat, precio_final=finales)
+        return cat
+
+    def __len__(self) -> int:
+        return self.precios.shape[0]
+
+    # ------------------ Transformaciones ------------------
+    def filtrar(self, mascara: np.ndarray) -> "CatalogoColumnar":
+        return replace(
+            self,
+            nombres=self.nombres[mascara],
+            categorias=self.categorias[mascara],
+            precios=self.precios[mascara],
+            stock=self.stock[mascara],
+            precio_final=None if self.precio_final is None else self.precio_final[mascara],
+        )
+
+    def con_stock(self) -> "CatalogoColumnar":
+        return self.filtrar(self.stock > 0)
+
+    def aplicar_descuento(self, porcentaje: float) -> "CatalogoColumnar":
+        factor = (100.0 - porcentaje) / 100.0
+        return replace(self, precio_final=redondear_2(self.precios * factor))
+
+    # ------------------ Agregados ------------------
+    @property
+    def precios_finales(self) -> np.ndarray:
+        return self.precios if self.precio_final is None else self.precio_final
+
+    def kpis(self) -> Dict[str, Any]:
+        """Mismas claves que kpis_catalogo."""
+        n = len(self)
+        return {
+            "total_refs": n,
+            "total_unidades": int(self.stock.sum()),
+            "valor_inventario": round(float(np.dot(self.precios, self.stock)), 2),
+            "valor_final": round(float(np.dot(self.precios_finales, self.stock)), 2),
+            "media_precio": round(float(self.precios.mean()), 2) if n else 0.0,
+        }
+
+    def valor_por_categoria(self, *, final: bool = False) -> Dict[str, float]:
+        """Equivalente a kpi_por_categoria: suma de precio * stock por categoría (np.bincount)."""
+        precios = self.precios_finales if final else self.precios
+        valores = np.bincount(self.categorias, weights=precios * self.stock,
+                              minlength=len(self.nombres_categoria))
+        presentes = np.bincount(self.categorias, minlength=len(self.nombres_categoria)) > 0
+        return {cat: float(v) for cat, v, p in zip(self.nombres_categoria, valores, presentes) if p}
+
+    def resumen_por_categoria(self) -> Dict[str, Dict[str, float]]:
+        """refs, unidades y valor por categoría con np.add.reduceat sobre las filas agrupadas."""
+        if not len(self):
+            return {}
+        orden = np.argsort(self.categorias, kind="stable")
+        codigos = self.categorias[orden]
+        inicios = np.flatnonzero(np.r_[True, codigos[1:] != codigos[:-1]])
+        unidades = np.add.reduceat(self.stock[orden], inicios)
+        valores = np.add.reduceat((self.precios * self.stock)[orden], inicios)
+        refs = np.diff(np.r_[inicios, len(codigos)])
+        return {
+            self.nombres_categoria[c]: {"refs": int(r), "unidades": int(u), "valor": round(float(v), 2)}
+            for c, r, u, v in zip(codigos[inicios].tolist(), refs, unidades, valores)
+        }
+
+
+if __name__ == "__main__":
+    from pipeline import CATEGORIAS, PRECIOS, PRODUCTOS, STOCK, to_float
+
+    cat = CatalogoColumnar.desde_listas(
+        [p.strip().lower() for p in PRODUCTOS], [to_float(p) for p in PRECIOS], STOCK, CATEGORIAS
+    )
+    cat_desc = cat.con_stock().aplicar_descuento(10.0)
+    print("KPIs:", cat_desc.kpis())
+    print("Valor por categoría:", cat_desc.valor_por_categoria())
+    print("Resumen por categoría:", cat_desc.resumen_por_categoria())
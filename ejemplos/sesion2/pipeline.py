@@ -1,5 +1,7 @@
 from itertools import zip_longest
 
+from precios import parsear_precio
+
 # Datos “paralelos” (mismo orden que PRODUCTOS)
 PRECIOS = [" 19.90 ", "9,50", "129.00", " 4.99", "7.00"]
 STOCK   = [10, 0, 5, 25, 3]  # unidades
@@ -30,11 +32,12 @@ if __name__ == "__main__":
 
 
 def to_float(s: str) -> float:
-    return float(s.strip().replace(",", "."))
+    # "9,50", " 19.90 ", "1.234,50 €"... (ver precios.py)
+    return parsear_precio(s)
 
 def normalizar_precio_lista(precios):
-    # TODO: map -> float limpio
-    pass
+    """Lista de floats; lanza ValueError en el primer precio inválido (en bloque: precios.parsear_precios)."""
+    return list(map(to_float, precios))
 
 def combinar_catalogo(nombres_norm, precios_float, stock):
     """
@@ -73,63 +76,114 @@ if __name__ == "__main__":
 
 from functools import reduce
 
+class AcumuladorCatalogo:
+    """
+    Acumula en UNA pasada los KPIs de kpis_catalogo y las banderas de calidad_datos.
+    - agregar(items): trozo de items (dicts nombre/precio/stock/precio_final?)
+    - agregar_columnas(nombres, precios, stock): listas paralelas (solo calidad)
+    - fusionar(otro) / sum(...): combina estados parciales (p. ej. de varios workers)
+    Alimentado secuencialmente da exactamente los mismos números que las funciones
+    originales. Al fusionar trozos las sumas flotantes se asocian de otra forma:
+    un valor justo en el límite de redondeo puede variar en el último céntimo.
+    """
+    __slots__ = ("total_refs", "total_unidades", "valor_inventario", "valor_final", "suma_precios",
+                 "hay_precios_no_validos", "nombres_ok", "hay_stock_negativo",
+                 "n_nombres", "n_precios", "n_stock")
+
+    def __init__(self):
+        self.total_refs = 0
+        self.total_unidades = 0
+        self.valor_inventario = 0.0
+        self.valor_final = 0.0
+        self.suma_precios = 0.0
+        self.hay_precios_no_validos = False
+        self.nombres_ok = True
+        self.hay_stock_negativo = False
+        self.n_nombres = self.n_precios = self.n_stock = 0
+
+    def agregar(self, items):
+        for it in items:
+            precio = it["precio"]
+            stock = it["stock"]
+            self.total_refs += 1
+            self.total_unidades += stock
+            self.valor_inventario += precio * stock
+            self.valor_final += it.get("precio_final", precio) * stock
+            self.suma_precios += precio
+            if precio <= 0:
+                self.hay_precios_no_validos = True
+            if stock < 0:
+                self.hay_stock_negativo = True
+            if self.nombres_ok and not str(it.get("nombre", "")).strip():
+                self.nombres_ok = False
+            self.n_nombres += 1
+            self.n_precios += 1
+            self.n_stock += 1
+        return self
+
+    def agregar_columnas(self, nombres_norm, precios_float, stock):
+        falta = object()
+        for n, p, s in zip_longest(nombres_norm, precios_float, stock, fillvalue=falta):
+            if n is not falta:
+                self.n_nombres += 1
+                if self.nombres_ok and not n.strip():
+                    self.nombres_ok = False
+            if p is not falta:
+                self.n_precios += 1
+                if p <= 0:
+                    self.hay_precios_no_validos = True
+            if s is not falta:
+                self.n_stock += 1
+                if s < 0:
+                    self.hay_stock_negativo = True
+        return self
+
+    def fusionar(self, otro: "AcumuladorCatalogo") -> "AcumuladorCatalogo":
+        res = AcumuladorCatalogo()
+        for campo in ("total_refs", "total_unidades", "valor_inventario", "valor_final", "suma_precios",
+                      "n_nombres", "n_precios", "n_stock"):
+            setattr(res, campo, getattr(self, campo) + getattr(otro, campo))
+        res.hay_precios_no_validos = self.hay_precios_no_validos or otro.hay_precios_no_validos
+        res.nombres_ok = self.nombres_ok and otro.nombres_ok
+        res.hay_stock_negativo = self.hay_stock_negativo or otro.hay_stock_negativo
+        return res
+
+    __add__ = fusionar
+
+    def __radd__(self, otro):
+        # permite sum(acumuladores) (empieza en 0)
+        return self if otro == 0 else otro.fusionar(self)
+
+    def kpis(self) -> dict:
+        media_precio = self.suma_precios / self.total_refs if self.total_refs else 0.0
+        return {
+            "total_refs": self.total_refs,
+            "total_unidades": self.total_unidades,
+            "valor_inventario": round(self.valor_inventario, 2),
+            "valor_final": round(self.valor_final, 2),
+            "media_precio": round(media_precio, 2),
+        }
+
+    def calidad(self) -> dict:
+        return {
+            "hay_precios_no_validos": self.hay_precios_no_validos,
+            "nombres_ok": self.nombres_ok,
+            "hay_stock_negativo": self.hay_stock_negativo,
+            "longitudes_ok": self.n_nombres == self.n_precios == self.n_stock,
+        }
+
 def kpis_catalogo(items):
     """
     items: lista de dicts con al menos: nombre, precio, stock, (opcional) precio_final
-    Devuelve un dict con KPIs agregados.
+    Devuelve un dict con KPIs agregados (una sola pasada con AcumuladorCatalogo).
     """
-    # total de referencias (tras filtros)
-    total_refs = len(items)
-
-    # suma de unidades en stock
-    total_unidades = reduce(lambda acc, it: acc + it["stock"], items, 0)
-
-    # valor bruto (precio * stock)
-    valor_inventario = reduce(lambda acc, it: acc + it["precio"] * it["stock"], items, 0.0)
-
-    # si hay precio_final, calcula valor con descuento; si no, usa precio
-    valor_final = reduce(
-        lambda acc, it: acc + (it.get("precio_final", it["precio"])) * it["stock"],
-        items,
-        0.0
-    )
-
-    # media de precio unitario (evita división por cero)
-    media_precio = (
-        reduce(lambda acc, it: acc + it["precio"], items, 0.0) / total_refs
-        if total_refs else 0.0
-    )
-
-    return {
-        "total_refs": total_refs,
-        "total_unidades": total_unidades,
-        "valor_inventario": round(valor_inventario, 2),
-        "valor_final": round(valor_final, 2),
-        "media_precio": round(media_precio, 2),
-    }
+    return AcumuladorCatalogo().agregar(items).kpis()
 
 def calidad_datos(nombres_norm, precios_float, stock):
     """
-    Valida condiciones globales con any/all sobre colecciones paralelas.
+    Valida condiciones globales sobre colecciones paralelas (una sola pasada).
     """
-    # ¿Algún precio <= 0?
-    hay_precios_no_validos = any(p <= 0 for p in precios_float)
-
-    # ¿Todos los nombres no vacíos tras normalización?
-    nombres_ok = all(n.strip() for n in nombres_norm)
-
-    # ¿Hay algún stock negativo?
-    hay_stock_negativo = any(s < 0 for s in stock)
-
-    # ¿Listas sincronizadas?
-    longitudes_ok = len(nombres_norm) == len(precios_float) == len(stock)
-
-    return {
-        "hay_precios_no_validos": hay_precios_no_validos,
-        "nombres_ok": nombres_ok,
-        "hay_stock_negativo": hay_stock_negativo,
-        "longitudes_ok": longitudes_ok,
-    }
+    return AcumuladorCatalogo().agregar_columnas(nombres_norm, precios_float, stock).calidad()
 
 if __name__ == "__main__":
     # ---- Fase 1
@@ -184,7 +238,7 @@ if __name__ == "__main__":
                 return acc
 
         resultado = reduce(acum, items_con_cat, {})
-
+        return resultado
 
 
 
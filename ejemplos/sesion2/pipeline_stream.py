@@ -0,0 +1,171 @@
+# pipeline_stream.py
+"""
+Versión perezosa (streaming) del pipeline de catálogo de pipeline.py.
+
+Cada etapa es una función iterable -> iterable basada en generadores, así que
+en memoria solo vive la fila que se está procesando: el consumo es constante
+sea cual sea el tamaño del catálogo.
+
+    fuente  ->  etapa  ->  etapa  ->  ...  ->  sumidero
+    leer_csv    normalizar_nombres  con_stock  descuento(10)  escribir_jsonl
+"""
+import csv
+import json
+from functools import partial, reduce
+from itertools import zip_longest
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pipeline import to_float
+
+Fila = Dict[str, Any]
+Etapa = Callable[[Iterable[Fila]], Iterable[Fila]]
+AlRechazar = Callable[[Fila, Exception], None]
+
+COLUMNAS = ("nombre", "precio", "stock", "categoria")
+
+
+# ------------------------------------------------------------
+# Fuentes
+# ------------------------------------------------------------
+def leer_csv(path: str | Path, *, delimitador: str = ",") -> Iterator[Fila]:
+    """Filas de un CSV con cabecera (nombre, precio, stock[, categoria]) como dicts de str."""
+    with Path(path).open(newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f, delimiter=delimitador)
+
+
+def leer_jsonl(path: str | Path) -> Iterator[Fila]:
+    """Una fila por línea JSON; las líneas vacías se ignoran."""
+    with Path(path).open(encoding="utf-8") as f:
+        for linea in f:
+            if linea.strip():
+                yield json.loads(linea)
+
+
+def desde_listas(nombres: Iterable[str], precios: Iterable[Any], stock: Iterable[Any],
+                 categorias: Optional[Iterable[str]] = None) -> Iterator[Fila]:
+    """Adapta las listas paralelas (PRODUCTOS, PRECIOS, STOCK...) a filas; descarta incompletas."""
+    columnas = [nombres, precios, stock] + ([categorias] if categorias is not None else [])
+    for valores in zip_longest(*columnas, fillvalue=None):
+        if all(v is not None for v in valores):
+            yield dict(zip(COLUMNAS, valores))
+
+
+# ------------------------------------------------------------
+# Etapas
+# ------------------------------------------------------------
+def normalizar_nombres(filas: Iterable[Fila]) -> Iterator[Fila]:
+    """strip + lower del nombre (como normalizar_lista)."""
+    for fila in filas:
+        yield {**fila, "nombre": str(fila["nombre"]).strip().lower()}
+
+
+def normalizar_precios(filas: Iterable[Fila], *, al_rechazar: Optional[AlRechazar] = None) -> Iterator[Fila]:
+    """
+    Precio a float y stock a int. Las filas no convertibles no siguen por el
+    pipeline; se notifican a `al_rechazar(fila, error)` (p. ej. un Rechazos),
+    como la máscara de errores de precios.parsear_precios.
+    """
+    for fila in filas:
+        try:
+            precio = fila["precio"]
+            precio = precio if isinstance(precio, float) else to_float(str(precio))
+            stock = int(fila["stock"])
+        except (KeyError, TypeError, ValueError) as e:
+            if al_rechazar is not None:
+                al_rechazar(fila, e)
+            continue
+        yield {**fila, "precio": precio, "stock": stock}
+
+
+def validar_precios(al_rechazar: AlRechazar) -> Etapa:
+    """normalizar_precios como etapa de encadenar, avisando de cada fila rechazada."""
+    return partial(normalizar_precios, al_rechazar=al_rechazar)
+
+
+class Rechazos:
+    """Callback al_rechazar que cuenta las filas rechazadas y guarda las `guardar` primeras con su error."""
+
+    def __init__(self, guardar: int = 100):
+        self.n = 0
+        self.guardar = guardar
+        self.filas: List[Tuple[Fila, Exception]] = []
+
+    def __call__(self, fila: Fila, error: Exception) -> None:
+        self.n += 1
+        if len(self.filas) < self.guardar:
+            self.filas.append((fila, error))
+
+
+def con_stock(filas: Iterable[Fila]) -> Iterator[Fila]:
+    """Filtra artículos sin stock (stock > 0), como combinar_catalogo."""
+    return (fila for fila in filas if fila["stock"] > 0)
+
+
+def descuento(porcentaje: float) -> Etapa:
+    """Etapa que añade precio_final con `porcentaje` de descuento (redondeado a 2)."""
+    factor = (100.0 - porcentaje) / 100.0
+
+    def etapa(filas: Iterable[Fila]) -> Iterator[Fila]:
+        for fila in filas:
+            yield {**fila, "precio_final": round(fila["precio"] * factor, 2)}
+    return etapa
+
+
+def filtrar(predicado: Callable[[Fila], bool]) -> Etapa:
+    """Etapa genérica de filtrado."""
+    return lambda filas: filter(predicado, filas)
+
+
+def encadenar(fuente: Iterable[Fila], *etapas: Etapa) -> Iterator[Fila]:
+    """Compone las etapas sobre la fuente sin materializar nada (todo sigue siendo perezoso)."""
+    return iter(reduce(lambda it, etapa: etapa(it), etapas, fuente))
+
+
+# ------------------------------------------------------------
+# Sumideros
+# ------------------------------------------------------------
+def escribir_jsonl(filas: Iterable[Fila], path: str | Path) -> int:
+    """Escribe una fila JSON por línea. Devuelve el nº de filas escritas."""
+    n = 0
+    with Path(path).open("w", encoding="utf-8") as f:
+        for fila in filas:
+            f.write(json.dumps(fila, ensure_ascii=False))
+            f.write("\n")
+            n += 1
+    return n
+
+
+def escribir_csv(filas: Iterable[Fila], path: str | Path) -> int:
+    """Escribe un CSV; la cabecera sale de la primera fila. Devuelve el nº de filas escritas."""
+    it = iter(filas)
+    primera = next(it, None)
+    with Path(path).open("w", newline="", encoding="utf-8") as f:
+        if primera is None:
+            return 0
+        w = csv.DictWriter(f, fieldnames=list(primera), extrasaction="ignore")
+        w.writeheader()
+        w.writerow(primera)
+        n = 1
+        for fila in it:
+            w.writerow(fila)
+            n += 1
+    return n
+
+
+if __name__ == "__main__":
+    from pipeline import CATEGORIAS, PRECIOS, PRODUCTOS, STOCK
+
+    rechazos = Rechazos()
+    filas = encadenar(
+        desde_listas(PRODUCTOS, PRECIOS, STOCK, CATEGORIAS),
+        normalizar_nombres,
+        validar_precios(rechazos),
+        con_stock,
+        descuento(10.0),
+    )
+    for fila in filas:
+        print(fila)
+    print(f"{rechazos.n} filas rechazadas")
+    for fila, error in rechazos.filas:
+        print(f"  {fila!r}: {error}")
@@ -0,0 +1,218 @@
+# precios.py
+"""
+Parseo masivo de precios "sucios" de CSV.
+
+Acepta "9,50", " 19.90 ", "1.234,50", "1,234.50", "€ 12", "12,00 EUR", "1 299,99"...
+  - Camino rápido: float(s) directamente (la mayoría de celdas ya vienen con '.').
+  - Camino lento: quita símbolos de moneda y espacios, deduce el separador
+    decimal (el último de ',' / '.' si aparecen los dos; una sola ',' es decimal)
+    y valida los grupos de miles.
+En bloque no se lanza excepción en la primera celda mala: se devuelve un array
+compacto de float64 (array('d') o NumPy) con NaN en las celdas inválidas y una
+máscara de errores. Para ficheros grandes los bloques se reparten entre procesos.
+"""
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from functools import partial
+from itertools import islice
+import math
+import os
+from pathlib import Path
+import re
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+try:  # NumPy es opcional: sin él se devuelven array('d') / array('B')
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+MONEDAS = "€$£¥"
+# Espacios (incluidos los no separables que usa el formato es-ES) y apóstrofo suizo
+_SIN_SIMBOLOS = str.maketrans("", "", MONEDAS + " \t\u00a0\u202f'")
+_LETRAS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"  # EUR, USD, eur...
+_NUMERO = re.compile(r"[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)")
+# Caché de valores por bloque: en un catálogo real los precios se repiten mucho
+_MAX_CACHE = 4096
+
+
+class ResultadoPrecios(NamedTuple):
+    valores: Any   # array('d') o np.ndarray[float64]; NaN donde hay error
+    errores: Any   # array('B') (1 = error) o np.ndarray[bool]
+
+    @property
+    def n_errores(self) -> int:
+        return int(sum(self.errores))
+
+
+def _parsear_lento(s: str, decimal: Optional[str]) -> float:
+    if decimal is None and s.count(",") == 1 and "." not in s:
+        try:  # "9,50" / " 9,50 " sin más adornos
+            return float(s.replace(",", "."))
+        except ValueError:
+            pass
+    t = s.translate(_SIN_SIMBOLOS).strip(_LETRAS)
+    coma, punto = t.rfind(","), t.rfind(".")
+    if decimal is None:
+        if coma >= 0 and punto >= 0:
+            decimal = "," if coma > punto else "."
+        elif coma >= 0:
+            decimal = "," if t.count(",") == 1 else "."
+        else:
+            decimal = "." if t.count(".") <= 1 else ","
+    miles = "." if decimal == "," else ","
+    if miles in t:
+        entero = t.partition(decimal)[0].lstrip("+-")
+        grupos = entero.split(miles)
+        if not grupos[0] or len(grupos[0]) > 3 or any(len(g) != 3 for g in grupos[1:]):
+            raise ValueError(f"separador de miles mal colocado: {s!r}")
+        t = t.replace(miles, "")
+    if decimal == ",":
+        t = t.replace(",", ".")
+    if not _NUMERO.fullmatch(t):
+        raise ValueError(f"precio no válido: {s!r}")
+    return float(t)
+
+
+def parsear_precio(s: Any, decimal: Optional[str] = None) -> float:
+    """
+    Un precio a float; lanza ValueError si no es válido (NaN/inf incluidos).
+    decimal: None (deduce), "." o ",".
+    """
+    if isinstance(s, (int, float)) and not isinstance(s, bool):
+        v = float(s)
+    elif not isinstance(s, str):
+        raise ValueError(f"precio no válido: {s!r}")
+    elif decimal == "," and "." in s:
+        v = _parsear_lento(s, decimal)
+    else:
+        try:
+            v = float(s)
+        except ValueError:
+            v = _parsear_lento(s, decimal)
+    if not math.isfinite(v):
+        raise ValueError(f"precio no válido: {s!r}")
+    return v
+
+
+def _parsear_bloque(valores: Iterable[Any], decimal: Optional[str] = None):
+    salida = array("d")
+    errores = array("B")
+    anadir, anadir_error = salida.append, errores.append
+    rapido = decimal != ","
+    cache: Dict[Any, float] = {}
+    nan = math.nan
+    for s in valores:
+        # Camino rápido en línea: la mayoría de celdas son "19.90" / " 19.90 "
+        if rapido and type(s) is str:
+            try:
+                v = float(s)
+            except ValueError:
+                pass
+            else:
+                if v - v == 0:   # finito (inf - inf y nan - nan dan nan)
+                    anadir(v)
+                    anadir_error(0)
+                    continue
+        try:
+            v = cache[s]
+        except (KeyError, TypeError):
+            try:
+                # si es str y llegamos aquí, float(s) ya falló: directo al camino lento
+                v = _parsear_lento(s, decimal) if rapido and type(s) is str else parsear_precio(s, decimal)
+                if v - v != 0:
+                    v = nan
+            except ValueError:
+                v = nan
+            if len(cache) < _MAX_CACHE:
+                try:
+                    cache[s] = v
+                except TypeError:
+                    pass
+        anadir(v)
+        anadir_error(v != v)
+    return salida, errores
+
+
+def _resultado(valores: array, errores: array, numpy: bool) -> ResultadoPrecios:
+    if numpy:
+        if np is None:
+            raise RuntimeError("numpy=True requiere NumPy instalado")
+        return ResultadoPrecios(np.frombuffer(valores, dtype=np.float64).copy(),
+                                np.frombuffer(errores, dtype=np.uint8).astype(bool))
+    return ResultadoPrecios(valores, errores)
+
+
+def parsear_precios(valores: Iterable[Any], *, decimal: Optional[str] = None,
+                    numpy: bool = False) -> ResultadoPrecios:
+    """Parsea todos los valores sin lanzar: NaN + errores[i] = 1 en las celdas inválidas."""
+    return _resultado(*_parsear_bloque(valores, decimal), numpy)
+
+
+def _bloques(it: Iterable[Any], tam: int) -> Iterator[List[Any]]:
+    it = iter(it)
+    while True:
+        bloque = list(islice(it, tam))
+        if not bloque:
+            return
+        yield bloque
+
+
+def parsear_precios_paralelo(valores: Iterable[Any], *, decimal: Optional[str] = None,
+                             numpy: bool = False, procesos: Optional[int] = None,
+                             tam_bloque: int = 200_000,
+                             en_vuelo: Optional[int] = None) -> ResultadoPrecios:
+    """
+    Igual que parsear_precios pero repartiendo bloques de `tam_bloque` celdas entre
+    un pool de procesos. El orden se conserva y como mucho hay `en_vuelo` bloques
+    pendientes (2 por proceso por defecto), así que la entrada puede ser un stream.
+    """
+    if tam_bloque < 1:
+        raise ValueError("tam_bloque debe ser >= 1")
+    procesos = procesos or os.cpu_count() or 1
+    limite = en_vuelo or 2 * procesos
+    trabajo = partial(_parsear_bloque, decimal=decimal)
+    salida, errores = array("d"), array("B")
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        pendientes: deque = deque()
+        for bloque in _bloques(valores, tam_bloque):
+            pendientes.append(pool.submit(trabajo, bloque))
+            if len(pendientes) >= limite:
+                v, e = pendientes.popleft().result()
+                salida.extend(v)
+                errores.extend(e)
+        while pendientes:
+            v, e = pendientes.popleft().result()
+            salida.extend(v)
+            errores.extend(e)
+    return _resultado(salida, errores, numpy)
+
+
+def parsear_csv(path: str | Path, columna: str = "precio", *, delimitador: str = ",",
+                procesos: Optional[int] = 1, **opciones: Any) -> ResultadoPrecios:
+    """
+    Parsea la columna `columna` de un CSV con cabecera leyéndolo en streaming.
+    procesos=1 lo hace en este proceso; None o >1 usa parsear_precios_paralelo.
+    """
+    with Path(path).open(newline="", encoding="utf-8") as f:
+        lector = csv.reader(f, delimiter=delimitador)
+        cabecera = next(lector, [])
+        try:
+            i = cabecera.index(columna)
+        except ValueError:
+            raise ValueError(f"el CSV no tiene columna {columna!r}") from None
+        celdas = (fila[i] if i < len(fila) else None for fila in lector)
+        if procesos == 1:
+            return parsear_precios(celdas, **opciones)
+        return parsear_precios_paralelo(celdas, procesos=procesos, **opciones)
+
+
+if __name__ == "__main__":
+    from pipeline import PRECIOS
+
+    sucios = PRECIOS + ["1.234,50", "1,234.50", "€ 12", "12,00 EUR", "1 299,99", "abc", "", "1.2.3"]
+    res = parsear_precios(sucios)
+    for s, v, e in zip(sucios, res.valores, res.errores):
+        print(f"{s!r:>14} -> {v!r:<10} {'ERROR' if e else ''}")
+    print("errores:", res.n_errores)
@@ -0,0 +1,54 @@
+import pytest
+
+from pipeline import AcumuladorCatalogo, calidad_datos, kpis_catalogo
+
+CATALOGO = [
+    {"nombre": "teclado usb", "precio": 19.9, "stock": 10, "precio_final": 17.91},
+    {"nombre": "monitor 24''", "precio": 129.0, "stock": 5, "precio_final": 116.1},
+    {"nombre": "cable hdmi", "precio": 4.99, "stock": 25},
+    {"nombre": "alfombrilla", "precio": 7.0, "stock": 3, "precio_final": 6.3},
+]
+
+
+def test_kpis_catalogo():
+    assert kpis_catalogo(CATALOGO) == {
+        "total_refs": 4,
+        "total_unidades": 43,
+        "valor_inventario": 989.75,
+        "valor_final": 903.25,
+        "media_precio": 40.22,
+    }
+    assert kpis_catalogo([])["media_precio"] == 0.0
+
+
+def test_calidad_datos():
+    assert calidad_datos(["a", "b"], [1.0, 2.0], [1, 2]) == {
+        "hay_precios_no_validos": False,
+        "nombres_ok": True,
+        "hay_stock_negativo": False,
+        "longitudes_ok": True,
+    }
+    calidad = calidad_datos(["a", " "], [0.0, 2.0, 3.0], [1, -1])
+    assert calidad["hay_precios_no_validos"] and calidad["hay_stock_negativo"]
+    assert not calidad["nombres_ok"] and not calidad["longitudes_ok"]
+
+
+def test_acumulador_fusiona_trozos():
+    partes = [AcumuladorCatalogo().agregar(CATALOGO[:1]), AcumuladorCatalogo().agregar(CATALOGO[1:])]
+    total = sum(partes)
+    assert total.kpis()["total_unidades"] == 43
+    assert total.kpis()["total_refs"] == 4
+    assert total.calidad() == AcumuladorCatalogo().agregar(CATALOGO).calidad()
+
+
+def test_catalogo_columnar_igual_que_dicts():
+    pytest.importorskip("numpy")
+    from catalogo_columnar import CatalogoColumnar
+
+    items = [{**it, "categoria": c} for it, c in zip(CATALOGO, ["perifericos", "monitores", "cables", "perifericos"])]
+    col = CatalogoColumnar.desde_items(items)
+    assert col.kpis() == kpis_catalogo(CATALOGO)
+    assert col.valor_por_categoria() == pytest.approx({"perifericos": 220.0, "monitores": 645.0, "cables": 124.75})
+    assert col.resumen_por_categoria()["perifericos"] == {"refs": 2, "unidades": 13, "valor": 220.0}
+    desc = col.aplicar_descuento(10.0).precio_final.tolist()
+    assert desc == [round(it["precio"] * 0.9, 2) for it in CATALOGO]
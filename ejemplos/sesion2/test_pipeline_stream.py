@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from pipeline_stream import (
+    Rechazos,
+    con_stock,
+    desde_listas,
+    descuento,
+    encadenar,
+    escribir_csv,
+    escribir_jsonl,
+    filtrar,
+    leer_csv,
+    leer_jsonl,
+    normalizar_nombres,
+    normalizar_precios,
+    validar_precios,
+)
+
+FILAS = [
+    {"nombre": " Teclado USB ", "precio": "19,90", "stock": "10"},
+    {"nombre": "Monitor", "precio": "n/a", "stock": "5"},
+    {"nombre": "CABLE", "precio": 4.99, "stock": 0},
+    {"nombre": "Ratón", "precio": "12.5", "stock": "tres"},
+    {"nombre": "Alfombrilla", "stock": "3"},
+    {"nombre": "Hub", "precio": None, "stock": "2"},
+    {"nombre": "Webcam", "precio": "1.234,50 €", "stock": "1"},
+]
+
+
+def test_normalizar_precios_avisa_de_cada_fila_rechazada():
+    vistos = []
+    salida = list(normalizar_precios(FILAS, al_rechazar=lambda fila, e: vistos.append((fila["nombre"], type(e)))))
+    assert [(f["nombre"], f["precio"], f["stock"]) for f in salida] == [
+        (" Teclado USB ", 19.9, 10), ("CABLE", 4.99, 0), ("Webcam", 1234.5, 1),
+    ]
+    assert vistos == [("Monitor", ValueError), ("Ratón", ValueError), ("Alfombrilla", KeyError), ("Hub", ValueError)]
+    # sin callback se siguen descartando
+    assert list(normalizar_precios(FILAS)) == salida
+
+
+def test_rechazos_cuenta_y_guarda_las_primeras():
+    rechazos = Rechazos(guardar=2)
+    filas = encadenar(iter(FILAS), normalizar_nombres, validar_precios(rechazos), con_stock, descuento(10.0))
+    assert rechazos.n == 0  # perezoso: nada se procesa hasta consumir
+    assert [(f["nombre"], f["precio_final"]) for f in filas] == [("teclado usb", 17.91), ("webcam", 1111.05)]
+    assert rechazos.n == 4
+    assert [f["nombre"] for f, _ in rechazos.filas] == ["monitor", "ratón"]
+
+
+def test_etapas_son_perezosas():
+    consumidas = []
+
+    def fuente():
+        for i in range(1, 1_000_000):
+            consumidas.append(i)
+            yield {"nombre": f"P{i}", "precio": f"{i},00", "stock": i % 2}
+
+    filas = encadenar(fuente(), normalizar_precios, con_stock, filtrar(lambda f: f["precio"] > 4))
+    assert next(filas)["nombre"] == "P5"
+    assert consumidas == [1, 2, 3, 4, 5]
+
+
+def test_desde_listas_descarta_incompletas():
+    filas = list(desde_listas(["a", "b", "c"], [1.0, None, 3.0], [1, 2], ["x", "y", "z"]))
+    assert filas == [{"nombre": "a", "precio": 1.0, "stock": 1, "categoria": "x"}]
+
+
+@pytest.mark.parametrize("escribir,leer", [(escribir_jsonl, leer_jsonl), (escribir_csv, leer_csv)])
+def test_ida_y_vuelta(tmp_path, escribir, leer):
+    path = tmp_path / "catalogo"
+    filas = [{"nombre": "a", "precio": "1.5", "stock": "2"}, {"nombre": "b", "precio": "2", "stock": "0"}]
+    assert escribir(iter(filas), path) == 2
+    assert list(leer(path)) == filas
+
+
+def test_escribir_vacio(tmp_path):
+    assert escribir_csv(iter([]), tmp_path / "v.csv") == 0
+    assert escribir_jsonl(iter([]), tmp_path / "v.jsonl") == 0
+    (tmp_path / "l.jsonl").write_text('{"a": 1}\n\n' + json.dumps({"a": 2}) + "\n", encoding="utf-8")
+    assert list(leer_jsonl(tmp_path / "l.jsonl")) == [{"a": 1}, {"a": 2}]
@@ -0,0 +1,28 @@
+import math
+
+import pytest
+
+from precios import parsear_csv, parsear_precio, parsear_precios, parsear_precios_paralelo
+
+
+@pytest.mark.parametrize("texto, esperado", [
+    (" 19.90 ", 19.9), ("9,50", 9.5), ("1.234,50", 1234.5), ("1,234.50", 1234.5),
+    ("€ 12", 12.0), ("12,00 EUR", 12.0), ("1 299,99", 1299.99), ("1.234.567", 1234567.0),
+])
+def test_parsear_precio(texto, esperado):
+    assert parsear_precio(texto) == esperado
+
+
+def test_parsear_precios_mascara_de_errores(tmp_path):
+    valores = ["9,50", "abc", None, "nan", "1.2.3", " 4.99"]
+    res = parsear_precios(valores)
+    assert list(res.errores) == [0, 1, 1, 1, 1, 0]
+    assert res.valores[0] == 9.5 and math.isnan(res.valores[1])
+    assert list(parsear_precios(["1.950", "9.50"], decimal=",").valores)[:1] == [1950.0]
+
+    par = parsear_precios_paralelo(valores * 3, procesos=2, tam_bloque=4)
+    assert list(par.errores) == list(res.errores) * 3
+
+    csv = tmp_path / "catalogo.csv"
+    csv.write_text('nombre,precio\nteclado,"19,90"\nraton,x\n', encoding="utf-8")
+    assert list(parsear_csv(csv).errores) == [0, 1]
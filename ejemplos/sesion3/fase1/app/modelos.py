@@ -1,4 +1,13 @@
 from abc import ABC, abstractmethod
+from contextlib import suppress
+from typing import Any, Callable
+
+from .passwords import hashear, verificar_y_actualizar
+
+# (usuario, campo, anterior, nuevo). Se llama con el cambio ya aplicado;
+# si un observador lanza, el campo vuelve a su valor anterior y los observadores
+# que ya lo habían aceptado reciben el cambio inverso (nuevo -> anterior).
+Observador = Callable[["Usuario", str, Any, Any], None]
 
 class BaseUsuario(ABC):
     @abstractmethod
@@ -10,11 +19,13 @@ class Usuario(BaseUsuario):
     ROLES_VALIDOS = {"usuario", "admin", "invitado"}
 
     def __init__(self, nombre: str, email: str, rol: str = "usuario", activo: bool = True):
+        self._observadores: list[Observador] = []
         self.nombre = nombre
         self._email = None
         self.email = email  # dispara setter
         self._rol = None
         self.rol = rol      # dispara setter
+        self._activo = None
         self.activo = activo
         self.__password_hash = None
         Usuario.contador += 1
@@ -25,6 +36,32 @@ class Usuario(BaseUsuario):
     def __repr__(self):
         return f"Usuario(nombre={self.nombre!r}, email={self.email!r}, rol={self.rol!r}, activo={self.activo!r})"
 
+    # Observadores (p. ej. índices de RepositorioUsuarios)
+    def suscribir(self, observador: Observador) -> None:
+        self._observadores.append(observador)
+
+    def desuscribir(self, observador: Observador) -> None:
+        if observador in self._observadores:
+            self._observadores.remove(observador)
+
+    def _cambiar(self, campo: str, nuevo: Any) -> None:
+        atributo = f"_{campo}"
+        anterior = getattr(self, atributo)
+        setattr(self, atributo, nuevo)
+        if anterior is not None and anterior != nuevo and self._observadores:
+            avisados: list[Observador] = []
+            try:
+                for obs in list(self._observadores):
+                    obs(self, campo, anterior, nuevo)
+                    avisados.append(obs)
+            except BaseException:
+                # Los que ya aceptaron el cambio reciben el inverso (p. ej. un índice que ya re-indexó)
+                setattr(self, atributo, anterior)
+                for obs in reversed(avisados):
+                    with suppress(Exception):
+                        obs(self, campo, nuevo, anterior)
+                raise
+
     # Encapsulación email
     @property
     def email(self) -> str:
@@ -34,7 +71,7 @@ class Usuario(BaseUsuario):
     def email(self, value: str):
         if "@" not in (value or ""):
             raise ValueError("Email inválido")
-        self._email = value.strip().lower()
+        self._cambiar("email", value.strip().lower())
 
     # Encapsulación rol
     @property
@@ -46,14 +83,27 @@ class Usuario(BaseUsuario):
         v = (value or "").lower().strip()
         if v not in self.ROLES_VALIDOS:
             raise ValueError(f"Rol inválido: {value!r}")
-        self._rol = v
+        self._cambiar("rol", v)
+
+    # activo como propiedad para que los índices se enteren de activar()/desactivar()
+    @property
+    def activo(self) -> bool:
+        return self._activo
+
+    @activo.setter
+    def activo(self, value: bool):
+        self._cambiar("activo", bool(value))
 
-    # Password simulada
+    # Password (KDF, ver passwords.py)
     def set_password(self, p: str):
-        self.__password_hash = f"hash::{p}"
+        self.__password_hash = hashear(p)
 
     def check_password(self, p: str) -> bool:
-        return self.__password_hash == f"hash::{p}"
+        """Tiempo constante; un hash antiguo ("hash::") o de menor coste se rehace."""
+        ok, nuevo = verificar_y_actualizar(p, self.__password_hash)
+        if nuevo is not None:
+            self.__password_hash = nuevo
+        return ok
 
     def presentarse(self) -> str:
         return f"Soy {self.nombre} ({self.email})"
@@ -1,24 +1,127 @@
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 from .modelos import Usuario
 
+
+def dominio(email: str) -> str:
+    return email.rpartition("@")[2]
+
+
+_VERDADERO = {"true", "1", "si", "sí", "yes", "on"}
+_FALSO = {"false", "0", "no", "off", ""}
+
+
+def a_bool(v: Any) -> bool:
+    """bool() salvo en strings (de un formulario o query string): bool("false") sería True."""
+    if isinstance(v, str):
+        t = v.strip().lower()
+        if t in _VERDADERO:
+            return True
+        if t in _FALSO:
+            return False
+        raise ValueError(f"Valor booleano inválido: {v!r}")
+    return bool(v)
+
+
 class RepositorioUsuarios:
+    # Índices secundarios declarativos: nombre -> (campo de Usuario que lo altera, clave)
+    INDICES: dict[str, tuple[str, Callable[[Usuario], Any]]] = {
+        "rol": ("rol", lambda u: u.rol),
+        "activo": ("activo", lambda u: u.activo),
+        "dominio": ("email", lambda u: dominio(u.email)),
+    }
+    # Normalización de los valores de filtro (igual que los setters de Usuario)
+    _NORMALIZAR: dict[str, Callable[[Any], Any]] = {
+        "rol": lambda v: (v or "").lower().strip(),
+        "activo": a_bool,
+        "dominio": lambda v: (v or "").lower().strip(),
+        "email": lambda v: (v or "").lower().strip(),
+    }
+
     def __init__(self):
         self._por_email: dict[str, Usuario] = {}
+        # nombre índice -> valor -> {email: usuario} (dict como conjunto ordenado)
+        self._indices: dict[str, dict[Any, dict[str, Usuario]]] = {n: {} for n in self.INDICES}
+        # email -> {nombre índice: valor indexado}, para sacar al usuario de sus cubos
+        self._claves: dict[str, dict[str, Any]] = {}
+
+    # ------------------ Mantenimiento de índices ------------------
+    def _indexar(self, u: Usuario) -> None:
+        claves = {}
+        for nombre, (_, clave) in self.INDICES.items():
+            valor = clave(u)
+            self._indices[nombre].setdefault(valor, {})[u.email] = u
+            claves[nombre] = valor
+        self._claves[u.email] = claves
+
+    def _desindexar(self, email: str) -> None:
+        for nombre, valor in self._claves.pop(email).items():
+            cubo = self._indices[nombre][valor]
+            del cubo[email]
+            if not cubo:
+                del self._indices[nombre][valor]
+
+    def _al_cambiar(self, u: Usuario, campo: str, anterior: Any, nuevo: Any) -> None:
+        """Observador de Usuario (cambio ya aplicado; si lanza, Usuario lo revierte)."""
+        if campo == "email":
+            if nuevo in self._por_email:
+                raise ValueError(f"Ya existe usuario con email {nuevo}")
+            self._por_email[nuevo] = self._por_email.pop(anterior)
+            self._desindexar(anterior)
+            self._indexar(u)
+        elif any(campo_idx == campo for campo_idx, _ in self.INDICES.values()):
+            self._desindexar(u.email)
+            self._indexar(u)
+
+    def _vista(self) -> tuple[dict[str, Usuario], dict[str, dict[Any, dict[str, Usuario]]]]:
+        """Estado que ven las lecturas (la variante concurrente devuelve una instantánea)."""
+        return self._por_email, self._indices
 
+    # ------------------ API ------------------
     def agregar(self, u: Usuario):
         k = u.email
         if k in self._por_email:
             raise ValueError(f"Ya existe usuario con email {k}")
         self._por_email[k] = u
+        self._indexar(u)
+        u.suscribir(self._al_cambiar)
 
     def obtener_por_email(self, email: str) -> Optional[Usuario]:
-        return self._por_email.get(email.lower().strip())
+        return self._vista()[0].get(email.lower().strip())
 
     def listar_activos(self):
-        return [u for u in self._por_email.values() if u.activo]
+        return list(self._vista()[1]["activo"].get(True, {}).values())
 
     def eliminar(self, email: str):
-        self._por_email.pop(email.lower().strip(), None)
+        u = self._por_email.pop(email.lower().strip(), None)
+        if u is None:
+            return
+        self._desindexar(u.email)
+        u.desuscribir(self._al_cambiar)
 
-    def buscar(self, predicado: Callable[[Usuario], bool]):
-        return [u for u in self._por_email.values() if predicado(u)]
\ No newline at end of file
+    def buscar(self, predicado: Optional[Callable[[Usuario], bool]] = None, **filtros: Any):
+        """
+        buscar(rol="admin", activo=True, dominio="corp.com", predicado=...)
+        Los filtros sobre índices (rol, activo, dominio) se resuelven empezando por el
+        cubo más pequeño; el resto de filtros (igualdad de atributo) y el predicado
+        se comprueban solo sobre esos candidatos.
+        """
+        por_email, indices = self._vista()
+        filtros = {k: self._NORMALIZAR.get(k, lambda v: v)(v) for k, v in filtros.items()}
+        if "email" in filtros:
+            u = por_email.get(filtros.pop("email"))
+            candidatos = {u.email: u} if u is not None else {}
+        else:
+            candidatos = None
+        cubos = sorted(
+            (indices[k].get(filtros.pop(k), {}) for k in list(filtros) if k in indices),
+            key=len,
+        )
+        if candidatos is None:
+            candidatos = cubos.pop(0) if cubos else por_email
+        resultado = []
+        for email, u in candidatos.items():
+            if all(email in c for c in cubos) \
+                    and all(getattr(u, k, None) == v for k, v in filtros.items()) \
+                    and (predicado is None or predicado(u)):
+                resultado.append(u)
+        return resultado
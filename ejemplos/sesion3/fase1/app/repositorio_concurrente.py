@@ -0,0 +1,189 @@
+"""
+RepositorioUsuarios seguro para hilos y asyncio, pensado para muchas lecturas y pocas escrituras.
+
+- Escrituras (agregar, eliminar, cambios de propiedades de los Usuario, lotes)
+  serializadas con un lock; al terminar se publica una instantánea nueva.
+- Lecturas (obtener_por_email, listar_activos, buscar) sin lock: leen la última
+  instantánea publicada (una asignación de atributo, atómica), que nadie modifica.
+  Nunca ven un estado a medias ni "dictionary changed size during iteration".
+- Copia en escritura por fragmentos: el dict por email y cada cubo de índice de
+  la instantánea están repartidos en 64 fragmentos; publicar solo copia los
+  fragmentos que la transacción ha tocado y comparte el resto con la anterior.
+  Para muchas altas, mejor upsert_lote (una sola publicación).
+"""
+from __future__ import annotations
+
+import asyncio
+from itertools import chain
+import threading
+from typing import Any, Callable, Iterable, Optional
+
+from .modelos import Usuario
+from .repositorio import RepositorioUsuarios
+
+_FRAGMENTOS = 64
+
+
+class _Fragmentado:
+    """
+    Dict email -> Usuario de solo lectura, repartido en fragmentos. Publicar una
+    versión nueva solo copia los fragmentos que cambian; el resto se comparte.
+    """
+    __slots__ = ("partes", "_n")
+
+    def __init__(self, partes: tuple[dict[str, Usuario], ...]):
+        self.partes = partes
+        self._n = sum(map(len, partes))
+
+    def get(self, email: str, default: Any = None) -> Any:
+        return self.partes[hash(email) % _FRAGMENTOS].get(email, default)
+
+    def __contains__(self, email: str) -> bool:
+        return email in self.partes[hash(email) % _FRAGMENTOS]
+
+    def __len__(self) -> int:
+        return self._n
+
+    def items(self):
+        return chain.from_iterable(p.items() for p in self.partes)
+
+    def values(self):
+        return chain.from_iterable(p.values() for p in self.partes)
+
+    def con_cambios(self, actual: dict[str, Usuario], emails: Iterable[str]) -> "_Fragmentado":
+        """Nueva versión en la que `emails` toman el valor que tienen en `actual` (o desaparecen)."""
+        partes = list(self.partes)
+        copiados = set()
+        for email in emails:
+            i = hash(email) % _FRAGMENTOS
+            if i not in copiados:
+                partes[i] = dict(partes[i])
+                copiados.add(i)
+            u = actual.get(email)
+            if u is None:
+                partes[i].pop(email, None)
+            else:
+                partes[i][email] = u
+        return _Fragmentado(tuple(partes))
+
+
+_VACIO = _Fragmentado(tuple({} for _ in range(_FRAGMENTOS)))
+
+Instantanea = tuple[_Fragmentado, dict[str, dict[Any, _Fragmentado]]]
+
+
+class RepositorioUsuariosConcurrente(RepositorioUsuarios):
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.RLock()
+        self._instantanea: Instantanea = (_VACIO, {n: {} for n in self.INDICES})
+        # Transacción en curso: emails tocados, en el dict por email y por cubo (índice, valor)
+        self._tocados: set[str] = set()
+        self._tocados_cubo: dict[tuple[str, Any], set[str]] = {}
+
+    def _anotar(self, email: str) -> None:
+        self._tocados.add(email)
+        for clave in self._claves.get(email, {}).items():
+            self._tocados_cubo.setdefault(clave, set()).add(email)
+
+    def _indexar(self, u: Usuario) -> None:
+        super()._indexar(u)
+        self._anotar(u.email)
+
+    def _desindexar(self, email: str) -> None:
+        self._anotar(email)
+        super()._desindexar(email)
+
+    def _publicar(self) -> None:
+        por_email, indices = self._instantanea
+        indices = {n: dict(idx) for n, idx in indices.items()}
+        for (nombre, valor), emails in self._tocados_cubo.items():
+            nuevo = indices[nombre].get(valor, _VACIO).con_cambios(self._indices[nombre].get(valor, {}), emails)
+            if nuevo:
+                indices[nombre][valor] = nuevo
+            else:
+                indices[nombre].pop(valor, None)
+        self._instantanea = (por_email.con_cambios(self._por_email, self._tocados), indices)
+        self._tocados.clear()
+        self._tocados_cubo.clear()
+
+    def _vista(self) -> Instantanea:
+        return self._instantanea
+
+    # ------------------ Escrituras ------------------
+    def _al_cambiar(self, u: Usuario, campo: str, anterior: Any, nuevo: Any) -> None:
+        with self._lock:
+            super()._al_cambiar(u, campo, anterior, nuevo)
+            self._publicar()
+
+    def agregar(self, u: Usuario):
+        with self._lock:
+            super().agregar(u)
+            self._publicar()
+
+    def eliminar(self, email: str):
+        with self._lock:
+            super().eliminar(email)
+            self._publicar()
+
+    def agregar_si_no_existe(self, u: Usuario) -> Usuario:
+        """Alta atómica: devuelve el usuario ya guardado con ese email o `u` si se ha añadido."""
+        with self._lock:
+            existente = self._por_email.get(u.email)
+            if existente is not None:
+                return existente
+            super().agregar(u)
+            self._publicar()
+            return u
+
+    def upsert_lote(self, usuarios: Iterable[Usuario]) -> tuple[int, int]:
+        """
+        Altas y sustituciones (por email) en una sola transacción y una sola
+        publicación. Devuelve (altas, sustituidos).
+        """
+        altas = sustituidos = 0
+        with self._lock:
+            for u in usuarios:
+                previo = self._por_email.get(u.email)
+                if previo is u:
+                    continue
+                if previo is not None:
+                    super().eliminar(u.email)
+                    sustituidos += 1
+                else:
+                    altas += 1
+                super().agregar(u)
+            self._publicar()
+        return altas, sustituidos
+
+
+class RepositorioUsuariosAsync:
+    """
+    Fachada asyncio. Las búsquedas por email son O(1) y sin lock: se hacen en el
+    propio bucle. Las que pueden recorrer muchos usuarios y las escrituras (que
+    pueden esperar al lock) van a un hilo con asyncio.to_thread.
+    """
+
+    def __init__(self, repo: Optional[RepositorioUsuariosConcurrente] = None):
+        self.repo = repo or RepositorioUsuariosConcurrente()
+
+    async def obtener_por_email(self, email: str) -> Optional[Usuario]:
+        return self.repo.obtener_por_email(email)
+
+    async def listar_activos(self) -> list[Usuario]:
+        return await asyncio.to_thread(self.repo.listar_activos)
+
+    async def buscar(self, predicado: Optional[Callable[[Usuario], bool]] = None, **filtros: Any) -> list[Usuario]:
+        return await asyncio.to_thread(self.repo.buscar, predicado, **filtros)
+
+    async def agregar(self, u: Usuario) -> None:
+        await asyncio.to_thread(self.repo.agregar, u)
+
+    async def agregar_si_no_existe(self, u: Usuario) -> Usuario:
+        return await asyncio.to_thread(self.repo.agregar_si_no_existe, u)
+
+    async def upsert_lote(self, usuarios: Iterable[Usuario]) -> tuple[int, int]:
+        return await asyncio.to_thread(self.repo.upsert_lote, list(usuarios))
+
+    async def eliminar(self, email: str) -> None:
+        await asyncio.to_thread(self.repo.eliminar, email)
@@ -0,0 +1,429 @@
+"""
+RepositorioUsuarios persistente en disco local (misma API que repositorio.py).
+
+Dos ficheros:
+  <ruta>.log  registro append-only (fuente de verdad):
+              cabecera 16 B = magic + generación, y después registros
+              [crc32 u32][len u32][tipo u8][len_email u16][email][json]
+              tipo 1 = alta/actualización, tipo 2 = baja, tipo 3 = cambio de
+              email (tras el email nuevo va [len_email u16][email anterior]):
+              baja del anterior y alta del nuevo en un solo registro.
+  <ruta>.idx  tabla hash de direccionamiento abierto, mapeada con mmap:
+              cabecera 64 B + huecos de 16 B (hash64(email), offset en el log).
+
+- Arranque O(1): si el índice se cerró limpio y es de la misma generación que el
+  log, solo se mapea (y se reaplica la cola del log que no cubra). Tras una caída
+  se reconstruye desde el log, descartando un último registro a medio escribir
+  (el crc no cuadra). Un registro dañado que no es el último es corrupción: se
+  lanza ValueError en vez de tirar todo lo que viene detrás.
+- Búsqueda por email sin copiar el log: se sondea el índice y se compara el email
+  directamente sobre el mmap del log; solo se decodifica el JSON del acierto.
+- Escrituras: se añade al log (fsync opcional) y después se actualiza el índice.
+- compactar(): reescribe solo los registros vivos en ficheros temporales y los
+  sustituye con os.replace (atómico); la generación nueva invalida un índice viejo.
+
+Un solo proceso escritor por ruta. listar_activos/buscar recorren los registros
+vivos (no hay índices secundarios en disco).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from .modelos import Admin, Invitado, Usuario
+from .repositorio import RepositorioUsuarios, dominio
+
+_MAGIC_LOG = b"USRLOG1\0"
+_MAGIC_IDX = b"USRIDX1\0"
+_CAB_LOG = struct.Struct("<8s8s")               # magic, generación
+_CAB_IDX = struct.Struct("<8s8sQQQQB")          # magic, generación, capacidad, usados, lápidas, log_fin, limpio
+_TAM_CAB_IDX = 64
+_REG = struct.Struct("<IIB")                    # crc32, len(payload), tipo
+_LEN_EMAIL = struct.Struct("<H")
+_HUECO = struct.Struct("<QQ")                   # hash, offset
+
+ALTA, BAJA, RENOMBRE = 1, 2, 3
+_VACIO, _LAPIDA = 0, 1                          # offsets reservados (el log empieza en 16)
+_CARGA_MAX = 0.7
+
+_CLASES: dict[str, type] = {"Usuario": Usuario, "Admin": Admin, "Invitado": Invitado}
+
+
+def _hash(email: bytes) -> int:
+    # hash() de Python cambia entre procesos: el índice necesita uno estable
+    return int.from_bytes(hashlib.blake2b(email, digest_size=8).digest(), "little")
+
+
+def _fsync_dir(path: Path) -> None:
+    fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class RepositorioUsuariosDisco:
+    def __init__(self, ruta: str | os.PathLike, *, fsync: bool = True, capacidad_inicial: int = 1024):
+        ruta = Path(ruta)
+        self._ruta_log = ruta.with_name(ruta.name + ".log")
+        self._ruta_idx = ruta.with_name(ruta.name + ".idx")
+        self._fsync = fsync
+        self._capacidad_inicial = max(8, 1 << (capacidad_inicial - 1).bit_length())
+        self._log_map: Optional[mmap.mmap] = None
+        self._abrir_log()
+        self._abrir_indice()
+
+    # ------------------ Log ------------------
+    def _abrir_log(self) -> None:
+        if not self._ruta_log.exists():
+            self._crear_log(self._ruta_log, os.urandom(8))
+        self._f = open(self._ruta_log, "r+b")
+        magic, self._generacion = _CAB_LOG.unpack(self._f.read(_CAB_LOG.size))
+        if magic != _MAGIC_LOG:
+            raise ValueError(f"{self._ruta_log} no es un log de usuarios")
+        self._fin = self._f.seek(0, os.SEEK_END)
+
+    def _crear_log(self, path: Path, generacion: bytes) -> None:
+        with open(path, "wb") as f:
+            f.write(_CAB_LOG.pack(_MAGIC_LOG, generacion))
+            f.flush()
+            os.fsync(f.fileno())
+        _fsync_dir(path)
+
+    def _vista_log(self, hasta: int) -> mmap.mmap:
+        """mmap de solo lectura del log que cubra al menos hasta `hasta` (se rehace al crecer)."""
+        if self._log_map is None or len(self._log_map) < hasta:
+            if self._log_map is not None:
+                self._log_map.close()
+            self._log_map = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._log_map
+
+    def _registros(self, desde: int) -> Iterator[tuple[int, int, bytes, Optional[bytes]]]:
+        """(offset, tipo, email, email anterior|None) de cada registro íntegro a partir de `desde`."""
+        vista = self._vista_log(self._fin)
+        pos = desde
+        while pos + _REG.size <= self._fin:
+            crc, n, tipo = _REG.unpack_from(vista, pos)
+            fin = pos + _REG.size + n
+            if fin > self._fin:
+                break                              # cola a medio escribir
+            if zlib.crc32(vista[pos + 4:fin]) != crc:
+                if fin == self._fin:
+                    break                          # último registro: escritura interrumpida
+                raise ValueError(f"{self._ruta_log}: registro corrupto en el offset {pos} "
+                                 f"(quedan {self._fin - fin} bytes detrás)")
+            (le,) = _LEN_EMAIL.unpack_from(vista, pos + _REG.size)
+            ini = pos + _REG.size + _LEN_EMAIL.size
+            anterior = None
+            if tipo == RENOMBRE:
+                (la,) = _LEN_EMAIL.unpack_from(vista, ini + le)
+                anterior = bytes(vista[ini + le + _LEN_EMAIL.size:ini + le + _LEN_EMAIL.size + la])
+            yield pos, tipo, vista[ini:ini + le], anterior
+            pos = fin
+        self._truncar(pos)
+
+    def _truncar(self, pos: int) -> None:
+        """Descarta una cola incompleta (escritura interrumpida)."""
+        if pos < self._fin:
+            if self._log_map is not None:
+                self._log_map.close()
+                self._log_map = None
+            self._f.truncate(pos)
+            self._fin = pos
+
+    def _anadir(self, tipo: int, email: str, cuerpo: bytes = b"", anterior: Optional[str] = None) -> int:
+        e = email.encode()
+        payload = _LEN_EMAIL.pack(len(e)) + e
+        if anterior is not None:
+            a = anterior.encode()
+            payload += _LEN_EMAIL.pack(len(a)) + a
+        payload += cuerpo
+        sin_crc = _REG.pack(0, len(payload), tipo)[4:] + payload
+        registro = struct.pack("<I", zlib.crc32(sin_crc)) + sin_crc
+        offset = self._fin
+        self._f.seek(offset)
+        self._f.write(registro)
+        self._f.flush()
+        if self._fsync:
+            os.fsync(self._f.fileno())
+        self._fin += len(registro)
+        return offset
+
+    def _leer(self, offset: int) -> Usuario:
+        vista = self._vista_log(offset + _REG.size)
+        _, n, tipo = _REG.unpack_from(vista, offset)
+        vista = self._vista_log(offset + _REG.size + n)
+        (le,) = _LEN_EMAIL.unpack_from(vista, offset + _REG.size)
+        ini = offset + _REG.size + _LEN_EMAIL.size + le
+        if tipo == RENOMBRE:
+            (la,) = _LEN_EMAIL.unpack_from(vista, ini)
+            ini += _LEN_EMAIL.size + la
+        datos = json.loads(vista[ini:offset + _REG.size + n])
+        cls = _CLASES.get(datos.get("clase", "Usuario"), Usuario)
+        # Sin __init__: ya se validó al guardar, y no es un usuario nuevo (Usuario.contador)
+        u = cls.__new__(cls)
+        vars(u).update(_observadores=[self._al_cambiar], nombre=datos["nombre"], _email=datos["email"],
+                       _rol=datos["rol"], _activo=datos["activo"],
+                       _Usuario__password_hash=datos.get("password_hash"))
+        return u
+
+    @staticmethod
+    def _serializar(u: Usuario) -> bytes:
+        return json.dumps({
+            "clase": type(u).__name__,
+            "nombre": u.nombre,
+            "email": u.email,
+            "rol": u.rol,
+            "activo": u.activo,
+            "password_hash": getattr(u, "_Usuario__password_hash", None),
+        }, ensure_ascii=False).encode()
+
+    # ------------------ Índice hash (mmap) ------------------
+    def _abrir_indice(self) -> None:
+        self._idx_f = None
+        cab = None
+        if self._ruta_idx.exists() and self._ruta_idx.stat().st_size >= _TAM_CAB_IDX:
+            with open(self._ruta_idx, "rb") as f:
+                cab = _CAB_IDX.unpack(f.read(_CAB_IDX.size))
+        if (cab is not None and cab[0] == _MAGIC_IDX and cab[1] == self._generacion
+                and cab[6] == 1 and cab[5] <= self._fin):
+            self._mapear_indice()
+            for offset, tipo, email, anterior in self._registros(self._log_fin):
+                self._aplicar(tipo, bytes(email), offset, anterior)
+        else:
+            self._reconstruir_indice()
+        self._limpio = 0   # abierto para escritura: si no se cierra bien, se reconstruirá
+        self._guardar_cabecera()
+        self._idx_map.flush()
+
+    def _mapear_indice(self) -> None:
+        if self._idx_f is not None:
+            self._idx_map.close()
+            self._idx_f.close()
+        self._idx_f = open(self._ruta_idx, "r+b")
+        self._idx_map = mmap.mmap(self._idx_f.fileno(), 0)
+        (_, _, self._capacidad, self._usados, self._lapidas,
+         self._log_fin, self._limpio) = _CAB_IDX.unpack_from(self._idx_map, 0)
+
+    def _guardar_cabecera(self) -> None:
+        _CAB_IDX.pack_into(self._idx_map, 0, _MAGIC_IDX, self._generacion, self._capacidad,
+                           self._usados, self._lapidas, self._log_fin, self._limpio)
+
+    def _escribir_indice(self, path: Path, entradas: Iterator[tuple[int, int]], capacidad: int,
+                         generacion: bytes) -> None:
+        """Crea un índice nuevo con las (hash, offset) dadas y lo sustituye atómicamente."""
+        tmp = path.with_name(path.name + ".tmp")
+        tabla = bytearray(_TAM_CAB_IDX + capacidad * _HUECO.size)
+        mascara = capacidad - 1
+        usados = 0
+        for h, offset in entradas:
+            i = h & mascara
+            while _HUECO.unpack_from(tabla, _TAM_CAB_IDX + i * _HUECO.size)[1] != _VACIO:
+                i = (i + 1) & mascara
+            _HUECO.pack_into(tabla, _TAM_CAB_IDX + i * _HUECO.size, h, offset)
+            usados += 1
+        _CAB_IDX.pack_into(tabla, 0, _MAGIC_IDX, generacion, capacidad, usados, 0, self._fin, 0)
+        with open(tmp, "wb") as f:
+            f.write(tabla)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        _fsync_dir(path)
+
+    def _reconstruir_indice(self) -> None:
+        vivos: dict[bytes, int] = {}
+        for offset, tipo, email, anterior in self._registros(_CAB_LOG.size):
+            if tipo == RENOMBRE:
+                vivos.pop(anterior, None)
+            if tipo == BAJA:
+                vivos.pop(bytes(email), None)
+            else:
+                vivos[bytes(email)] = offset
+        capacidad = self._capacidad_para(len(vivos))
+        self._escribir_indice(self._ruta_idx, ((_hash(e), o) for e, o in vivos.items()),
+                              capacidad, self._generacion)
+        self._mapear_indice()
+
+    def _capacidad_para(self, n: int) -> int:
+        capacidad = self._capacidad_inicial
+        while n + 1 > capacidad * _CARGA_MAX:
+            capacidad *= 2
+        return capacidad
+
+    def _entradas(self) -> Iterator[tuple[int, int]]:
+        for i in range(self._capacidad):
+            h, offset = _HUECO.unpack_from(self._idx_map, _TAM_CAB_IDX + i * _HUECO.size)
+            if offset > _LAPIDA:
+                yield h, offset
+
+    def _sondear(self, email: bytes) -> tuple[int, int, Optional[int]]:
+        """(hash, hueco, offset|None): hueco del email o el primero libre para insertarlo."""
+        h = _hash(email)
+        mascara = self._capacidad - 1
+        i = h & mascara
+        libre = None
+        while True:
+            hh, offset = _HUECO.unpack_from(self._idx_map, _TAM_CAB_IDX + i * _HUECO.size)
+            if offset == _VACIO:
+                return h, (i if libre is None else libre), None
+            if offset == _LAPIDA:
+                if libre is None:
+                    libre = i
+            elif hh == h and self._email_en(offset) == email:
+                return h, i, offset
+            i = (i + 1) & mascara
+
+    def _email_en(self, offset: int) -> bytes:
+        vista = self._vista_log(offset + _REG.size + _LEN_EMAIL.size)
+        (le,) = _LEN_EMAIL.unpack_from(vista, offset + _REG.size)
+        ini = offset + _REG.size + _LEN_EMAIL.size
+        return self._vista_log(ini + le)[ini:ini + le]
+
+    def _aplicar(self, tipo: int, email: bytes, offset: int, anterior: Optional[bytes] = None) -> None:
+        """Refleja en el índice un registro ya escrito en el log."""
+        if tipo == RENOMBRE:
+            self._aplicar(BAJA, anterior, offset)
+            tipo = ALTA
+        if tipo == ALTA and self._usados + self._lapidas + 1 > self._capacidad * _CARGA_MAX:
+            self._escribir_indice(self._ruta_idx, self._entradas(),
+                                  self._capacidad_para(self._usados + 1), self._generacion)
+            self._mapear_indice()
+        h, i, actual = self._sondear(email)
+        pos = _TAM_CAB_IDX + i * _HUECO.size
+        if tipo == ALTA:
+            if actual is None:
+                if _HUECO.unpack_from(self._idx_map, pos)[1] == _LAPIDA:
+                    self._lapidas -= 1
+                self._usados += 1
+            _HUECO.pack_into(self._idx_map, pos, h, offset)
+        elif actual is not None:
+            _HUECO.pack_into(self._idx_map, pos, h, _LAPIDA)
+            self._usados -= 1
+            self._lapidas += 1
+        self._log_fin = self._fin
+        self._guardar_cabecera()
+
+    def _offset(self, email: str) -> Optional[int]:
+        return self._sondear(email.lower().strip().encode())[2]
+
+    # ------------------ Observador de los Usuario devueltos ------------------
+    def _al_cambiar(self, u: Usuario, campo: str, anterior: Any, nuevo: Any) -> None:
+        """Persiste los cambios de propiedades (cambio ya aplicado; si lanza, Usuario lo revierte)."""
+        if self._offset(anterior if campo == "email" else u.email) is None:
+            return  # eliminado del repositorio después de entregarlo
+        if campo == "email":
+            if self._offset(nuevo) is not None:
+                raise ValueError(f"Ya existe usuario con email {nuevo}")
+            # Un solo registro: tras una caída no puede quedar solo la baja (ni solo el alta)
+            offset = self._anadir(RENOMBRE, nuevo, self._serializar(u), anterior)
+            self._aplicar(RENOMBRE, nuevo.encode(), offset, anterior.encode())
+            return
+        e = u.email
+        self._aplicar(ALTA, e.encode(), self._anadir(ALTA, e, self._serializar(u)))
+
+    # ------------------ API (como RepositorioUsuarios) ------------------
+    def agregar(self, u: Usuario):
+        k = u.email
+        if self._offset(k) is not None:
+            raise ValueError(f"Ya existe usuario con email {k}")
+        self._aplicar(ALTA, k.encode(), self._anadir(ALTA, k, self._serializar(u)))
+        u.suscribir(self._al_cambiar)
+
+    def guardar(self, u: Usuario) -> None:
+        """Reescribe u (p. ej. tras set_password, que no pasa por los setters)."""
+        e = u.email
+        self._aplicar(ALTA, e.encode(), self._anadir(ALTA, e, self._serializar(u)))
+
+    def obtener_por_email(self, email: str) -> Optional[Usuario]:
+        offset = self._offset(email)
+        return None if offset is None else self._leer(offset)
+
+    def __len__(self) -> int:
+        return self._usados
+
+    def __iter__(self) -> Iterator[Usuario]:
+        return (self._leer(offset) for _, offset in sorted(self._entradas(), key=lambda e: e[1]))
+
+    def listar_activos(self):
+        return [u for u in self if u.activo]
+
+    def eliminar(self, email: str):
+        k = email.lower().strip()
+        if self._offset(k) is not None:
+            self._aplicar(BAJA, k.encode(), self._anadir(BAJA, k))
+
+    def buscar(self, predicado: Optional[Callable[[Usuario], bool]] = None, **filtros: Any):
+        """Mismos filtros que RepositorioUsuarios.buscar, resueltos recorriendo los registros vivos."""
+        normalizar = RepositorioUsuarios._NORMALIZAR
+        filtros = {k: normalizar.get(k, lambda v: v)(v) for k, v in filtros.items()}
+        if "email" in filtros:
+            u = self.obtener_por_email(filtros.pop("email"))
+            candidatos: Iterator[Usuario] = iter([u] if u is not None else [])
+        else:
+            candidatos = iter(self)
+        esperado_dominio = filtros.pop("dominio", None)
+        return [
+            u for u in candidatos
+            if (esperado_dominio is None or dominio(u.email) == esperado_dominio)
+            and all(getattr(u, k, None) == v for k, v in filtros.items())
+            and (predicado is None or predicado(u))
+        ]
+
+    # ------------------ Mantenimiento ------------------
+    def compactar(self) -> None:
+        """Reescribe el log con los registros vivos (en orden de escritura) y rehace el índice."""
+        generacion = os.urandom(8)
+        tmp = self._ruta_log.with_name(self._ruta_log.name + ".tmp")
+        self._crear_log(tmp, generacion)
+        vista = self._vista_log(self._fin)
+        nuevas: list[tuple[int, int]] = []
+        with open(tmp, "ab") as f:
+            pos = _CAB_LOG.size
+            for h, offset in sorted(self._entradas(), key=lambda e: e[1]):
+                _, n, _ = _REG.unpack_from(vista, offset)
+                f.write(vista[offset:offset + _REG.size + n])   # copia tal cual, con su crc
+                nuevas.append((h, pos))
+                pos += _REG.size + n
+            f.flush()
+            os.fsync(f.fileno())
+        self._cerrar_ficheros()
+        # Si caemos entre los dos replace, el índice viejo no coincide en
+        # generación con el log nuevo y se reconstruye al abrir.
+        os.replace(tmp, self._ruta_log)
+        _fsync_dir(self._ruta_log)
+        self._abrir_log()
+        self._escribir_indice(self._ruta_idx, iter(nuevas), self._capacidad_para(len(nuevas)), generacion)
+        self._mapear_indice()
+        self._limpio = 0
+        self._guardar_cabecera()
+
+    def _cerrar_ficheros(self) -> None:
+        if self._log_map is not None:
+            self._log_map.close()
+            self._log_map = None
+        self._idx_map.close()
+        self._idx_f.close()
+        self._idx_f = None
+        self._f.close()
+
+    def cerrar(self) -> None:
+        """Marca el índice como limpio (el próximo arranque no lo reconstruye) y cierra."""
+        if self._f.closed:
+            return
+        self._limpio = 1
+        self._log_fin = self._fin
+        self._guardar_cabecera()
+        self._idx_map.flush()
+        self._cerrar_ficheros()
+
+    def __enter__(self) -> "RepositorioUsuariosDisco":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.cerrar()
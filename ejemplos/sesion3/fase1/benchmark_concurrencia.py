@@ -0,0 +1,95 @@
+# benchmark_concurrencia.py
+"""
+Throughput de lectura de RepositorioUsuarios bajo carga de escritura.
+
+N hilos lectores repiten "admins activos del dominio X" y búsquedas por email
+mientras un hilo escritor da altas/bajas y cambia roles. Se mide con y sin
+escritor, para el repositorio normal (sin locks: cuenta los errores por
+"dictionary changed size during iteration") y para el concurrente.
+
+Uso:
+    python benchmark_concurrencia.py --usuarios 50000 --lectores 4 --segundos 3
+"""
+import argparse
+import random
+import threading
+import time
+
+from app.modelos import Usuario
+from app.repositorio import RepositorioUsuarios
+from app.repositorio_concurrente import RepositorioUsuariosConcurrente
+
+ROLES = ("usuario", "admin", "invitado")
+
+
+def poblar(repo, n: int) -> None:
+    usuarios = (Usuario(f"n{i}", f"u{i}@d{i % 50}.com", ROLES[i % 3], i % 4 != 0) for i in range(n))
+    if hasattr(repo, "upsert_lote"):
+        repo.upsert_lote(usuarios)
+    else:
+        for u in usuarios:
+            repo.agregar(u)
+
+
+def lector(repo, n: int, parar: threading.Event, resultados: list) -> None:
+    rnd = random.Random()
+    lecturas = errores = 0
+    while not parar.is_set():
+        try:
+            repo.buscar(rol="admin", activo=True, dominio=f"d{rnd.randrange(50)}.com")
+            repo.obtener_por_email(f"u{rnd.randrange(n)}@d{rnd.randrange(50)}.com")
+            lecturas += 2
+        except RuntimeError:
+            errores += 1
+    resultados.append((lecturas, errores))
+
+
+def escritor(repo, n: int, parar: threading.Event, contador: list) -> None:
+    rnd = random.Random(1)
+    i = n
+    while not parar.is_set():
+        repo.agregar(Usuario(f"n{i}", f"u{i}@d{i % 50}.com", ROLES[i % 3]))
+        repo.eliminar(f"u{i - n}@d{(i - n) % 50}.com")
+        u = repo.obtener_por_email(f"u{rnd.randrange(i - n + 1, i)}@d0.com")
+        if u is not None:
+            u.rol = ROLES[rnd.randrange(3)]
+        i += 1
+        contador[0] += 1
+
+
+def medir(nombre: str, cls: type, n: int, lectores: int, segundos: float, con_escritor: bool) -> None:
+    repo = cls()
+    poblar(repo, n)
+    parar = threading.Event()
+    resultados: list = []
+    escrituras = [0]
+    hilos = [threading.Thread(target=lector, args=(repo, n, parar, resultados)) for _ in range(lectores)]
+    if con_escritor:
+        hilos.append(threading.Thread(target=escritor, args=(repo, n, parar, escrituras)))
+    for h in hilos:
+        h.start()
+    time.sleep(segundos)
+    parar.set()
+    for h in hilos:
+        h.join()
+    lecturas = sum(r[0] for r in resultados)
+    errores = sum(r[1] for r in resultados)
+    print(f"{nombre:<14} escritor={'sí' if con_escritor else 'no'}  "
+          f"{lecturas / segundos:>10,.0f} lecturas/s  {escrituras[0] / segundos:>8,.0f} escrituras/s  "
+          f"errores={errores}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--usuarios", type=int, default=50_000)
+    parser.add_argument("--lectores", type=int, default=4)
+    parser.add_argument("--segundos", type=float, default=3.0)
+    args = parser.parse_args()
+
+    for nombre, cls in (("normal", RepositorioUsuarios), ("concurrente", RepositorioUsuariosConcurrente)):
+        for con_escritor in (False, True):
+            medir(nombre, cls, args.usuarios, args.lectores, args.segundos, con_escritor)
+
+
+if __name__ == "__main__":
+    main()
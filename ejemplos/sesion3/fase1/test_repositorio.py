@@ -0,0 +1,49 @@
+import pytest
+
+from app.modelos import Usuario
+from app.repositorio import RepositorioUsuarios
+
+
+def test_observador_que_rechaza_deshace_a_los_anteriores():
+    ana = Usuario("Ana", "ana@corp.com")
+    a, b = RepositorioUsuarios(), RepositorioUsuarios()
+    a.agregar(ana)
+    b.agregar(ana)
+    b.agregar(Usuario("Otra", "otra@corp.com"))
+    with pytest.raises(ValueError):
+        ana.email = "otra@corp.com"        # a lo acepta, b lo rechaza
+    assert ana.email == "ana@corp.com"
+    assert a.obtener_por_email("ana@corp.com") is ana
+    assert a.obtener_por_email("otra@corp.com") is None
+    assert a.buscar(dominio="corp.com") == [ana]
+
+
+def test_observador_que_rechaza_deshace_indices():
+    ana = Usuario("Ana", "ana@corp.com")
+    repo = RepositorioUsuarios()
+    repo.agregar(ana)
+
+    def rechazar(u, campo, anterior, nuevo):
+        raise RuntimeError("no")
+
+    ana.suscribir(rechazar)
+    with pytest.raises(RuntimeError):
+        ana.desactivar()
+    assert ana.activo is True
+    assert repo.buscar(activo=True) == [ana]
+    assert repo.buscar(activo=False) == []
+
+
+@pytest.mark.parametrize("valor, esperado", [("false", False), ("0", False), ("no", False),
+                                             ("true", True), ("Sí", True), (0, False), (True, True)])
+def test_filtro_activo_desde_texto(valor, esperado):
+    repo = RepositorioUsuarios()
+    activo, inactivo = Usuario("A", "a@corp.com"), Usuario("B", "b@corp.com", activo=False)
+    repo.agregar(activo)
+    repo.agregar(inactivo)
+    assert repo.buscar(activo=valor) == [activo if esperado else inactivo]
+
+
+def test_filtro_activo_texto_invalido():
+    with pytest.raises(ValueError):
+        RepositorioUsuarios().buscar(activo="quizas")
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+
+from app.modelos import Usuario
+from app.repositorio_concurrente import RepositorioUsuariosAsync, RepositorioUsuariosConcurrente
+
+
+def _usuarios(n, dominio="corp.com"):
+    return [Usuario(f"U{i}", f"u{i}@{dominio}", "admin" if i % 10 == 0 else "usuario") for i in range(n)]
+
+
+def test_mismos_resultados_que_el_repositorio_base():
+    repo = RepositorioUsuariosConcurrente()
+    for u in _usuarios(100):
+        repo.agregar(u)
+    repo.eliminar("u0@corp.com")
+    repo.obtener_por_email("u10@corp.com").desactivar()
+    repo.obtener_por_email("u20@corp.com").email = "u20@otra.com"
+    assert len(repo.buscar(rol="admin")) == 9
+    assert len(repo.buscar(rol="admin", activo=True)) == 8
+    assert [u.email for u in repo.buscar(dominio="otra.com")] == ["u20@otra.com"]
+    assert repo.obtener_por_email("u20@corp.com") is None
+    assert len(repo.listar_activos()) == 98
+
+
+def test_instantanea_publicada_no_cambia():
+    repo = RepositorioUsuariosConcurrente()
+    repo.agregar(Usuario("Ana", "ana@corp.com"))
+    por_email, indices = repo._vista()
+    repo.agregar(Usuario("Bob", "bob@corp.com"))
+    repo.eliminar("ana@corp.com")
+    assert len(por_email) == 1 and "ana@corp.com" in por_email
+    assert len(indices["rol"]["usuario"]) == 1
+    assert [u.email for u in repo.buscar(rol="usuario")] == ["bob@corp.com"]
+
+
+def test_lecturas_sin_lock_mientras_se_escribe():
+    repo = RepositorioUsuariosConcurrente()
+    repo.upsert_lote(_usuarios(200))
+    errores, parar = [], threading.Event()
+
+    def leer():
+        try:
+            while not parar.is_set():
+                for u in repo.buscar(rol="usuario", activo=True):
+                    assert u.rol == "usuario"
+                repo.listar_activos()
+        except Exception as exc:       # "dictionary changed size during iteration"...
+            errores.append(exc)
+
+    lectores = [threading.Thread(target=leer) for _ in range(3)]
+    for t in lectores:
+        t.start()
+    for i in range(300):
+        repo.agregar(Usuario(f"N{i}", f"n{i}@corp.com"))
+        repo.obtener_por_email(f"u{i % 200}@corp.com").activo = bool(i % 2)
+    parar.set()
+    for t in lectores:
+        t.join()
+    assert errores == [] and len(repo.buscar()) == 500
+
+
+def test_upsert_lote_y_alta_atomica():
+    repo = RepositorioUsuariosConcurrente()
+    assert repo.upsert_lote(_usuarios(5)) == (5, 0)
+    nuevos = _usuarios(7)
+    assert repo.upsert_lote(nuevos) == (2, 5)
+    assert repo.obtener_por_email("u0@corp.com") is nuevos[0]
+
+    candidatos = [Usuario("Eva", "eva@corp.com") for _ in range(8)]
+    ganadores = []
+    hilos = [threading.Thread(target=lambda u=u: ganadores.append(repo.agregar_si_no_existe(u)))
+             for u in candidatos]
+    for t in hilos:
+        t.start()
+    for t in hilos:
+        t.join()
+    assert len({id(u) for u in ganadores}) == 1
+
+
+def test_fachada_async():
+    async def main():
+        repo = RepositorioUsuariosAsync()
+        await repo.upsert_lote(_usuarios(20))
+        await repo.agregar(Usuario("Ana", "ana@corp.com", "admin"))
+        await repo.eliminar("u1@corp.com")
+        return (await repo.obtener_por_email("ana@corp.com"), len(await repo.buscar(rol="admin")),
+                len(await repo.listar_activos()))
+
+    ana, admins, activos = asyncio.run(main())
+    assert ana.nombre == "Ana" and admins == 3 and activos == 20
@@ -0,0 +1,79 @@
+import pytest
+
+from app.modelos import Usuario
+from app.repositorio_disco import RepositorioUsuariosDisco
+
+
+def test_password_se_persiste_hasheada(tmp_path):
+    ruta = tmp_path / "usuarios"
+    u = Usuario("Ana", "ana@corp.com")
+    u.set_password("Secreta-1")
+    with RepositorioUsuariosDisco(ruta, fsync=False) as repo:
+        repo.agregar(u)
+    assert b"Secreta-1" not in (tmp_path / "usuarios.log").read_bytes()
+    with RepositorioUsuariosDisco(ruta, fsync=False) as repo:
+        assert repo.obtener_por_email("ana@corp.com").check_password("Secreta-1")
+
+
+def _repo_con(ruta, *usuarios):
+    repo = RepositorioUsuariosDisco(ruta, fsync=False)
+    for u in usuarios:
+        repo.agregar(u)
+    return repo
+
+
+def test_leer_no_cuenta_usuarios_nuevos(tmp_path):
+    with _repo_con(tmp_path / "usuarios", Usuario("Ana", "ana@corp.com")) as repo:
+        antes = Usuario.contador
+        u = repo.obtener_por_email("ana@corp.com")
+        list(repo)
+        assert Usuario.contador == antes
+        assert (u.nombre, u.email, u.rol, u.activo) == ("Ana", "ana@corp.com", "usuario", True)
+
+
+def test_cambio_de_email_es_un_solo_registro(tmp_path):
+    ruta = tmp_path / "usuarios"
+    with _repo_con(ruta, Usuario("Ana", "ana@corp.com")) as repo:
+        log = tmp_path / "usuarios.log"
+        tam = log.stat().st_size
+        u = repo.obtener_por_email("ana@corp.com")
+        u.email = "ana@nueva.com"
+        assert len(repo) == 1
+        assert repo.obtener_por_email("ana@corp.com") is None
+        assert repo.obtener_por_email("ana@nueva.com").nombre == "Ana"
+        # se persisten los cambios posteriores del usuario renombrado
+        repo.obtener_por_email("ana@nueva.com").desactivar()
+        datos = log.read_bytes()[tam:]
+    # un registro de cambio de email + el alta de desactivar(); ninguna baja suelta
+    assert datos.count(b"ana@corp.com") == 1
+    (tmp_path / "usuarios.idx").unlink()          # reconstruir desde el log
+    with RepositorioUsuariosDisco(ruta, fsync=False) as repo:
+        assert repo.obtener_por_email("ana@corp.com") is None
+        assert repo.obtener_por_email("ana@nueva.com").activo is False
+        repo.compactar()
+        assert [u.email for u in repo] == ["ana@nueva.com"]
+
+
+def test_cola_a_medio_escribir_se_descarta(tmp_path):
+    ruta = tmp_path / "usuarios"
+    with _repo_con(ruta, Usuario("Ana", "ana@corp.com"), Usuario("Luis", "luis@corp.com")):
+        pass
+    log = tmp_path / "usuarios.log"
+    log.write_bytes(log.read_bytes()[:-3])
+    (tmp_path / "usuarios.idx").unlink()
+    with RepositorioUsuariosDisco(ruta, fsync=False) as repo:
+        assert [u.email for u in repo] == ["ana@corp.com"]
+
+
+def test_registro_corrupto_en_medio_se_informa(tmp_path):
+    ruta = tmp_path / "usuarios"
+    with _repo_con(ruta, Usuario("Ana", "ana@corp.com"), Usuario("Luis", "luis@corp.com")):
+        pass
+    log = tmp_path / "usuarios.log"
+    datos = bytearray(log.read_bytes())
+    datos[datos.index(b"ana@corp.com")] ^= 0xFF
+    log.write_bytes(datos)
+    (tmp_path / "usuarios.idx").unlink()
+    with pytest.raises(ValueError, match="corrupto"):
+        RepositorioUsuariosDisco(ruta, fsync=False)
+    assert log.read_bytes() == datos              # no se ha truncado nada
@@ -0,0 +1,209 @@
+# app/compacto.py
+"""
+Representaciones compactas de Usuario para poblaciones grandes (millones).
+
+- UsuarioCompacto: misma API que Usuario pero con __slots__ (sin __dict__ por
+  instancia) y el rol internado (todas las instancias comparten el mismo str).
+- UsuarioTable: "struct of arrays". Un objeto para toda la población:
+    nombres/emails -> listas de str
+    rol            -> array('B') con el índice en ROLES
+    activo         -> bytearray usado como campo de bits (1 bit por usuario)
+    password       -> dict disperso índice -> hash (la mayoría no tiene)
+  t[i] devuelve una vista (FilaUsuario) con las mismas propiedades validadas.
+
+La validación es la misma en los tres (normalizar_email / normalizar_rol).
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List
+
+from .modelos import Usuario, normalizar_email, normalizar_rol
+from .passwords import hashear, verificar_y_actualizar
+
+ROLES = ("usuario", "admin", "invitado")
+_CODIGO_ROL = {rol: i for i, rol in enumerate(ROLES)}
+
+
+class UsuarioCompacto:
+    contador = 0
+    ROLES_VALIDOS = Usuario.ROLES_VALIDOS
+    __slots__ = ("nombre", "_email", "_rol", "activo", "__password_hash")
+
+    def __init__(self, nombre: str, email: str, rol: str = "usuario", activo: bool = True):
+        self.nombre = nombre
+        self.email = email
+        self.rol = rol
+        self.activo = activo
+        self.__password_hash: str | None = None
+        UsuarioCompacto.contador += 1
+
+    presentarse = Usuario.presentarse
+    activar = Usuario.activar
+    desactivar = Usuario.desactivar
+    __str__ = Usuario.__str__
+    email = Usuario.email
+
+    def __repr__(self) -> str:
+        return (f"UsuarioCompacto(nombre={self.nombre!r}, email={self.email!r}, "
+                f"rol={self.rol!r}, activo={self.activo!r})")
+
+    @property
+    def rol(self) -> str:
+        return self._rol
+
+    @rol.setter
+    def rol(self, value: str) -> None:
+        v = normalizar_rol(value, self.ROLES_VALIDOS)
+        self._rol = ROLES[_CODIGO_ROL[v]] if v in _CODIGO_ROL else v  # str compartido
+
+    def set_password(self, p: str) -> None:
+        if not p or len(p) < 6:
+            raise ValueError("La contraseña debe tener al menos 6 caracteres")
+        self.__password_hash = hashear(p)
+
+    def check_password(self, p: str) -> bool:
+        ok, nuevo = verificar_y_actualizar(p, self.__password_hash)
+        if nuevo is not None:
+            self.__password_hash = nuevo
+        return ok
+
+    desde_dict = Usuario.__dict__["desde_dict"]
+
+
+class UsuarioTable:
+    """Tabla columnar de usuarios; los índices son estables (no hay borrado)."""
+    __slots__ = ("_nombres", "_emails", "_roles", "_activos", "_hashes")
+
+    def __init__(self):
+        self._nombres: List[str] = []
+        self._emails: List[str] = []
+        self._roles = array("B")
+        self._activos = bytearray()
+        self._hashes: Dict[int, str] = {}
+
+    # ------------------ Construcción ------------------
+    def agregar(self, nombre: str, email: str, rol: str = "usuario", activo: bool = True) -> int:
+        """Valida como Usuario y devuelve el índice de la nueva fila."""
+        email = normalizar_email(email)
+        codigo = _CODIGO_ROL[normalizar_rol(rol, _CODIGO_ROL)]
+        i = len(self._nombres)
+        if i % 8 == 0:
+            self._activos.append(0)
+        self._nombres.append(nombre)
+        self._emails.append(email)
+        self._roles.append(codigo)
+        self._set_activo(i, activo)
+        return i
+
+    @classmethod
+    def desde_dicts(cls, filas: Iterable[Dict[str, Any]]) -> "UsuarioTable":
+        t = cls()
+        for d in filas:
+            t.agregar(d.get("nombre", ""), d.get("email", ""), d.get("rol", "usuario"),
+                      bool(d.get("activo", True)))
+        return t
+
+    @classmethod
+    def desde_usuarios(cls, usuarios: Iterable[Any]) -> "UsuarioTable":
+        t = cls()
+        for u in usuarios:
+            t.agregar(u.nombre, u.email, u.rol, u.activo)
+        return t
+
+    # ------------------ Acceso ------------------
+    def __len__(self) -> int:
+        return len(self._nombres)
+
+    def _indice(self, i: int) -> int:
+        n = len(self._nombres)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("índice de usuario fuera de rango")
+        return i
+
+    def __getitem__(self, i: int) -> "FilaUsuario":
+        return FilaUsuario(self, self._indice(i))
+
+    def __iter__(self) -> Iterator["FilaUsuario"]:
+        return (FilaUsuario(self, i) for i in range(len(self)))
+
+    def _get_activo(self, i: int) -> bool:
+        return bool(self._activos[i >> 3] >> (i & 7) & 1)
+
+    def _set_activo(self, i: int, valor: bool) -> None:
+        if valor:
+            self._activos[i >> 3] |= 1 << (i & 7)
+        else:
+            self._activos[i >> 3] &= ~(1 << (i & 7)) & 0xFF
+
+    def contar_activos(self) -> int:
+        return int.from_bytes(self._activos, "little").bit_count()
+
+    def a_usuario(self, i: int) -> Usuario:
+        """Materializa la fila i como un Usuario normal (sin password)."""
+        f = self[i]
+        return Usuario(f.nombre, f.email, f.rol, f.activo)
+
+
+class FilaUsuario:
+    """Vista de una fila de UsuarioTable con la API de Usuario (las escrituras van a la tabla)."""
+    __slots__ = ("_t", "_i")
+    ROLES_VALIDOS = Usuario.ROLES_VALIDOS
+
+    def __init__(self, tabla: UsuarioTable, i: int):
+        self._t = tabla
+        self._i = i
+
+    presentarse = Usuario.presentarse
+    activar = Usuario.activar
+    desactivar = Usuario.desactivar
+    __str__ = Usuario.__str__
+
+    def __repr__(self) -> str:
+        return (f"FilaUsuario({self._i}, nombre={self.nombre!r}, email={self.email!r}, "
+                f"rol={self.rol!r}, activo={self.activo!r})")
+
+    @property
+    def nombre(self) -> str:
+        return self._t._nombres[self._i]
+
+    @nombre.setter
+    def nombre(self, value: str) -> None:
+        self._t._nombres[self._i] = value
+
+    @property
+    def email(self) -> str:
+        return self._t._emails[self._i]
+
+    @email.setter
+    def email(self, value: str) -> None:
+        self._t._emails[self._i] = normalizar_email(value)
+
+    @property
+    def rol(self) -> str:
+        return ROLES[self._t._roles[self._i]]
+
+    @rol.setter
+    def rol(self, value: str) -> None:
+        self._t._roles[self._i] = _CODIGO_ROL[normalizar_rol(value, _CODIGO_ROL)]
+
+    @property
+    def activo(self) -> bool:
+        return self._t._get_activo(self._i)
+
+    @activo.setter
+    def activo(self, value: bool) -> None:
+        self._t._set_activo(self._i, value)
+
+    def set_password(self, p: str) -> None:
+        if not p or len(p) < 6:
+            raise ValueError("La contraseña debe tener al menos 6 caracteres")
+        self._t._hashes[self._i] = hashear(p)
+
+    def check_password(self, p: str) -> bool:
+        ok, nuevo = verificar_y_actualizar(p, self._t._hashes.get(self._i))
+        if nuevo is not None:
+            self._t._hashes[self._i] = nuevo
+        return ok
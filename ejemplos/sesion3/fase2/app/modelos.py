@@ -1,6 +1,122 @@
 # app/modelos.py
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import os
+from typing import Any, Iterable, Iterator, NamedTuple, Optional
+
+from .passwords import hashear, verificar_y_actualizar
+
+
+# ------------------ Validación compartida (Usuario, UsuarioCompacto, UsuarioTable) ------------------
+def normalizar_email(value: str) -> str:
+    v = (value or "").strip().lower()
+    if "@" not in v or v.startswith("@") or v.endswith("@"):
+        raise ValueError(f"Email inválido: {value!r}")
+    return v
+
+
+def normalizar_rol(value: str, validos) -> str:
+    v = (value or "").strip().lower()
+    if v not in validos:
+        raise ValueError(f"Rol inválido: {value!r}. Válidos: {sorted(validos)}")
+    return v
+
+
+# ------------------ Carga masiva ------------------
+# (nombre, email, rol, activo) ya validados
+Fila = tuple[Any, str, str, bool]
+
+
+class ErrorFila(NamedTuple):
+    fila: int       # posición en la entrada (0-based)
+    mensaje: str    # mismo texto que el ValueError del setter
+
+
+class ResultadoCarga(NamedTuple):
+    usuarios: list
+    errores: list[ErrorFila]
+
+
+def _filas(registros: Any) -> Iterator[tuple[Any, Any, Any, Any]]:
+    """Dicts (como desde_dict) o un lote columnar {"nombre": [...], "email": [...], ...}."""
+    if isinstance(registros, Mapping):
+        n = len(registros["email"])
+
+        def col(nombre: str, defecto: Any):
+            valores = registros.get(nombre)
+            if valores is None:
+                return [defecto] * n
+            if len(valores) != n:
+                raise ValueError(f"Columna {nombre!r} con {len(valores)} valores; 'email' tiene {n}")
+            return valores
+
+        yield from zip(col("nombre", ""), registros["email"], col("rol", "usuario"), col("activo", True))
+    else:
+        for d in registros:
+            yield d.get("nombre", ""), d.get("email", ""), d.get("rol", "usuario"), d.get("activo", True)
+
+
+def _validar_bloque(filas: list, inicio: int, validos: frozenset) -> tuple[list[tuple[int, Fila]], list[ErrorFila]]:
+    """
+    Normaliza y valida un bloque sin lanzar. Los roles se repiten mucho: cada valor
+    distinto se valida una vez y se memoriza.
+    """
+    roles: dict[Any, Any] = {}
+    ok: list[tuple[int, Fila]] = []
+    errores: list[ErrorFila] = []
+    for i, (nombre, email, rol, activo) in enumerate(filas, inicio):
+        try:
+            e = normalizar_email(email)
+        except (ValueError, AttributeError):    # AttributeError: no es str
+            errores.append(ErrorFila(i, f"Email inválido: {email!r}"))
+            continue
+        try:
+            r = roles[rol]
+        except (KeyError, TypeError):
+            try:
+                r = normalizar_rol(rol, validos)
+            except (ValueError, AttributeError) as exc:
+                r = exc if isinstance(exc, ValueError) else ValueError(f"Rol inválido: {rol!r}")
+            try:
+                roles[rol] = r
+            except TypeError:
+                pass
+        if isinstance(r, ValueError):
+            errores.append(ErrorFila(i, str(r)))
+            continue
+        ok.append((i, (nombre, e, r, bool(activo))))
+    return ok, errores
+
+
+def _bloques(it: Iterable, tam: int) -> Iterator[tuple[int, list]]:
+    it = iter(it)
+    inicio = 0
+    while True:
+        bloque = list(islice(it, tam))
+        if not bloque:
+            return
+        yield inicio, bloque
+        inicio += len(bloque)
+
+
+def _validar_en_pool(bloques: Iterator[tuple[int, list]], validos: frozenset,
+                     procesos: Optional[int]) -> Iterator[tuple[list, list]]:
+    """Resultados en orden, con como mucho 2 bloques por proceso en vuelo (no se lee toda la entrada)."""
+    workers = procesos or os.cpu_count() or 1
+    en_vuelo: deque = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for inicio, bloque in bloques:
+            en_vuelo.append(pool.submit(_validar_bloque, bloque, inicio, validos))
+            if len(en_vuelo) >= 2 * workers:
+                yield en_vuelo.popleft().result()
+        while en_vuelo:
+            yield en_vuelo.popleft().result()
+
+
 class Usuario:
     contador = 0
     ROLES_VALIDOS = {"usuario", "admin", "invitado"}
@@ -40,10 +156,7 @@ class Usuario:
 
     @email.setter
     def email(self, value: str) -> None:
-        v = (value or "").strip().lower()
-        if "@" not in v or v.startswith("@") or v.endswith("@"):
-            raise ValueError(f"Email inválido: {value!r}")
-        self._email = v
+        self._email = normalizar_email(value)
 
     # ------------------ Rol (propiedad) ------------------
     @property
@@ -52,20 +165,20 @@ class Usuario:
 
     @rol.setter
     def rol(self, value: str) -> None:
-        v = (value or "").strip().lower()
-        if v not in self.ROLES_VALIDOS:
-            raise ValueError(f"Rol inválido: {value!r}. Válidos: {sorted(self.ROLES_VALIDOS)}")
-        self._rol = v
+        self._rol = normalizar_rol(value, self.ROLES_VALIDOS)
 
-    # ------------------ Password (privado simulado) ------------------
+    # ------------------ Password (KDF, ver passwords.py) ------------------
     def set_password(self, p: str) -> None:
         if not p or len(p) < 6:
             raise ValueError("La contraseña debe tener al menos 6 caracteres")
-        # Simulación: NO uses esto en producción
-        self.__password_hash = f"hash::{p}"
+        self.__password_hash = hashear(p)
 
     def check_password(self, p: str) -> bool:
-        return self.__password_hash == f"hash::{p}"
+        """Verifica en tiempo constante; si el hash es antiguo o de menor coste, lo rehace."""
+        ok, nuevo = verificar_y_actualizar(p, self.__password_hash)
+        if nuevo is not None:
+            self.__password_hash = nuevo
+        return ok
 
     # ------------------ Constructores alternativos ------------------
     @classmethod
@@ -78,4 +191,36 @@ class Usuario:
             email=datos.get("email", ""),
             rol=datos.get("rol", "usuario"),
             activo=bool(datos.get("activo", True)),
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def desde_registros(cls, registros: Iterable[dict] | Mapping[str, list], *,
+                        procesos: Optional[int] = 1, tam_bloque: int = 50_000) -> ResultadoCarga:
+        """
+        Versión masiva de desde_dict: valida por bloques y construye sin pasar por los
+        setters. No aborta en la primera fila mala: devuelve (usuarios, errores) con
+        los mensajes de los setters. procesos=None/>1 valida los bloques en un pool.
+        En un lote columnar todas las columnas deben tener la misma longitud (ValueError).
+        """
+        validos = frozenset(cls.ROLES_VALIDOS)
+        bloques = _bloques(_filas(registros), tam_bloque)
+        if procesos == 1:
+            resultados: Iterable = (_validar_bloque(b, ini, validos) for ini, b in bloques)
+        else:
+            resultados = _validar_en_pool(bloques, validos, procesos)
+        return cls._construir(resultados)
+
+    @classmethod
+    def _construir(cls, resultados: Iterable[tuple[list, list]]) -> ResultadoCarga:
+        usuarios, errores = [], []
+        nuevo = object.__new__
+        for ok, errs in resultados:
+            errores.extend(errs)
+            for _, (nombre, email, rol, activo) in ok:
+                u = nuevo(cls)
+                # mismo estado que deja __init__ (campos ya normalizados)
+                u.__dict__.update(nombre=nombre, _email=email, _rol=rol, activo=activo,
+                                  _Usuario__password_hash=None)
+                usuarios.append(u)
+        Usuario.contador += len(usuarios)
+        return ResultadoCarga(usuarios, errores)
\ No newline at end of file
@@ -0,0 +1,59 @@
+# benchmark_carga.py
+"""
+Importación de N registros de usuario: bucle con desde_dict vs Usuario.desde_registros
+(en este proceso y con un pool de procesos). El 1% de las filas son inválidas.
+
+Uso:
+    python benchmark_carga.py --filas 500000 --workers 4
+"""
+import argparse
+import time
+from typing import Dict, List
+
+from app.modelos import Usuario
+
+ROLES = ("usuario", "Admin", " invitado ")
+
+
+def generar_registros(n: int) -> List[Dict]:
+    return [
+        {"nombre": f"Usuario {i}",
+         "email": f"  U{i}@Empresa.com " if i % 100 else f"u{i}-sin-arroba",
+         "rol": ROLES[i % 3],
+         "activo": i % 5 != 0}
+        for i in range(n)
+    ]
+
+
+def bucle_desde_dict(registros: List[Dict]):
+    usuarios, errores = [], []
+    for i, d in enumerate(registros):
+        try:
+            usuarios.append(Usuario.desde_dict(d))
+        except ValueError as e:
+            errores.append((i, str(e)))
+    return usuarios, errores
+
+
+def medir(nombre: str, fn, n: int) -> None:
+    t0 = time.perf_counter()
+    usuarios, errores = fn()
+    dt = time.perf_counter() - t0
+    print(f"{nombre:<28} {dt:6.2f} s  {n / dt:>10,.0f} filas/s  ok={len(usuarios):,} errores={len(errores):,}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filas", type=int, default=500_000)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    registros = generar_registros(args.filas)
+    medir("desde_dict (bucle)", lambda: bucle_desde_dict(registros), args.filas)
+    medir("desde_registros", lambda: Usuario.desde_registros(registros), args.filas)
+    medir("desde_registros (procesos)",
+          lambda: Usuario.desde_registros(registros, procesos=args.workers), args.filas)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# benchmark_memoria.py
+"""
+Bytes por usuario: Usuario (con __dict__) vs UsuarioCompacto (__slots__) vs UsuarioTable (columnas).
+
+Se mide con tracemalloc todo lo que se reserva al cargar N usuarios (objetos,
+strings de nombre/email y contenedores).
+
+Uso:
+    python benchmark_memoria.py --usuarios 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable, List
+
+from app.compacto import UsuarioCompacto, UsuarioTable
+from app.modelos import Usuario
+
+ROLES = ("usuario", "admin", "invitado")
+
+
+def cargar_objetos(cls: type, n: int) -> List:
+    return [cls(f"Usuario {i}", f"u{i}@empresa.com", ROLES[i % 3], i % 5 != 0) for i in range(n)]
+
+
+def cargar_tabla(n: int) -> UsuarioTable:
+    t = UsuarioTable()
+    for i in range(n):
+        t.agregar(f"Usuario {i}", f"u{i}@empresa.com", ROLES[i % 3], i % 5 != 0)
+    return t
+
+
+def medir(nombre: str, cargar: Callable[[], object], n: int) -> None:
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    datos = cargar()
+    dt = time.perf_counter() - t0
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{nombre:<18} {actual / n:8.1f} B/usuario  {actual / 2**20:9.1f} MB  carga {dt:6.2f} s")
+    del datos
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--usuarios", type=int, default=1_000_000)
+    args = parser.parse_args()
+    n = args.usuarios
+
+    medir("Usuario", lambda: cargar_objetos(Usuario, n), n)
+    medir("UsuarioCompacto", lambda: cargar_objetos(UsuarioCompacto, n), n)
+    medir("UsuarioTable", lambda: cargar_tabla(n), n)
+
+
+if __name__ == "__main__":
+    main()
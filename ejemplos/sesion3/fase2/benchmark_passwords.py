@@ -0,0 +1,63 @@
+# benchmark_passwords.py
+"""
+Elegir el coste del KDF: latencia de verificar() por parámetros, con --concurrentes
+logins simultáneos (pool de hilos), y recomendación del coste más alto cuyo p99
+cabe en --presupuesto-ms.
+
+Uso:
+    python benchmark_passwords.py --presupuesto-ms 250 --concurrentes 8 --muestras 40
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+from app.passwords import Parametros, hashear, verificar
+
+CANDIDATOS = [Parametros("scrypt", ln, 8, 1) for ln in (12, 13, 14, 15, 16)] + [
+    Parametros("pbkdf2-sha256", i) for i in (100_000, 300_000, 600_000, 1_000_000)
+]
+
+
+def _percentil(valores: List[float], p: float) -> float:
+    orden = sorted(valores)
+    return orden[min(len(orden) - 1, int(p / 100 * len(orden)))]
+
+
+def medir(par: Parametros, muestras: int, concurrentes: int) -> Tuple[float, float]:
+    guardado = hashear("Contraseña-de-prueba-1", par)
+
+    def login(_):
+        t0 = time.perf_counter()
+        verificar("Contraseña-de-prueba-1", guardado)
+        return (time.perf_counter() - t0) * 1000
+
+    with ThreadPoolExecutor(max_workers=concurrentes) as pool:
+        lat = list(pool.map(login, range(muestras)))
+    return _percentil(lat, 50), _percentil(lat, 99)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--presupuesto-ms", type=float, default=250.0)
+    parser.add_argument("--concurrentes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--muestras", type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"{args.concurrentes} logins concurrentes, {args.muestras} muestras, presupuesto p99 {args.presupuesto_ms} ms")
+    mejor = {}
+    for par in CANDIDATOS:
+        p50, p99 = medir(par, args.muestras, args.concurrentes)
+        ok = p99 <= args.presupuesto_ms
+        print(f"  {par.algoritmo:<14} {par.codificar():<18} p50 {p50:8.1f} ms  p99 {p99:8.1f} ms  {'OK' if ok else '--'}")
+        if ok:
+            mejor[par.algoritmo] = par
+    for algoritmo, par in mejor.items():
+        print(f"Recomendado {algoritmo}: {par}")
+    if not mejor:
+        print("Ningún candidato cabe en el presupuesto: baja el coste o sube el presupuesto")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import pytest
+
+from app.compacto import UsuarioCompacto, UsuarioTable
+from app.modelos import Usuario
+
+FILAS = [
+    {"nombre": "Ana", "email": " ANA@corp.com ", "rol": "Admin"},
+    {"nombre": "Bob", "email": "bob@corp.com", "activo": False},
+    {"nombre": "Eva", "email": "eva@corp.com", "rol": "invitado"},
+]
+
+
+def test_compacto_igual_que_usuario_y_sin_dict():
+    for d in FILAS:
+        u, c = Usuario.desde_dict(d), UsuarioCompacto.desde_dict(d)
+        assert (c.nombre, c.email, c.rol, c.activo) == (u.nombre, u.email, u.rol, u.activo)
+        assert str(c) == str(u)
+    assert not hasattr(c, "__dict__")
+    assert UsuarioCompacto("A", "a@x.com", "ADMIN").rol is UsuarioCompacto("B", "b@x.com", "admin").rol
+
+
+def test_misma_validacion_en_los_tres():
+    for mal in ({"email": "sin-arroba"}, {"email": "a@x.com", "rol": "jefe"}):
+        errores = []
+        for crear in (Usuario.desde_dict, UsuarioCompacto.desde_dict, UsuarioTable.desde_dicts):
+            with pytest.raises(ValueError) as exc:
+                crear([mal] if crear == UsuarioTable.desde_dicts else mal)
+            errores.append(str(exc.value))
+        assert len(set(errores)) == 1, errores
+
+
+def test_tabla_filas_y_bits_de_activo():
+    t = UsuarioTable.desde_dicts(FILAS * 5)          # 15 filas: más de un byte de bits
+    assert len(t) == 15 and t.contar_activos() == 10
+    assert [f.email for f in t][:3] == ["ana@corp.com", "bob@corp.com", "eva@corp.com"]
+    t[-1].desactivar()
+    t[1].activar()
+    assert (t[14].activo, t[1].activo, t.contar_activos()) == (False, True, 10)
+    t[0].rol = "usuario"
+    assert t[0].rol == "usuario" and t.a_usuario(0).rol == "usuario"
+    with pytest.raises(IndexError):
+        t[15]
+
+
+def test_password_en_tabla_y_compacto():
+    t = UsuarioTable.desde_dicts(FILAS)
+    t[2].set_password("Secreta-1")
+    assert t[2].check_password("Secreta-1") and not t[0].check_password("Secreta-1")
+    c = UsuarioCompacto("Ana", "ana@corp.com")
+    c.set_password("Secreta-1")
+    assert c.check_password("Secreta-1") and not c.check_password("otra")
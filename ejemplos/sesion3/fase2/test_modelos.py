@@ -0,0 +1,34 @@
+import pytest
+
+from app.modelos import ErrorFila, Usuario
+
+
+def test_desde_registros_informa_filas_malas_con_el_mensaje_del_setter():
+    registros = [
+        {"nombre": "Ana", "email": " ANA@corp.com "},
+        {"nombre": "Bob", "email": "bob"},
+        {"nombre": "Eva", "email": "eva@corp.com", "rol": "jefe"},
+        {"nombre": "Num", "email": 5},
+    ]
+    usuarios, errores = Usuario.desde_registros(registros)
+    assert [u.email for u in usuarios] == ["ana@corp.com"]
+    for fila, mensaje in errores[:2]:
+        with pytest.raises(ValueError) as exc:
+            Usuario.desde_dict(registros[fila])
+        assert str(exc.value) == mensaje
+    assert errores[0] == ErrorFila(1, "Email inválido: 'bob'")
+    assert [e.fila for e in errores] == [1, 2, 3]
+
+
+def test_columnas_de_distinta_longitud():
+    with pytest.raises(ValueError, match="'nombre'"):
+        Usuario.desde_registros({"nombre": ["Ana"], "email": ["ana@corp.com", "bob@corp.com"]})
+
+
+def test_pool_mismo_resultado_y_en_orden():
+    registros = ({"nombre": str(i), "email": f"u{i}@corp.com" if i % 7 else "mal"} for i in range(500))
+    usuarios, errores = Usuario.desde_registros(registros, procesos=2, tam_bloque=16)
+    esperado = Usuario.desde_registros(
+        [{"nombre": str(i), "email": f"u{i}@corp.com" if i % 7 else "mal"} for i in range(500)])
+    assert [u.email for u in usuarios] == [u.email for u in esperado.usuarios]
+    assert errores == esperado.errores
@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from app.modelos import Usuario
+from app.passwords import Parametros, hashear, necesita_rehash, verificar
+
+RAPIDO = Parametros("pbkdf2-sha256", 1_000)
+
+
+def test_verificar_hash_corrupto_devuelve_false():
+    bueno = hashear("Secreta-1", RAPIDO)
+    assert verificar("Secreta-1", bueno) and not verificar("otra", bueno)
+    for malo in ("$scrypt$v=1$ln=x$AA$AA", "$md5$v=1$i=1$AA$AA", "$pbkdf2-sha256$v=9$i=1$AA$AA", "basura"):
+        assert verificar("Secreta-1", malo) is False
+
+
+def test_check_password_migra_formato_legado():
+    u = Usuario("Ana", "ana@corp.com")
+    u._Usuario__password_hash = "hash::Secreta-1"
+    assert u.check_password("Secreta-1")
+    assert u._Usuario__password_hash.startswith("$scrypt$")
+    assert not necesita_rehash(u._Usuario__password_hash)
+    u._Usuario__password_hash = "$scrypt$roto"
+    assert u.check_password("Secreta-1") is False
+
+
+def test_copias_de_passwords_identicas():
+    original = Path(__file__).with_name("app") / "passwords.py"
+    ejemplos = Path(__file__).resolve().parents[2]
+    for copia in (ejemplos / "sesion3" / "fase1" / "app" / "passwords.py",
+                  ejemplos / "sesion4" / "fase3" / "app" / "passwords.py"):
+        assert copia.read_bytes() == original.read_bytes(), f"{copia} se ha desviado de {original}"
@@ -0,0 +1,325 @@
+# autenticacion.py
+"""
+Autenticación con tokens firmados (HMAC-SHA256) para AuthMixin.
+
+Token: b64url("<expira>.<jti>.<sujeto>") + "." + b64url(firma)
+- Firmador: emite y comprueba la firma en tiempo constante (hmac.compare_digest).
+- AlmacenTokens: almacén local de tokens vivos (jti). Revocar = quitar del
+  almacén y subir `version`; los caducados se purgan al emitir pasado un umbral.
+- Autenticador: LRU de tokens ya verificados. Un acierto cuesta una búsqueda en
+  el LRU + comparar la caducidad + comparar la versión del almacén: sin HMAC
+  ni consulta al almacén. Tras cualquier revocación la versión cambia y cada
+  token se vuelve a confirmar contra el almacén (una vez) antes de aceptarse.
+- VerificadorAsync: los fallos de caché que llegan juntos se agrupan en un lote
+  y se confirman con una sola consulta al almacén.
+"""
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+
+class Identidad(NamedTuple):
+    sujeto: str
+    jti: str        # id único del token (lo que se revoca)
+    expira: float   # epoch en segundos
+
+
+def _b64(b: bytes) -> str:
+    return base64.urlsafe_b64encode(b).decode().rstrip("=")
+
+
+def _unb64(s: str) -> bytes:
+    return base64.urlsafe_b64decode(s + "=" * (-len(s) % 4))
+
+
+# ------------------ Firma ------------------
+class Firmador:
+    def __init__(self, clave: bytes):
+        if len(clave) < 32:
+            raise ValueError("La clave HMAC debe tener al menos 32 bytes")
+        self._clave = clave
+
+    def _firma(self, payload: bytes) -> bytes:
+        return hmac.new(self._clave, payload, hashlib.sha256).digest()
+
+    def firmar(self, ident: Identidad) -> str:
+        payload = f"{ident.expira:.0f}.{ident.jti}.{ident.sujeto}".encode()
+        return f"{_b64(payload)}.{_b64(self._firma(payload))}"
+
+    def descifrar(self, token: str, ahora: float) -> Optional[Identidad]:
+        """Identidad si la firma es válida y no ha caducado; None si no."""
+        try:
+            p, f = token.split(".")
+            payload, firma = _unb64(p), _unb64(f)
+        except (ValueError, AttributeError):
+            return None
+        if not hmac.compare_digest(self._firma(payload), firma):
+            return None
+        try:
+            expira, jti, sujeto = payload.decode().split(".", 2)
+            ident = Identidad(sujeto, jti, float(expira))
+        except ValueError:
+            return None
+        return ident if ident.expira > ahora else None
+
+
+# ------------------ Almacén local de tokens ------------------
+class AlmacenTokens:
+    """
+    Tokens vivos por jti. Seguro entre hilos; `version` cambia en cada revocación.
+    Los caducados se purgan solos al registrar cuando el almacén alcanza `purgar_desde`
+    entradas; el umbral se dobla con lo que sobrevive, así que el coste queda amortizado.
+    """
+
+    def __init__(self, purgar_desde: int = 1024):
+        self._lock = threading.Lock()
+        self._vivos: Dict[str, Identidad] = {}
+        self._por_sujeto: Dict[str, Set[str]] = {}
+        self.version = 0
+        self.purgar_desde = purgar_desde
+        self._umbral = purgar_desde
+
+    def registrar(self, ident: Identidad, ahora: Optional[float] = None) -> None:
+        with self._lock:
+            if len(self._vivos) >= self._umbral:
+                self._purgar(time.time() if ahora is None else ahora)
+                self._umbral = max(self.purgar_desde, 2 * len(self._vivos))
+            self._vivos[ident.jti] = ident
+            self._por_sujeto.setdefault(ident.sujeto, set()).add(ident.jti)
+
+    def activos(self, jtis: Iterable[str]) -> Set[str]:
+        """De esos jti, los que siguen vivos (consulta en lote)."""
+        with self._lock:
+            return {j for j in jtis if j in self._vivos}
+
+    def activo(self, jti: str) -> bool:
+        return bool(self.activos((jti,)))
+
+    def revocar(self, jti: str) -> bool:
+        with self._lock:
+            ident = self._vivos.pop(jti, None)
+            if ident is None:
+                return False
+            self._soltar(ident)
+            self.version += 1
+            return True
+
+    def revocar_sujeto(self, sujeto: str) -> int:
+        """Revoca todos los tokens de un sujeto (p. ej. al cambiar la contraseña)."""
+        with self._lock:
+            jtis = self._por_sujeto.pop(sujeto, set())
+            for j in jtis:
+                self._vivos.pop(j, None)
+            if jtis:
+                self.version += 1
+            return len(jtis)
+
+    def purgar(self, ahora: float) -> int:
+        """Olvida los caducados (ya no pasan la verificación: no cambia la versión)."""
+        with self._lock:
+            return self._purgar(ahora)
+
+    def _purgar(self, ahora: float) -> int:
+        caducados = [i for i in self._vivos.values() if i.expira <= ahora]
+        for i in caducados:
+            del self._vivos[i.jti]
+            self._soltar(i)
+        return len(caducados)
+
+    def _soltar(self, ident: Identidad) -> None:
+        """Quita el jti del índice por sujeto, y al sujeto si se queda sin tokens."""
+        jtis = self._por_sujeto.get(ident.sujeto)
+        if jtis is not None:
+            jtis.discard(ident.jti)
+            if not jtis:
+                del self._por_sujeto[ident.sujeto]
+
+
+# ------------------ Caché LRU ------------------
+class CacheLRU:
+    """token -> (Identidad, versión del almacén al confirmarlo)."""
+
+    def __init__(self, maximo: int = 10_000):
+        self.maximo = maximo
+        self._datos: "OrderedDict[str, Tuple[Identidad, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[Tuple[Identidad, int]]:
+        with self._lock:
+            e = self._datos.get(token)
+            if e is not None:
+                self._datos.move_to_end(token)
+            return e
+
+    def poner(self, token: str, entrada: Tuple[Identidad, int]) -> None:
+        if self.maximo <= 0:
+            return
+        with self._lock:
+            self._datos[token] = entrada
+            self._datos.move_to_end(token)
+            if len(self._datos) > self.maximo:
+                self._datos.popitem(last=False)
+
+    def descartar(self, token: str) -> None:
+        with self._lock:
+            self._datos.pop(token, None)
+
+    def __len__(self) -> int:
+        return len(self._datos)
+
+
+# ------------------ Autenticador ------------------
+class Autenticador:
+    def __init__(self, firmador: Firmador, almacen: Optional[AlmacenTokens] = None, *,
+                 tam_cache: int = 10_000, reloj: Callable[[], float] = time.time):
+        self.firmador = firmador
+        self.almacen = almacen or AlmacenTokens()
+        self.cache = CacheLRU(tam_cache)
+        self.reloj = reloj
+
+    def emitir(self, sujeto: str, ttl: float = 3600) -> str:
+        ahora = self.reloj()
+        ident = Identidad(sujeto, _b64(os.urandom(12)), float(int(ahora + ttl)))
+        self.almacen.registrar(ident, ahora)
+        return self.firmador.firmar(ident)
+
+    def revocar(self, token: str) -> bool:
+        ident = self.firmador.descifrar(token, self.reloj())
+        self.cache.descartar(token)
+        return ident is not None and self.almacen.revocar(ident.jti)
+
+    def _desde_cache(self, token: str, ahora: float) -> Tuple[Optional[Identidad], bool]:
+        """(identidad, vigente). vigente=False -> hay que confirmar contra el almacén."""
+        e = self.cache.get(token)
+        if e is None:
+            return None, False
+        ident, version = e
+        if ident.expira <= ahora:
+            self.cache.descartar(token)
+            return None, True           # caducado: rechazo definitivo
+        return ident, version == self.almacen.version
+
+    def verificar(self, token: str) -> Optional[Identidad]:
+        ahora = self.reloj()
+        ident, vigente = self._desde_cache(token, ahora)
+        if vigente:
+            return ident
+        # Leer la versión ANTES de consultar: si se revoca entre medias, la entrada
+        # queda con una versión vieja y se reconfirma en la siguiente petición.
+        version = self.almacen.version
+        if ident is None:
+            ident = self.firmador.descifrar(token, ahora)
+            if ident is None:
+                return None
+        if not self.almacen.activo(ident.jti):
+            self.cache.descartar(token)
+            return None
+        self.cache.poner(token, (ident, version))
+        return ident
+
+
+# ------------------ Verificación asíncrona en lote ------------------
+class VerificadorAsync:
+    """
+    await verificar(token). Los aciertos de caché vuelven sin esperar; los fallos
+    se acumulan hasta `max_lote` o `espera` segundos y se confirman con una sola
+    llamada a AlmacenTokens.activos().
+    """
+
+    def __init__(self, autenticador: Autenticador, *, max_lote: int = 256, espera: float = 0.0005):
+        self.aut = autenticador
+        self.max_lote = max_lote
+        self.espera = espera
+        self._pendientes: List[Tuple[str, Identidad, asyncio.Future]] = []
+        self._temporizador: Optional[asyncio.TimerHandle] = None
+
+    async def verificar(self, token: str) -> Optional[Identidad]:
+        aut = self.aut
+        ahora = aut.reloj()
+        ident, vigente = aut._desde_cache(token, ahora)
+        if vigente:
+            return ident
+        if ident is None:
+            ident = aut.firmador.descifrar(token, ahora)
+            if ident is None:
+                return None
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._pendientes.append((token, ident, fut))
+        if len(self._pendientes) >= self.max_lote:
+            self._despachar()
+        elif self._temporizador is None:
+            self._temporizador = loop.call_later(self.espera, self._despachar)
+        return await fut
+
+    async def verificar_lote(self, tokens: Iterable[str]) -> List[Optional[Identidad]]:
+        return list(await asyncio.gather(*(self.verificar(t) for t in tokens)))
+
+    def _despachar(self) -> None:
+        if self._temporizador is not None:
+            self._temporizador.cancel()
+            self._temporizador = None
+        lote, self._pendientes = self._pendientes, []
+        if not lote:
+            return
+        almacen, cache = self.aut.almacen, self.aut.cache
+        version = almacen.version
+        vivos = almacen.activos({ident.jti for _, ident, _ in lote})
+        for token, ident, fut in lote:
+            if ident.jti in vivos:
+                cache.poner(token, (ident, version))
+                resultado: Optional[Identidad] = ident
+            else:
+                cache.descartar(token)
+                resultado = None
+            if not fut.done():
+                fut.set_result(resultado)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Verificaciones/s: sin caché, con LRU y asíncrono en lote")
+    parser.add_argument("--tokens", type=int, default=1000)
+    parser.add_argument("--peticiones", type=int, default=200_000)
+    args = parser.parse_args()
+
+    aut = Autenticador(Firmador(os.urandom(32)))
+    tokens = [aut.emitir(f"u{i}@corp.com") for i in range(args.tokens)]
+    sin_cache = Autenticador(aut.firmador, aut.almacen, tam_cache=0)
+
+    for nombre, a in (("sin caché", sin_cache), ("LRU", aut)):
+        t0 = time.perf_counter()
+        for i in range(args.peticiones):
+            a.verificar(tokens[i % len(tokens)])
+        dt = time.perf_counter() - t0
+        print(f"  {nombre:<12} {args.peticiones / dt:>12,.0f} verificaciones/s")
+
+    # Revocación: se nota en la siguiente verificación aunque esté en caché
+    assert aut.verificar(tokens[0]) is not None
+    aut.revocar(tokens[0])
+    assert aut.verificar(tokens[0]) is None and aut.verificar(tokens[1]) is not None
+
+    async def asincrono():
+        frio = Autenticador(aut.firmador, aut.almacen)
+        v = VerificadorAsync(frio)
+        t0 = time.perf_counter()
+        res = await v.verificar_lote(tokens)          # fallos: lotes contra el almacén
+        dt_frio = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for i in range(args.peticiones):
+            await v.verificar(tokens[i % len(tokens)])  # aciertos de caché: no esperan
+        dt = time.perf_counter() - t0
+        print(f"  {'async frío':<12} {len(tokens) / dt_frio:>12,.0f} verificaciones/s "
+              f"({sum(r is None for r in res)} revocado)")
+        print(f"  {'async LRU':<12} {args.peticiones / dt:>12,.0f} verificaciones/s")
+
+    asyncio.run(asincrono())
@@ -0,0 +1,106 @@
+# app/composicion.py
+"""
+Composición de mixins para los decoradores de clase (logger, notificador,
+controller, auth...).
+
+componer(base, *mixins, **atributos) -> clase (*mixins, base) con `atributos`:
+- Cacheada por (mixins, base, atributos): aplicar el mismo decorador dos veces
+  devuelve la misma clase.
+- Apilar decoradores no anida clases: si `base` ya es compuesta se recompone
+  desde la original, así que el MRO es [Final, *mixins, base original, ...]
+  (el decorador de más fuera queda primero).
+- Misma resolución que el decorador de siempre (type(nombre, (Mixin, cls),
+  dict(cls.__dict__))): lo definido en la propia clase gana a los mixins, y los
+  mixins ganan a lo que la clase hereda. La original sigue siendo una base real:
+  isinstance(x, Original) y super() funcionan.
+- Aplanado: los métodos (y property/classmethod/staticmethod) que resuelve el
+  MRO se copian en la clase final al crearla, así el lookup acaba en el primer
+  dict. Si se parchea una base después, componer con aplanar=False.
+- La caché es LRU acotada (MAX_CACHE); si algún atributo no es hashable la clase
+  se compone sin cachear.
+"""
+from __future__ import annotations
+
+import threading
+import types
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+_DESCRIPTORES = (types.FunctionType, property, classmethod, staticmethod)
+_NO_APLANAR = frozenset({"__init_subclass__", "__class_getitem__", "__new__"})
+# Lo que no se copia del namespace de la clase decorada
+_NO_COPIAR = frozenset({"__dict__", "__weakref__", "__module__", "__qualname__", "__doc__",
+                        "__compuesta__", "__abstractmethods__", "_abc_impl", "__slots__"})
+
+MAX_CACHE = 256
+_CACHE: "OrderedDict[Tuple[Any, ...], type]" = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def componer(base: type, *mixins: type, aplanar: bool = True, **atributos: Any) -> type:
+    previa = base.__dict__.get("__compuesta__")
+    if previa is not None:
+        base, mixins_previos, atributos_previos = previa
+        mixins = mixins + mixins_previos
+        atributos = {**atributos_previos, **atributos}
+    # Sin repetidos y sin los que la base ya hereda
+    vistos: list[type] = []
+    for m in mixins:
+        if m not in vistos and not issubclass(base, m):
+            vistos.append(m)
+    mixins = tuple(vistos)
+
+    clave: Optional[Tuple[Any, ...]] = (base, mixins, tuple(sorted(atributos.items())), aplanar)
+    try:
+        hash(clave)
+    except TypeError:
+        clave = None                          # atributos no hashables: sin caché
+    with _LOCK:
+        if clave is not None:
+            cls = _CACHE.get(clave)
+            if cls is not None:
+                _CACHE.move_to_end(clave)
+                return cls
+        cls = _crear(base, mixins, atributos, aplanar)
+        if clave is not None:
+            _CACHE[clave] = cls
+            while len(_CACHE) > MAX_CACHE:
+                _CACHE.popitem(last=False)
+        return cls
+
+
+def _crear(base: type, mixins: Tuple[type, ...], atributos: dict, aplanar: bool) -> type:
+    def _cuerpo(ns: dict) -> None:
+        # Como el decorador de siempre: el namespace propio de la clase, encima de los mixins
+        for nombre, valor in vars(base).items():
+            if nombre not in _NO_COPIAR and not isinstance(valor, types.MemberDescriptorType):
+                ns[nombre] = valor
+        ns.update(atributos)
+        ns.update(__module__=base.__module__, __qualname__=base.__qualname__, __doc__=base.__doc__,
+                  __compuesta__=(base, mixins, dict(atributos)))
+
+    cls = types.new_class(base.__name__, (*mixins, base), {}, _cuerpo)
+    if aplanar:
+        _aplanar(cls)
+    return cls
+
+
+def _aplanar(cls: type) -> None:
+    for klass in cls.__mro__[1:-1]:          # sin la propia clase ni object
+        for nombre, valor in vars(klass).items():
+            if nombre in cls.__dict__ or nombre in _NO_APLANAR:
+                continue
+            if not isinstance(valor, _DESCRIPTORES):
+                continue                       # los datos de clase (contadores...) se quedan donde están
+            # el primero en el MRO es el que ganaría el lookup
+            setattr(cls, nombre, valor)
+
+
+def es_compuesta(cls: type) -> bool:
+    return "__compuesta__" in cls.__dict__
+
+
+def original(cls: type) -> type:
+    """La clase sin decorar (la propia clase si no es compuesta)."""
+    previa = cls.__dict__.get("__compuesta__")
+    return previa[0] if previa is not None else cls
@@ -2,23 +2,13 @@
 # app/modelos.py
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any
-from functools import wraps
-from datetime import datetime
-from typing import Any, Callable
-
-def con_logging(func: Callable) -> Callable:
-    @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        ts = datetime.now().isoformat(timespec="seconds")
-        who = getattr(self, "email", "desconocido")
-        print(f"[{ts}] [{self.__class__.__name__}] <{who}> INICIO: {func.__name__}")
-        res = func(self, *args, **kwargs)
-        print(f"[{ts}] [{self.__class__.__name__}] <{who}> FIN: {func.__name__}")
-        return res
-    return wrapper
+import logging
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
 
+from .composicion import componer
+from .passwords import hashear, verificar_y_actualizar
+from .registro import LOGGER, con_logging
 
 
 class NotificadorMixin:
@@ -30,12 +20,18 @@ class NotificadorMixin:
 
 class LoggerMixin:
     """Mixin de logging simple. Supone que la clase hija tiene .email y .__class__.__name__."""
-    
-    def log_evento(self, msg: str, **context: Any) -> None:
-        ts = datetime.now().isoformat(timespec="seconds")
+
+    def log_evento(self, msg: str, *args: Any, nivel: int = logging.INFO, **context: Any) -> None:
+        """msg estilo % con args (perezoso); por debajo del nivel activo no hace nada."""
+        if not LOGGER.isEnabledFor(nivel):
+            return
         who = getattr(self, "email", "desconocido")
-        extra = f" {context}" if context else ""
-        print(f"[{ts}] [{self.__class__.__name__}] <{who}> {msg}{extra}")
+        if not args:
+            msg = msg.replace("%", "%%")   # texto literal
+        if context:
+            LOGGER.log(nivel, "[%s] <%s> " + msg + " %s", self.__class__.__name__, who, *args, context)
+        else:
+            LOGGER.log(nivel, "[%s] <%s> " + msg, self.__class__.__name__, who, *args)
 
     # # Ejemplo de método que coopera con super() para cadenas MRO
     def activar(self) -> None:
@@ -46,20 +42,11 @@ class LoggerMixin:
 
 def notificador():
     """
-    Decorador de clase que:
-      1) Inyecta ControllerMixin por herencia.
-      2) Fija base_path en la clase resultante.
+    Decorador de clase que inyecta NotificadorMixin por herencia (ver composicion.componer:
+    clase cacheada, MRO plano al apilar decoradores).
     """
     def _decorar(cls):
-
-        nombre = cls.__name__
-        attrs = dict(cls.__dict__)
-        # Limpiezas opcionales para evitar warnings en type()
-        attrs.pop("__dict__", None)
-        attrs.pop("__weakref__", None)
-
-        Nueva = type(nombre, (NotificadorMixin, cls), attrs)
-        return Nueva
+        return componer(cls, NotificadorMixin)
     return _decorar
 
 
@@ -84,21 +71,35 @@ def factory():
 
 def logger():
     """
-    Decorador de clase que:
-      1) Inyecta ControllerMixin por herencia.
-      2) Fija base_path en la clase resultante.
+    Decorador de clase que inyecta LoggerMixin por herencia (ver composicion.componer:
+    clase cacheada, MRO plano al apilar decoradores).
     """
     def _decorar(cls):
+        return componer(cls, LoggerMixin)
+    return _decorar
 
-        nombre = cls.__name__
-        attrs = dict(cls.__dict__)
-        # Limpiezas opcionales para evitar warnings en type()
-        attrs.pop("__dict__", None)
-        attrs.pop("__weakref__", None)
 
-        Nueva = type(nombre, (LoggerMixin, cls), attrs)
-        return Nueva
-    return _decorar
+# --- Permisos precalculados ---
+# Cada permiso declarado ocupa un bit. La tabla es fija (solo lectura, sin lock):
+# un permiso no declarado no tiene bit y se resuelve con el frozenset.
+PERMISOS = ("ver", "crear", "editar", "borrar")
+BIT_PERMISO: Mapping[str, int] = MappingProxyType({p: 1 << i for i, p in enumerate(PERMISOS)})
+
+
+def bit_permiso(permiso: str) -> int:
+    """Bit del permiso; 0 si no está en PERMISOS."""
+    return BIT_PERMISO.get(permiso, 0)
+
+
+def mascara(permisos: Iterable[str]) -> int:
+    m = 0
+    for p in permisos:
+        m |= bit_permiso(p)
+    return m
+
+
+# (clase, nivel) -> (frozenset, máscara); compartido por todas las instancias
+_PERMISOS_RESUELTOS: dict[tuple, tuple[frozenset[str], int]] = {}
 
 
 # --- Base abstracta ---
@@ -108,8 +109,45 @@ class BaseUsuario(ABC):
         """Lista de permisos concedidos al usuario."""
         ...
 
+    def _clave_permisos(self) -> tuple:
+        """De qué depende permisos(); las subclases con estado (nivel) lo añaden."""
+        return (type(self), None)
+
+    def _permisos_resueltos(self) -> tuple[frozenset[str], int]:
+        # caché por instancia -> caché por (clase, nivel) -> permisos()
+        try:
+            return self.__dict__["_resueltos"]
+        except KeyError:
+            pass
+        clave = self._clave_permisos()
+        r = _PERMISOS_RESUELTOS.get(clave)
+        if r is None:
+            conjunto = frozenset(self.permisos())
+            r = _PERMISOS_RESUELTOS.setdefault(clave, (conjunto, mascara(conjunto)))
+        self.__dict__["_resueltos"] = r
+        return r
+
+    def _invalidar_permisos(self) -> None:
+        self.__dict__.pop("_resueltos", None)
+
+    @property
+    def conjunto_permisos(self) -> frozenset[str]:
+        return self._permisos_resueltos()[0]
+
+    @property
+    def mascara_permisos(self) -> int:
+        return self._permisos_resueltos()[1]
+
     def tiene_permiso(self, permiso: str) -> bool:
-        return permiso in self.permisos()
+        return permiso in self._permisos_resueltos()[0]
+
+
+def usuarios_con_permiso(usuarios: Iterable[BaseUsuario], permiso: str) -> list[BaseUsuario]:
+    """Los usuarios de la lista que tienen `permiso` (una AND de bits por usuario)."""
+    bit = bit_permiso(permiso)
+    if not bit:
+        return [u for u in usuarios if permiso in u._permisos_resueltos()[0]]
+    return [u for u in usuarios if u._permisos_resueltos()[1] & bit]
 
 # --- Usuario (de Fase 2) HEREDA de BaseUsuario ---
 # @logger()
@@ -171,14 +209,17 @@ class Usuario(BaseUsuario):
             raise ValueError(f"Rol inválido: {value!r}. Válidos: {sorted(self.ROLES_VALIDOS)}")
         self._rol = v
 
-    # Password (demo)
+    # Password (KDF, ver passwords.py)
     def set_password(self, p: str) -> None:
         if not p or len(p) < 6:
             raise ValueError("La contraseña debe tener al menos 6 caracteres")
-        self.__password_hash = f"hash::{p}"
+        self.__password_hash = hashear(p)
 
     def check_password(self, p: str) -> bool:
-        return self.__password_hash == f"hash::{p}"
+        ok, nuevo = verificar_y_actualizar(p, self.__password_hash)
+        if nuevo is not None:
+            self.__password_hash = nuevo
+        return ok
 
     @classmethod
     def desde_dict(cls, datos: dict) -> "Usuario":
@@ -209,17 +250,28 @@ class Admin(Usuario):
 
 # @logger()
 class Moderador(Usuario):
+    ROLES_VALIDOS = Usuario.ROLES_VALIDOS | {"moderador"}
+
     def __init__(self, nombre: str, email: str, nivel: int = 1, activo: bool = True):
         super().__init__(nombre, email, rol="moderador", activo=activo)
+        self.nivel = nivel
 
-        if not isinstance(nivel, int) or nivel < 1:
-            raise ValueError("El nivel de moderador debe ser un entero >= 1")
+    # Nivel: al cambiar, los permisos precalculados dejan de valer
+    @property
+    def nivel(self) -> int:
+        return self._nivel
 
+    @nivel.setter
+    def nivel(self, value: int) -> None:
+        if not isinstance(value, int) or value < 1:
+            raise ValueError("El nivel de moderador debe ser un entero >= 1")
+        self._nivel = value
+        self._invalidar_permisos()
 
-        self.nivel = nivel
+    def _clave_permisos(self) -> tuple:
+        return (type(self), self.nivel)
 
     def permisos(self) -> list[str]:
-        super().permisos()
         base = ["ver", "editar"]
         if self.nivel >= 2:
             base.append("borrar")
@@ -0,0 +1,142 @@
+# app/passwords.py
+"""
+Hash de contraseñas con KDF de la stdlib (hashlib.scrypt / hashlib.pbkdf2_hmac).
+
+Formato versionado (todo ASCII, cabe en un str):
+    $scrypt$v=1$ln=14,r=8,p=1$<sal b64>$<hash b64>
+    $pbkdf2-sha256$v=1$i=600000$<sal b64>$<hash b64>
+- Sal aleatoria de 16 bytes por contraseña (os.urandom).
+- Comparación en tiempo constante (hmac.compare_digest).
+- necesita_rehash(): el hash guardado usa otro algoritmo o un coste menor que el
+  actual (o el formato antiguo "hash::<p>") -> se rehace en el siguiente login.
+- verificar_lote / rehash_lote: los KDF sueltan el GIL, así que un pool de hilos
+  reparte los logins entre los núcleos.
+
+Cada fase es un proyecto autónomo con su propio paquete `app`, así que este módulo
+se copia tal cual en sesion3/fase1, sesion3/fase2 y sesion4/fase3;
+sesion3/fase2/test_passwords.py comprueba que las copias no divergen.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, NamedTuple, Optional
+
+VERSION = 1
+_TAM_SAL = 16
+_TAM_HASH = 32
+_LEGADO = "hash::"   # formato de demo anterior: se acepta para poder migrarlo
+
+
+class Parametros(NamedTuple):
+    algoritmo: str = "scrypt"   # "scrypt" o "pbkdf2-sha256"
+    coste: int = 14             # scrypt: log2(n); pbkdf2: iteraciones
+    r: int = 8                  # solo scrypt
+    p: int = 1                  # solo scrypt
+
+    def codificar(self) -> str:
+        if self.algoritmo == "scrypt":
+            return f"ln={self.coste},r={self.r},p={self.p}"
+        return f"i={self.coste}"
+
+
+SCRYPT_POR_DEFECTO = Parametros("scrypt", 14, 8, 1)
+PBKDF2_POR_DEFECTO = Parametros("pbkdf2-sha256", 600_000)
+# Lo que usan hashear/necesita_rehash si no se indica otra cosa
+PARAMETROS = SCRYPT_POR_DEFECTO
+
+
+def _b64(b: bytes) -> str:
+    return base64.b64encode(b).decode().rstrip("=")
+
+
+def _unb64(s: str) -> bytes:
+    return base64.b64decode(s + "=" * (-len(s) % 4))
+
+
+def _derivar(password: str, sal: bytes, par: Parametros) -> bytes:
+    pwd = password.encode("utf-8")
+    if par.algoritmo == "scrypt":
+        n = 1 << par.coste
+        return hashlib.scrypt(pwd, salt=sal, n=n, r=par.r, p=par.p,
+                              maxmem=256 * par.r * (n + par.p), dklen=_TAM_HASH)
+    if par.algoritmo == "pbkdf2-sha256":
+        return hashlib.pbkdf2_hmac("sha256", pwd, sal, par.coste, dklen=_TAM_HASH)
+    raise ValueError(f"Algoritmo no soportado: {par.algoritmo!r}")
+
+
+def _parsear(codificado: str) -> tuple[Parametros, bytes, bytes]:
+    try:
+        _, algoritmo, version, params, sal, h = codificado.split("$")
+        if version != f"v={VERSION}":
+            raise ValueError
+        campos = dict(kv.split("=") for kv in params.split(","))
+        if algoritmo == "scrypt":
+            par = Parametros(algoritmo, int(campos["ln"]), int(campos["r"]), int(campos["p"]))
+        else:
+            par = Parametros(algoritmo, int(campos["i"]))
+        return par, _unb64(sal), _unb64(h)
+    except (ValueError, KeyError) as e:
+        raise ValueError("Hash de contraseña con formato desconocido") from e
+
+
+def hashear(password: str, parametros: Optional[Parametros] = None) -> str:
+    par = parametros or PARAMETROS
+    sal = os.urandom(_TAM_SAL)
+    h = _derivar(password, sal, par)
+    return f"${par.algoritmo}$v={VERSION}${par.codificar()}${_b64(sal)}${_b64(h)}"
+
+
+def verificar(password: str, codificado: Optional[str]) -> bool:
+    """False también si el hash guardado está corrupto o usa un algoritmo desconocido."""
+    if not codificado:
+        return False
+    if codificado.startswith(_LEGADO):
+        return hmac.compare_digest(codificado.encode(), f"{_LEGADO}{password}".encode())
+    try:
+        par, sal, esperado = _parsear(codificado)
+        return hmac.compare_digest(_derivar(password, sal, par), esperado)
+    except ValueError:
+        return False
+
+
+def necesita_rehash(codificado: Optional[str], parametros: Optional[Parametros] = None) -> bool:
+    """True si el hash no está en el formato/algoritmo/coste actual (o es menor)."""
+    par = parametros or PARAMETROS
+    if not codificado or codificado.startswith(_LEGADO):
+        return True
+    try:
+        guardado = _parsear(codificado)[0]
+    except ValueError:
+        return True
+    if guardado.algoritmo != par.algoritmo:
+        return True
+    return guardado.coste < par.coste or guardado.r < par.r or guardado.p < par.p
+
+
+def verificar_y_actualizar(password: str, codificado: Optional[str],
+                           parametros: Optional[Parametros] = None) -> tuple[bool, Optional[str]]:
+    """(ok, nuevo_hash). nuevo_hash solo si ok y el guardado debe rehacerse."""
+    if not verificar(password, codificado):
+        return False, None
+    if necesita_rehash(codificado, parametros):
+        return True, hashear(password, parametros)
+    return True, None
+
+
+# ------------------ En lote (pool de hilos) ------------------
+def verificar_lote(pares: Iterable[tuple[str, Optional[str]]], *,
+                   hilos: Optional[int] = None) -> list[bool]:
+    """pares: (password, hash guardado). Mismo orden en la salida."""
+    with ThreadPoolExecutor(max_workers=hilos or os.cpu_count() or 1) as pool:
+        return list(pool.map(lambda par: verificar(*par), pares))
+
+
+def rehash_lote(pares: Iterable[tuple[str, Optional[str]]], parametros: Optional[Parametros] = None, *,
+                hilos: Optional[int] = None) -> list[tuple[bool, Optional[str]]]:
+    """verificar_y_actualizar para cada (password, hash guardado), en paralelo."""
+    with ThreadPoolExecutor(max_workers=hilos or os.cpu_count() or 1) as pool:
+        return list(pool.map(lambda par: verificar_y_actualizar(par[0], par[1], parametros), pares))
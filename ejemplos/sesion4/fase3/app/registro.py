@@ -0,0 +1,100 @@
+# app/registro.py
+"""
+Backend de logging para con_logging y LoggerMixin (logging de la stdlib).
+
+- Nivel: si el logger "app" no está habilitado para el nivel del evento, no se
+  calcula nada (ni timestamp, ni email, ni el texto).
+- Mensajes perezosos: estilo %, los argumentos se formatean solo si se escribe.
+- Escritura en segundo plano: los registros van a una cola y un QueueListener
+  (hilo propio) les da formato (timestamp, plantilla) y los escribe en fichero o
+  stdout. Quien llama solo resuelve el texto del mensaje y hace un put().
+
+Sin configurar_logging() el logger no tiene handlers propios: INFO no sale.
+"""
+from __future__ import annotations
+
+import atexit
+import copy
+import logging
+import queue
+import sys
+import time
+from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Optional
+
+LOGGER = logging.getLogger("app")
+FORMATO = "[%(asctime)s] %(message)s"
+FORMATO_FECHA = "%Y-%m-%dT%H:%M:%S"
+
+_listener: Optional[QueueListener] = None
+_handler: Optional[QueueHandler] = None
+
+
+class _ColaHandler(QueueHandler):
+    """
+    Resuelve el mensaje (msg % args) antes de encolar: los argumentos pueden ser
+    objetos que cambian después. El formateo de la línea se hace en el hilo escritor.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)       # otros handlers pueden recibir el mismo registro
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        return record
+
+
+def configurar_logging(destino: Optional[str] = None, nivel: int = logging.INFO) -> QueueListener:
+    """
+    destino: ruta de fichero (append) o None para stdout. Se puede volver a llamar
+    para cambiar destino o nivel; el escritor anterior se vacía y se detiene.
+    """
+    global _listener, _handler
+    detener_logging()
+    if destino is None:
+        salida: logging.Handler = logging.StreamHandler(sys.stdout)
+    else:
+        salida = logging.FileHandler(destino, encoding="utf-8")
+    salida.setFormatter(logging.Formatter(FORMATO, FORMATO_FECHA))
+
+    cola: queue.SimpleQueue = queue.SimpleQueue()
+    _handler = _ColaHandler(cola)
+    LOGGER.addHandler(_handler)
+    LOGGER.setLevel(nivel)
+    LOGGER.propagate = False
+    _listener = QueueListener(cola, salida)
+    _listener.start()
+    return _listener
+
+
+def detener_logging() -> None:
+    """Vacía la cola, cierra el destino y quita el handler (también al salir)."""
+    global _listener, _handler
+    if _listener is not None:
+        _listener.stop()
+        for h in _listener.handlers:
+            h.close()
+        _listener = None
+    if _handler is not None:
+        LOGGER.removeHandler(_handler)
+        _handler = None
+
+
+atexit.register(detener_logging)
+
+
+def con_logging(func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if not LOGGER.isEnabledFor(logging.INFO):
+            return func(self, *args, **kwargs)
+        clase = self.__class__.__name__
+        who = getattr(self, "email", "desconocido")
+        LOGGER.info("[%s] <%s> INICIO: %s", clase, who, func.__name__)
+        t0 = time.perf_counter()
+        res = func(self, *args, **kwargs)
+        # FIN lleva su propio timestamp (el del registro) y la duración
+        LOGGER.info("[%s] <%s> FIN: %s (%.3f ms)", clase, who, func.__name__,
+                    (time.perf_counter() - t0) * 1000)
+        return res
+    return wrapper
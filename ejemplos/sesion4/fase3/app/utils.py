@@ -1,14 +1,4 @@
-from functools import wraps
-from datetime import datetime
-from typing import Any, Callable
+# app/utils.py
+from .registro import con_logging
 
-def con_logging(func: Callable) -> Callable:
-    @wraps(func)
-    def wrapper(self, *args, **kwargs):
-        ts = datetime.now().isoformat(timespec="seconds")
-        who = getattr(self, "email", "desconocido")
-        print(f"[{ts}] [{self.__class__.__name__}] <{who}> INICIO: {func.__name__}")
-        res = func(self, *args, **kwargs)
-        print(f"[{ts}] [{self.__class__.__name__}] <{who}> FIN: {func.__name__}")
-        return res
-    return wrapper
\ No newline at end of file
+__all__ = ["con_logging"]
@@ -1,6 +1,7 @@
 # main.py
 import argparse
 from app.modelos import  Usuario
+from app.registro import configurar_logging
 
 if __name__ == "__main__":
     # a = AdminFull("Root", "root@corp.com")
@@ -13,6 +14,7 @@ if __name__ == "__main__":
     # print("MRO AdminConLogger:", AdminConLogger.mro())
 
 
+    configurar_logging()             # stdout, nivel INFO (o configurar_logging("app.log"))
     m = Usuario("Root", "root@corp.com")
 
     m.activar()
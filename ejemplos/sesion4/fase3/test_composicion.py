@@ -0,0 +1,38 @@
+import pytest
+
+from app import composicion
+from app.composicion import componer, original
+from app.modelos import Admin, LoggerMixin, NotificadorMixin, Usuario, logger, notificador
+
+
+def test_activar_mantiene_el_comportamiento_de_la_clase(capsys):
+    u = notificador()(Usuario)("a", "a@b.com", activo=False)
+    u.activar()
+    assert u.activo is True
+    assert "[EMAIL" not in capsys.readouterr().out
+
+
+def test_mixin_gana_a_lo_heredado_y_la_clase_a_los_mixins():
+    # Admin no define activar: como con type(nombre, (Mixin, cls), ...), gana el mixin
+    assert notificador()(Admin).activar is NotificadorMixin.activar
+    # Admin sí define presentarse: gana la clase
+    assert notificador()(Admin).presentarse is Admin.presentarse
+
+
+def test_apilar_no_anida_y_se_cachea():
+    final = notificador()(logger()(Usuario))
+    assert final.__mro__[1:4] == (NotificadorMixin, LoggerMixin, Usuario)
+    assert final is notificador()(logger()(Usuario))
+    assert original(final) is Usuario
+    assert isinstance(final("a", "a@b.com"), Usuario)
+
+
+def test_atributos_no_hashables_y_cache_acotada(monkeypatch):
+    a = componer(Usuario, LoggerMixin, etiquetas=["x"])
+    b = componer(Usuario, LoggerMixin, etiquetas=["x"])
+    assert a is not b and a.etiquetas == ["x"]
+
+    monkeypatch.setattr(composicion, "MAX_CACHE", 3)
+    for i in range(10):
+        componer(Usuario, LoggerMixin, n=i)
+    assert len(composicion._CACHE) <= 3
@@ -0,0 +1,27 @@
+from app.modelos import Usuario
+
+
+def test_password_con_kdf():
+    u = Usuario("Ana", "ana@corp.com")
+    u.set_password("Secreta-1")
+    assert u.check_password("Secreta-1") and not u.check_password("otra")
+    assert "Secreta-1" not in u._Usuario__password_hash
+    u._Usuario__password_hash = "$scrypt$roto"
+    assert u.check_password("Secreta-1") is False
+
+
+def test_permisos_no_declarados_no_crecen_la_tabla():
+    from app.modelos import BIT_PERMISO, Moderador, bit_permiso, usuarios_con_permiso
+
+    class Auditor(Usuario):
+        def permisos(self):
+            return ["ver", "auditar"]
+
+    antes = dict(BIT_PERMISO)
+    auditor = Auditor("Eva", "eva@corp.com")
+    mod = Moderador("Mo", "mo@corp.com", nivel=2)
+    assert bit_permiso("auditar") == 0 and bit_permiso(f"p{id(auditor)}") == 0
+    assert dict(BIT_PERMISO) == antes
+    assert auditor.tiene_permiso("auditar") and auditor.mascara_permisos == bit_permiso("ver")
+    assert usuarios_con_permiso([auditor, mod], "auditar") == [auditor]
+    assert usuarios_con_permiso([auditor, mod], "borrar") == [mod]
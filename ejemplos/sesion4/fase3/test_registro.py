@@ -0,0 +1,34 @@
+import logging
+
+from app.registro import LOGGER, configurar_logging, detener_logging
+
+
+def test_mensaje_se_resuelve_al_encolar(tmp_path):
+    destino = tmp_path / "app.log"
+    configurar_logging(str(destino))
+    try:
+        datos = ["antes"]
+        LOGGER.info("valor=%s", datos)
+        datos[0] = "despues"         # cambia antes de que el escritor formatee
+    finally:
+        detener_logging()
+    linea = destino.read_text(encoding="utf-8")
+    assert "valor=['antes']" in linea and linea.startswith("[")
+
+
+def test_otros_handlers_ven_el_registro_original(tmp_path):
+    recibidos = []
+
+    class Guardar(logging.Handler):
+        def emit(self, record):
+            recibidos.append((record.msg, record.args))
+
+    configurar_logging(str(tmp_path / "app.log"))
+    otro = Guardar()
+    LOGGER.addHandler(otro)
+    try:
+        LOGGER.info("hola %s", "ana")
+    finally:
+        LOGGER.removeHandler(otro)
+        detener_logging()
+    assert recibidos == [("hola %s", ("ana",))]
@@ -0,0 +1,143 @@
+# respuestas.py
+"""
+Capa de respuestas para ControllerMixin.
+
+- Cabeceras congeladas (MappingProxyType) creadas una vez y compartidas por
+  todas las respuestas: nadie puede modificarlas por accidente.
+- Codificador enchufable: cualquier callable obj -> bytes. Por defecto orjson si
+  está instalado (y json de la stdlib para lo que orjson no acepta: claves no
+  str, enteros de más de 64 bits...); si no, json de la stdlib (compacto, UTF-8).
+- Listas grandes en streaming: json_stream() codifica elemento a elemento en un
+  bytearray que se reutiliza y emite trozos de ~tam_chunk bytes, sin construir
+  nunca el JSON completo en memoria.
+- json() no usa búfer propio: el codificador ya devuelve bytes y copiarlos a un
+  bytearray solo añadiría una copia.
+"""
+from __future__ import annotations
+
+import json
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Iterator, Mapping, NamedTuple, Optional, Union
+
+try:  # orjson es opcional: sin él se usa json de la stdlib
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+Codificador = Callable[[Any], bytes]
+
+CABECERAS_JSON: Mapping[str, str] = MappingProxyType({"Content-Type": "application/json"})
+CABECERAS_JSON_STREAM: Mapping[str, str] = MappingProxyType(
+    {"Content-Type": "application/json", "Transfer-Encoding": "chunked"})
+
+_STDLIB = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def codificar_stdlib(data: Any) -> bytes:
+    return _STDLIB.encode(data).encode("utf-8")
+
+
+def codificar_orjson(data: Any) -> bytes:
+    try:
+        return orjson.dumps(data)
+    except TypeError:   # orjson.JSONEncodeError: {1: "a"}, 2**70...
+        return codificar_stdlib(data)
+
+
+def codificador_por_defecto() -> Codificador:
+    return codificar_orjson if orjson is not None else codificar_stdlib
+
+
+class Respuesta(NamedTuple):
+    status: int
+    cabeceras: Mapping[str, str]
+    cuerpo: Union[bytes, Iterator[bytes]]   # iterador si es streaming
+
+    def cuerpo_completo(self) -> bytes:
+        """El cuerpo entero (consume el iterador si es streaming)."""
+        return self.cuerpo if isinstance(self.cuerpo, bytes) else b"".join(self.cuerpo)
+
+
+class Respuestas:
+    """Fábrica de respuestas JSON; sin estado mutable compartido (segura entre hilos)."""
+
+    def __init__(self, codificador: Optional[Codificador] = None, tam_chunk: int = 64 * 1024):
+        self.codificar = codificador or codificador_por_defecto()
+        self.tam_chunk = tam_chunk
+        self._errores: dict[tuple[int, str], Respuesta] = {}
+
+    def json(self, data: Any, status: int = 200) -> Respuesta:
+        return Respuesta(status, CABECERAS_JSON, self.codificar(data))
+
+    def error(self, mensaje: str, status: int) -> Respuesta:
+        """{"error": mensaje}; los errores se repiten mucho, se codifican una vez."""
+        clave = (status, mensaje)
+        resp = self._errores.get(clave)
+        if resp is None:
+            resp = self._errores.setdefault(clave, self.json({"error": mensaje}, status))
+        return resp
+
+    def json_stream(self, items: Iterable[Any], status: int = 200) -> Respuesta:
+        return Respuesta(status, CABECERAS_JSON_STREAM, self._trozos(items))
+
+    def _trozos(self, items: Iterable[Any]) -> Iterator[bytes]:
+        # Un bytearray por respuesta, reutilizado para todos sus trozos. Cada elemento
+        # se codifica por separado: del codificador solo se asume obj -> bytes.
+        buf = bytearray(b"[")
+        codificar, tam = self.codificar, self.tam_chunk
+        sep = b""
+        for item in items:
+            buf += sep
+            buf += codificar(item)
+            sep = b","
+            if len(buf) >= tam:
+                yield bytes(buf)
+                buf.clear()
+        buf += b"]"
+        yield bytes(buf)
+
+
+RESPUESTAS = Respuestas()
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+    import tracemalloc
+
+    parser = argparse.ArgumentParser(description="Listado de usuarios: json.dumps + dict vs Respuestas")
+    parser.add_argument("--usuarios", type=int, default=100_000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    usuarios = [{"id": i, "name": f"Usuario {i}", "email": f"u{i}@corp.com", "activo": i % 3 != 0}
+                for i in range(args.usuarios)]
+
+    def antes():
+        return 200, {"Content-Type": "application/json"}, json.dumps(usuarios)
+
+    casos = {
+        "json.dumps (antes)": antes,
+        "stdlib": lambda: Respuestas(codificar_stdlib).json(usuarios),
+        "por defecto": lambda: RESPUESTAS.json(usuarios),
+        "stream stdlib": lambda: Respuestas(codificar_stdlib).json_stream(usuarios).cuerpo_completo(),
+        "stream por defecto": lambda: RESPUESTAS.json_stream(usuarios).cuerpo_completo(),
+    }
+    print(f"{args.usuarios:,} usuarios, codificador por defecto: "
+          f"{'orjson' if orjson is not None else 'stdlib'}")
+    for nombre, fn in casos.items():
+        tiempos = []
+        for _ in range(args.repeticiones):
+            t0 = time.perf_counter()
+            fn()
+            tiempos.append(time.perf_counter() - t0)
+        print(f"  {nombre:<20} {min(tiempos) * 1000:8.1f} ms")
+
+    # Memoria pico: cuerpo completo vs consumir el stream trozo a trozo
+    for nombre, fn in (("completo", lambda: RESPUESTAS.json(usuarios).cuerpo),
+                       ("stream", lambda: sum(map(len, RESPUESTAS.json_stream(usuarios).cuerpo)))):
+        tracemalloc.start()
+        fn()
+        pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  pico {nombre:<10} {pico / 1e6:8.2f} MB")
@@ -0,0 +1,123 @@
+import asyncio
+import os
+
+import pytest
+
+from autenticacion import AlmacenTokens, Autenticador, Firmador, VerificadorAsync
+
+
+class Reloj:
+    def __init__(self):
+        self.t = 1_000_000.0
+
+    def __call__(self):
+        return self.t
+
+
+@pytest.fixture
+def aut():
+    return Autenticador(Firmador(os.urandom(32)), reloj=Reloj(), tam_cache=4)
+
+
+def test_emitir_y_verificar(aut):
+    token = aut.emitir("ana@corp.com")
+    ident = aut.verificar(token)
+    assert ident.sujeto == "ana@corp.com"
+    assert aut.verificar(token) == ident                  # desde la caché
+
+
+def test_firma_alterada_o_basura(aut):
+    token = aut.emitir("ana@corp.com")
+    payload, firma = token.split(".")
+    otro = Firmador(os.urandom(32)).descifrar(token, aut.reloj())
+    assert otro is None
+    assert aut.verificar(payload + "." + firma[:-2] + ("AA" if firma[-2:] != "AA" else "BB")) is None
+    for basura in ("", "a.b.c", "no-es-un-token", None):
+        assert aut.verificar(basura) is None
+    with pytest.raises(ValueError):
+        Firmador(b"corta")
+
+
+def test_caducidad_aunque_este_en_cache(aut):
+    token = aut.emitir("ana@corp.com", ttl=60)
+    assert aut.verificar(token) is not None
+    aut.reloj.t += 61
+    assert aut.verificar(token) is None
+    assert aut.almacen.purgar(aut.reloj()) == 1
+
+
+def test_revocar_invalida_entradas_en_cache(aut):
+    t1, t2 = aut.emitir("ana@corp.com"), aut.emitir("bob@corp.com")
+    assert aut.verificar(t1) and aut.verificar(t2)
+    # revocación hecha directamente en el almacén (otro Autenticador que lo comparte)
+    otro = Autenticador(aut.firmador, aut.almacen, reloj=aut.reloj)
+    assert otro.revocar(t1)
+    assert aut.verificar(t1) is None and aut.verificar(t2) is not None
+    t3 = aut.emitir("bob@corp.com")
+    assert aut.almacen.revocar_sujeto("bob@corp.com") == 2
+    assert aut.verificar(t2) is None and aut.verificar(t3) is None
+
+
+def test_cache_acotada(aut):
+    tokens = [aut.emitir(f"u{i}@corp.com") for i in range(10)]
+    for t in tokens:
+        aut.verificar(t)
+    assert len(aut.cache) == 4
+
+
+class AlmacenEspia(AlmacenTokens):
+    def __init__(self):
+        super().__init__()
+        self.consultas = 0
+
+    def activos(self, jtis):
+        self.consultas += 1
+        return super().activos(jtis)
+
+
+def test_verificador_async_agrupa_los_fallos():
+    almacen = AlmacenEspia()
+    aut = Autenticador(Firmador(os.urandom(32)), almacen)
+    tokens = [aut.emitir(f"u{i}@corp.com") for i in range(50)]
+    aut.revocar(tokens[0])
+
+    async def main():
+        v = VerificadorAsync(aut, max_lote=20)
+        frio = await v.verificar_lote(tokens + ["basura"])
+        consultas = almacen.consultas
+        caliente = await v.verificar_lote(tokens[1:])
+        return frio, consultas, caliente
+
+    frio, consultas, caliente = asyncio.run(main())
+    assert frio[0] is None and frio[-1] is None and all(frio[1:-1])
+    assert consultas == 3                      # 50 fallos en lotes de 20
+    assert all(caliente) and almacen.consultas == consultas   # aciertos de caché
+
+
+def test_almacen_sin_entradas_huerfanas(aut):
+    almacen = aut.almacen
+    t1, t2 = aut.emitir("ana@corp.com"), aut.emitir("ana@corp.com")
+    assert aut.revocar(t1) and aut.revocar(t2)
+    assert almacen._vivos == {} and almacen._por_sujeto == {}
+    aut.emitir("bob@corp.com", ttl=60)
+    aut.reloj.t += 61
+    assert almacen.purgar(aut.reloj()) == 1
+    assert almacen._por_sujeto == {}
+
+
+def test_emitir_purga_caducados_al_pasar_el_umbral():
+    reloj = Reloj()
+    aut = Autenticador(Firmador(os.urandom(32)), AlmacenTokens(purgar_desde=8), reloj=reloj)
+    largo = aut.emitir("admin", ttl=10_000)
+    for i in range(1_000):
+        aut.emitir(f"u{i}", ttl=5)
+        reloj.t += 1
+        assert len(aut.almacen._vivos) <= 16
+        assert len(aut.almacen._por_sujeto) <= 16
+    assert aut.verificar(largo).sujeto == "admin"
+    # con todo vivo el umbral crece (no se repasa el almacén en cada emisión)
+    vivos = AlmacenTokens(purgar_desde=8)
+    aut = Autenticador(aut.firmador, vivos, reloj=reloj)
+    tokens = [aut.emitir(f"v{i}") for i in range(100)]
+    assert len(vivos._vivos) == 100 and vivos._umbral >= 100
+    assert all(aut.verificar(t) for t in tokens)
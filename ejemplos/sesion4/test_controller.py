@@ -0,0 +1,43 @@
+import runpy
+import sys
+from pathlib import Path
+
+import pytest
+
+# El nombre del fichero tiene puntos: no se puede importar, se ejecuta con runpy.
+# Sus imports (autenticacion, respuestas, fase3) están en este directorio.
+_AQUI = Path(__file__).resolve().parent
+sys.path.insert(0, str(_AQUI))
+try:
+    _G = runpy.run_path(str(_AQUI / "ejemplo.orden.herencia.py"), run_name="controller")
+finally:
+    sys.path.remove(str(_AQUI))
+controller, ruta = _G["controller"], _G["ruta"]
+
+
+@controller(base_path="/items")
+class Items:
+    def get(self, path: str = "", method: str = ""):
+        return ("get", path, method)
+
+    @ruta("POST", "/buscar")
+    def buscar(self, q: str):
+        return ("buscar", q)
+
+
+@pytest.mark.parametrize("metodo", ["GET", "get", "Get"])
+def test_handle_despacha_sin_importar_mayusculas(metodo):
+    assert Items().handle(metodo) == ("get", "", "")
+    assert Items().handle(metodo, "/items") == ("get", "", "")
+
+
+def test_method_y_path_son_solo_posicionales():
+    # un handler puede recibir parámetros llamados path o method
+    assert Items().handle("GET", path="/x", method="y") == ("get", "/x", "y")
+    assert Items().handle("POST", "/items/buscar", q="ana") == ("buscar", "ana")
+
+
+def test_404_y_405():
+    assert Items().handle("GET", "/nada").status == 404
+    assert Items().handle("DELETE").status == 405
+    assert Items().handle("GET", "/items/buscar").status == 405
@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+from respuestas import CABECERAS_JSON, Respuestas, codificador_por_defecto, codificar_stdlib
+
+
+@pytest.mark.parametrize("data", [{1: "a"}, {"big": 2**70}, [{"id": 1, "name": "Ñandú"}]])
+def test_codificador_por_defecto_acepta_lo_que_acepta_la_stdlib(data):
+    assert json.loads(codificador_por_defecto()(data)) == json.loads(codificar_stdlib(data))
+
+
+def test_stream_igual_que_completo():
+    usuarios = [{"id": i, "email": f"u{i}@corp.com"} for i in range(1000)]
+    r = Respuestas(tam_chunk=512)
+    trozos = list(r.json_stream(usuarios).cuerpo)
+    assert len(trozos) > 1
+    assert json.loads(b"".join(trozos)) == usuarios
+    assert json.loads(r.json_stream([]).cuerpo_completo()) == []
+
+
+def test_stream_solo_asume_obj_a_bytes():
+    # Un codificador que no produce "[...]" para una lista también sirve
+    r = Respuestas(lambda obj: json.dumps(obj, indent=1).encode())
+    assert json.loads(r.json_stream([1, [2, 3], {"a": 4}]).cuerpo_completo()) == [1, [2, 3], {"a": 4}]
+
+
+def test_error_cacheado_y_cabeceras_congeladas():
+    r = Respuestas()
+    assert r.error("not found", 404) is r.error("not found", 404)
+    with pytest.raises(TypeError):
+        r.json({}).cabeceras["X"] = "y"
+    assert r.json({}).cabeceras is CABECERAS_JSON
@@ -0,0 +1,154 @@
+# app/contadores.py
+"""
+Contador fragmentado: cada proceso/hilo suma en su propio slot de un array
+compartido y la lectura agrega todos los slots. No hay Lock en el incremento.
+
+- Un escritor por slot: el read-modify-write del slot no compite con nadie.
+- Slots separados 64 bytes (una línea de caché) para que dos workers no se
+  invaliden la línea el uno al otro (false sharing).
+- Fragmento: el handle de un worker. Acumula en una variable local y vuelca al
+  slot cada `cada` incrementos (y con flush() / al salir del with), así el
+  incremento es una suma de Python y la memoria compartida se toca poco.
+  valor() ve lo volcado: lo pendiente de cada worker llega con su siguiente flush.
+- Backends: "shared_memory" (multiprocessing.shared_memory, por nombre) o
+  "array" (multiprocessing.RawArray). Ambos se pasan como argumento a Process.
+"""
+from __future__ import annotations
+
+from multiprocessing import RawArray
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+_PASO = 8   # 8 x int64 = 64 bytes por slot
+
+
+class ContadorFragmentado:
+    def __init__(self, n_slots: int, backend: str = "shared_memory"):
+        if n_slots < 1:
+            raise ValueError("Hace falta al menos un slot")
+        if backend not in ("shared_memory", "array"):
+            raise ValueError(f"Backend desconocido: {backend!r}")
+        self.n_slots = n_slots
+        self.backend = backend
+        self._propietario = True
+        if backend == "shared_memory":
+            self._shm: Optional[SharedMemory] = SharedMemory(create=True, size=n_slots * _PASO * 8)
+            self._buf = self._shm.buf
+            self._buf[:] = bytes(len(self._buf))
+        else:
+            self._shm = None
+            self._raw = RawArray("q", n_slots * _PASO)
+            self._buf = memoryview(self._raw).cast("B")
+        self._slots = self._buf.cast("q")
+
+    # ------------------ Paso a otros procesos ------------------
+    def __getstate__(self) -> dict:
+        estado = {"n_slots": self.n_slots, "backend": self.backend}
+        if self._shm is not None:
+            estado["nombre"] = self._shm.name
+        else:
+            estado["raw"] = self._raw
+        return estado
+
+    def __setstate__(self, estado: dict) -> None:
+        self.n_slots = estado["n_slots"]
+        self.backend = estado["backend"]
+        self._propietario = False
+        if "nombre" in estado:
+            self._shm = SharedMemory(name=estado["nombre"])
+            self._buf = self._shm.buf
+        else:
+            self._shm = None
+            self._raw = estado["raw"]
+            self._buf = memoryview(self._raw).cast("B")
+        self._slots = self._buf.cast("q")
+
+    # ------------------ Uso ------------------
+    def fragmento(self, i: int, cada: int = 1024) -> "Fragmento":
+        """Handle del slot i; debe haber un solo worker por slot."""
+        return Fragmento(self, self._posicion(i), cada)
+
+    def _posicion(self, i: int) -> int:
+        if not 0 <= i < self.n_slots:
+            raise IndexError("slot fuera de rango")
+        return i * _PASO
+
+    def valor(self) -> int:
+        return sum(self._slots[::_PASO])
+
+    def reiniciar(self) -> None:
+        self._buf[:] = bytes(len(self._buf))
+
+    def _soltar(self) -> None:
+        # Las vistas antes que el segmento: SharedMemory.close() falla si quedan vistas vivas
+        if self._slots is None:
+            return
+        self._slots.release()
+        self._slots = None
+        if self._shm is not None:
+            self._buf = None
+            self._shm.close()
+        else:
+            self._buf.release()
+
+    def cerrar(self) -> None:
+        """Suelta la vista; el proceso que lo creó además borra el segmento compartido."""
+        self._soltar()
+        if self._shm is not None and self._propietario:
+            self._shm.unlink()
+            self._propietario = False
+
+    def __del__(self) -> None:
+        # En los workers (copias deserializadas) basta con soltar la vista
+        if getattr(self, "_slots", None) is not None:
+            self._soltar()
+
+    def __enter__(self) -> "ContadorFragmentado":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cerrar()
+
+
+class Fragmento:
+    __slots__ = ("_slots", "_pos", "cada", "pendiente")
+
+    def __init__(self, contador: ContadorFragmentado, pos: int, cada: int):
+        self._slots = contador._slots
+        self._pos = pos
+        self.cada = max(1, cada)
+        self.pendiente = 0
+
+    def incrementar(self, n: int = 1) -> None:
+        self.pendiente += n
+        if self.pendiente >= self.cada:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.pendiente:
+            self._slots[self._pos] += self.pendiente
+            self.pendiente = 0
+
+    def __enter__(self) -> "Fragmento":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.flush()
+
+
+def incrementar_fragmentado(contador: ContadorFragmentado, slot: int, n_iter: int = 100_000,
+                            cada: int = 1024) -> None:
+    """
+    Equivalente a procesos.incrementar sobre el slot propio: el mismo bucle (acumular
+    en local y volcar cada `cada`), pero el volcado va directo al slot sin ningún Lock.
+    """
+    slots, pos = contador._slots, contador._posicion(slot)
+    cada = max(1, cada)
+    pendiente = 0
+    for _ in range(n_iter):
+        pendiente += 1
+        if pendiente >= cada:
+            slots[pos] += pendiente
+            pendiente = 0
+    if pendiente:
+        slots[pos] += pendiente
@@ -1,17 +1,33 @@
 # app/procesos.py
-from multiprocessing import Value, Lock
+from __future__ import annotations
+
+from multiprocessing import Lock, Process, Queue, Value
 from pathlib import Path
 import os
 import time
 
-def incrementar(contador: Value, n_iter: int = 100_000, lock: Lock | None = None) -> None:
+def incrementar(contador: Value, n_iter: int = 100_000, lock: Lock | None = None,
+                cada: int = 1) -> None:
+    """
+    Sin lock: carrera en contador.value += 1 (se pierden incrementos).
+    Con lock: un lock por incremento; con cada > 1 se acumula en local y se suma
+    bajo el lock cada `cada` incrementos. Sin lock compartido: contadores.ContadorFragmentado.
+    """
     if lock is None:
         for _ in range(n_iter):
             contador.value += 1
-    else:
-        for _ in range(n_iter):
+        return
+    cada = max(1, cada)
+    pendiente = 0
+    for _ in range(n_iter):
+        pendiente += 1
+        if pendiente >= cada:
             with lock:
-                contador.value += 1
+                contador.value += pendiente
+            pendiente = 0
+    if pendiente:
+        with lock:
+            contador.value += pendiente
 
 # --- NUEVO: escritura concurrente ---
 def escribir_log(path: str | Path, mensaje: str) -> None:
@@ -38,11 +54,7 @@ def escribir_log_seguro(path: str | Path, mensaje: str, lock: Lock) -> None:
 
 
 
-q = Queue()
-path = Path("log_queue.txt")
-if path.exists(): path.unlink()
-
-def escribe_log(q, path, total_fin): 
+def escribe_log(q, path, total_fin):
     with path.open("a", encoding="utf-8") as f:
          mensaje = q.get()
          f.write(mensaje + "\n")
@@ -56,13 +68,16 @@ def ecribirlog(idx, q):
     q.put(None)  # señal de fin
 
 
-
-
-escritor_proc = Process(target=escribe_log, args=(q, path, 6))
-
 def productor(idx, q):
     for j in range(200):
         q.put(f"[Q] P{idx:02d} L{j:04d}")
     q.put(None)  # señal de fin
 
-procesos = [Process(target=productor, args=(i, q)) for i in range(34)]
\ No newline at end of file
+
+if __name__ == "__main__":
+    q = Queue()
+    path = Path("log_queue.txt")
+    if path.exists(): path.unlink()
+
+    escritor_proc = Process(target=escribe_log, args=(q, path, 6))
+    procesos = [Process(target=productor, args=(i, q)) for i in range(34)]
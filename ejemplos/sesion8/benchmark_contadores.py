@@ -0,0 +1,67 @@
+# benchmark_contadores.py
+"""
+N procesos incrementan un contador compartido con procesos.incrementar
+(Value + Lock en cada incremento, y por lotes de --cada) vs ContadorFragmentado
+(un slot por proceso, sin Lock, volcando cada --cada) con los backends
+shared_memory y array. Los casos "lotes" y "fragmentado" usan el mismo --cada:
+la diferencia entre ellos es solo el Lock.
+
+Uso:
+    python benchmark_contadores.py --workers 1 4 16 --iteraciones 100000
+"""
+import argparse
+import os
+import time
+from multiprocessing import Lock, Process, Value
+
+from app.contadores import ContadorFragmentado, incrementar_fragmentado
+from app.procesos import incrementar
+
+
+def lanzar(objetivo, args_por_worker) -> float:
+    procesos = [Process(target=objetivo, args=a) for a in args_por_worker]
+    t0 = time.perf_counter()
+    for p in procesos:
+        p.start()
+    for p in procesos:
+        p.join()
+    return time.perf_counter() - t0
+
+
+def con_lock(workers: int, n_iter: int, cada: int) -> tuple[float, int]:
+    contador, lock = Value("q", 0, lock=False), Lock()
+    dt = lanzar(incrementar, [(contador, n_iter, lock, cada)] * workers)
+    return dt, contador.value
+
+
+def fragmentado(workers: int, n_iter: int, backend: str, cada: int) -> tuple[float, int]:
+    with ContadorFragmentado(workers, backend) as c:
+        dt = lanzar(incrementar_fragmentado, [(c, i, n_iter, cada) for i in range(workers)])
+        return dt, c.valor()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--iteraciones", type=int, default=100_000, help="incrementos por worker")
+    parser.add_argument("--cada", type=int, default=1024, help="incrementos entre volcados al slot")
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPU, {args.iteraciones:,} incrementos por worker; "
+          f"'Lock, lotes' y 'fragmentado' vuelcan cada {args.cada} (mismo bucle, con y sin Lock)")
+    for w in args.workers:
+        esperado = w * args.iteraciones
+        casos = {
+            "Value + Lock": lambda: con_lock(w, args.iteraciones, 1),
+            f"Lock, lotes {args.cada}": lambda: con_lock(w, args.iteraciones, args.cada),
+            "fragmentado shm": lambda: fragmentado(w, args.iteraciones, "shared_memory", args.cada),
+            "fragmentado array": lambda: fragmentado(w, args.iteraciones, "array", args.cada),
+        }
+        for nombre, fn in casos.items():
+            dt, valor = fn()
+            estado = "ok" if valor == esperado else f"MAL ({valor:,} de {esperado:,})"
+            print(f"  {w:>3} workers  {nombre:<20} {dt:7.3f} s  {esperado / dt:>14,.0f} inc/s  {estado}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import pickle
+from multiprocessing import Lock, Process, Value
+
+import pytest
+
+from app.contadores import ContadorFragmentado, incrementar_fragmentado
+from app.procesos import incrementar
+
+
+@pytest.mark.parametrize("backend", ["shared_memory", "array"])
+def test_fragmentado_entre_procesos(backend):
+    with ContadorFragmentado(3, backend) as c:
+        procesos = [Process(target=incrementar_fragmentado, args=(c, i, 5_000, 100)) for i in range(3)]
+        for p in procesos:
+            p.start()
+        for p in procesos:
+            p.join()
+        assert c.valor() == 15_000
+
+
+def test_fragmento_vuelca_cada_n_y_al_salir():
+    with ContadorFragmentado(2, "array") as c:
+        with c.fragmento(1, cada=10) as f:
+            for _ in range(25):
+                f.incrementar()
+            assert c.valor() == 20          # lo pendiente aún no se ve
+        assert c.valor() == 25
+        with pytest.raises(IndexError):
+            c.fragmento(2)
+
+
+def test_shared_memory_por_nombre_y_cerrar():
+    c = ContadorFragmentado(1)
+    copia = pickle.loads(pickle.dumps(c))   # lo que recibe un worker
+    with copia.fragmento(0, cada=1) as f:
+        f.incrementar(7)
+    assert c.valor() == 7
+    copia.cerrar()                          # la copia no borra el segmento
+    assert c.valor() == 7
+    c.cerrar()
+    c.cerrar()
+
+
+@pytest.mark.parametrize("cada", [1, 64, 1000])
+def test_incrementar_con_lock_por_lotes_es_exacto(cada):
+    contador, lock = Value("q", 0, lock=False), Lock()
+    procesos = [Process(target=incrementar, args=(contador, 1_001, lock, cada)) for _ in range(3)]
+    for p in procesos:
+        p.start()
+    for p in procesos:
+        p.join()
+    assert contador.value == 3_003
+
+
+class _LockContado:
+    def __init__(self):
+        self.veces = 0
+
+    def __enter__(self):
+        self.veces += 1
+
+    def __exit__(self, *exc):
+        pass
+
+
+@pytest.mark.parametrize("cada,veces", [(None, 1_001), (1, 1_001), (100, 11), (5_000, 1)])
+def test_incrementar_toma_un_lock_por_incremento_salvo_que_se_pida_lote(cada, veces):
+    contador, lock = Value("q", 0, lock=False), _LockContado()
+    if cada is None:
+        incrementar(contador, 1_001, lock)
+    else:
+        incrementar(contador, 1_001, lock, cada)
+    assert (contador.value, lock.veces) == (1_001, veces)
+
+
+@pytest.mark.parametrize("cada", [1, 7, 10_000])
+def test_incrementar_fragmentado_escribe_solo_su_slot(cada):
+    with ContadorFragmentado(3, "array") as c:
+        incrementar_fragmentado(c, 1, 1_001, cada)
+        assert c.valor() == 1_001
+        assert [c._slots[c._posicion(i)] for i in range(3)] == [0, 1_001, 0]
+        with pytest.raises(IndexError):
+            incrementar_fragmentado(c, 3, 1)
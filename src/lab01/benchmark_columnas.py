@@ -0,0 +1,67 @@
+# benchmark_columnas.py
+"""
+Validadores escalares (una llamada por fila) vs validadores por columna.
+
+Uso:
+    python benchmark_columnas.py --filas 1000000
+"""
+import argparse
+import random
+import time
+from typing import List
+
+from validaciones import validar_email, validar_telefono_es
+from validaciones_columnas import np, validar_email_col, validar_telefono_es_col
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
+
+def generar(n: int, semilla: int = 7):
+    rnd = random.Random(semilla)
+    emails: List[str] = []
+    tels: List[str] = []
+    for i in range(n):
+        r = rnd.random()
+        emails.append(f"user{i}@mail.com" if r < 0.8 else (f"user{i}@mail" if r < 0.9 else f"user{i}"))
+        tels.append(f"6{rnd.randrange(10**8):08d}" if r < 0.85 else f"6{rnd.randrange(10**6)}")
+    return emails, tels
+
+
+def _medir(nombre: str, n: int, fn) -> None:
+    t0 = time.perf_counter()
+    fn()
+    dt = time.perf_counter() - t0
+    print(f"{nombre:<34} {dt:7.3f} s   {n / dt / 1e6:7.2f} M filas/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filas", type=int, default=1_000_000)
+    args = parser.parse_args()
+    n = args.filas
+    emails, tels = generar(n)
+
+    print("== EMAIL ==")
+    _medir("escalar [validar_email(v) ...]", n, lambda: [validar_email(v) for v in emails])
+    _medir("validar_email_col(list)", n, lambda: validar_email_col(emails))
+    print("== TELÉFONO ==")
+    _medir("escalar [validar_telefono_es(v) ...]", n, lambda: [validar_telefono_es(v) for v in tels])
+    _medir("validar_telefono_es_col(list)", n, lambda: validar_telefono_es_col(tels))
+
+    if np is not None:
+        a_emails, a_tels = np.array(emails), np.array(tels)
+        print("== NumPy ==")
+        _medir("validar_email_col(ndarray)", n, lambda: validar_email_col(a_emails))
+        _medir("validar_telefono_es_col(ndarray)", n, lambda: validar_telefono_es_col(a_tels))
+    if pd is not None:
+        s_emails, s_tels = pd.Series(emails), pd.Series(tels)
+        print("== pandas ==")
+        _medir("validar_email_col(Series)", n, lambda: validar_email_col(s_emails))
+        _medir("validar_telefono_es_col(Series)", n, lambda: validar_telefono_es_col(s_tels))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# benchmark_lote.py
+"""
+Throughput de validación de formularios: llamada a llamada vs lote vs pool de procesos.
+
+Uso:
+    python benchmark_lote.py --filas 200000 --workers 1 2 4
+"""
+import argparse
+import random
+import time
+from typing import Any, Dict, Iterator
+
+from funciones import REGLAS_BASE, check_email_telefono, procesar_formulario
+from lote import procesar_lote, procesar_lote_paralelo
+
+
+def generar_formularios(n: int, semilla: int = 42) -> Iterator[Dict[str, Any]]:
+    """Formularios sintéticos con alias variados y ~20% de filas inválidas."""
+    rnd = random.Random(semilla)
+    claves_tel = ["telefono", "tel", "movil", "phone"]
+    for i in range(n):
+        malo = rnd.random() < 0.2
+        yield {
+            "email": f"  User{i}@{'empresa' if i % 7 == 0 else 'test'}.com " if not malo else f"user{i}@x",
+            claves_tel[i % 4]: "612 345 678" if not malo else "12 34",
+            "pwd": "Python123!" if not malo else "python",
+        }
+
+
+def _medir(nombre: str, n: int, consumir) -> float:
+    t0 = time.perf_counter()
+    consumir()
+    dt = time.perf_counter() - t0
+    print(f"{nombre:<28} {n / dt:>12,.0f} forms/s   ({dt:.2f} s)")
+    return n / dt
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filas", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--tam-bloque", type=int, default=5_000)
+    args = parser.parse_args()
+    n = args.filas
+
+    def por_llamada():
+        for f in generar_formularios(n):
+            procesar_formulario(check_email_telefono, reglas=REGLAS_BASE, **f)
+
+    def secuencial():
+        for _ in procesar_lote(generar_formularios(n), check_email_telefono, reglas=REGLAS_BASE):
+            pass
+
+    base = _medir("procesar_formulario", n, por_llamada)
+    _medir("procesar_lote", n, secuencial)
+
+    print("\nPool de procesos (throughput total y por worker):")
+    for w in args.workers:
+        def paralelo(w=w):
+            for _ in procesar_lote_paralelo(generar_formularios(n), check_email_telefono,
+                                            reglas=REGLAS_BASE, procesos=w,
+                                            tam_bloque=args.tam_bloque):
+                pass
+        total = _medir(f"paralelo workers={w}", n, paralelo)
+        print(f"{'':<28} {total / w:>12,.0f} forms/s/worker   (x{total / base:.2f} vs base)")
+
+
+if __name__ == "__main__":
+    main()
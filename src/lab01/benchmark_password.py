@@ -0,0 +1,53 @@
+# benchmark_password.py
+"""
+Coste por llamada: validar_password_extra con 4 re.search vs motor de una pasada.
+
+Uso:
+    python benchmark_password.py --repeticiones 200000
+"""
+import argparse
+import re
+import timeit
+
+from fuerza_password import POLITICA_EXTRA, SIMBOLOS, cumple_politica, evaluar_password
+from retos import validar_password_extra
+
+CASOS = ["Abcdefghij1!", "abcdefghijkl", "Short1!", "una-frase-de-paso-bastante-larga-2024"]
+
+
+def _extra_cuatro_busquedas(valor: str, *, min_len: int = 12, min_clases: int = 2) -> bool:
+    """Implementación anterior (referencia)."""
+    s = valor or ""
+    if len(s) < min_len:
+        return False
+    clases = 0
+    if re.search(r'[A-Z]', s): clases += 1
+    if re.search(r'[a-z]', s): clases += 1
+    if re.search(r'\d', s):    clases += 1
+    if re.search(rf'[{re.escape(SIMBOLOS)}]', s): clases += 1
+    return clases >= min_clases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeticiones", type=int, default=200_000)
+    args = parser.parse_args()
+    n = args.repeticiones
+
+    funciones = {
+        "4 x re.search (anterior)": _extra_cuatro_busquedas,
+        "validar_password_extra": validar_password_extra,
+        "cumple_politica(EXTRA)": lambda p: cumple_politica(p, POLITICA_EXTRA),
+        "evaluar_password(EXTRA)": lambda p: evaluar_password(p, POLITICA_EXTRA),
+    }
+    for caso in CASOS:
+        print(f"== {caso!r}")
+        base = None
+        for nombre, fn in funciones.items():
+            mejor = min(timeit.repeat(lambda: fn(caso), number=n, repeat=3)) / n
+            base = base or mejor
+            print(f"  {nombre:<26} {mejor * 1e9:8.0f} ns/llamada   (x{base / mejor:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+# benchmark_reglas.py
+"""
+Latencia por formulario: reglas como dict (camino genérico) vs PlanReglas compilado.
+
+Uso:
+    python benchmark_reglas.py --repeticiones 50000
+"""
+import argparse
+import timeit
+
+from funciones import REGLAS_BASE, check_email_telefono, compilar_reglas, procesar_formulario
+
+FORMULARIO = {"email": "  Usuario@TEST.com ", "movil": "612 345 678", "password": "Python123!"}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeticiones", type=int, default=50_000)
+    args = parser.parse_args()
+    n = args.repeticiones
+
+    plan = compilar_reglas(REGLAS_BASE)
+    casos = {
+        "dict REGLAS_BASE": lambda: procesar_formulario(check_email_telefono, reglas=REGLAS_BASE, **FORMULARIO),
+        "PlanReglas": lambda: procesar_formulario(check_email_telefono, reglas=plan, **FORMULARIO),
+        "compilar_reglas (caché)": lambda: compilar_reglas(REGLAS_BASE),
+    }
+    base = None
+    for nombre, fn in casos.items():
+        mejor = min(timeit.repeat(fn, number=n, repeat=5)) / n
+        base = base or mejor
+        print(f"{nombre:<26} {mejor * 1e6:8.2f} µs/op   (x{base / mejor:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,75 +1,520 @@
 # decoradores.py
+import asyncio
+from collections import OrderedDict
 from functools import wraps
+import inspect
+import random
+import threading
 import time
-from typing import Any, Callable, Dict, Tuple
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+import weakref
 
+from metricas import REGISTRO, instrumentar
+
+
+class RechazoRapido(Exception):
+    """Base de los rechazos sin llegar a llamar a la función (no se reintentan)."""
+
+class CircuitoAbierto(RechazoRapido):
+    """El circuit breaker está abierto: se falla rápido sin llamar al backend."""
+
+class BulkheadLleno(RechazoRapido):
+    """Se alcanzó el máximo de llamadas concurrentes del bulkhead."""
+
+class RetryInfo(NamedTuple):
+    llamadas: int
+    intentos: int
+    reintentos: int
+    agotados: int        # llamadas que se rindieron por n o por deadline
+    dormido_s: float     # tiempo total esperado entre intentos
+
+class _EstadoRetry:
+    """Contadores compartidos por todas las llamadas a la función decorada."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.llamadas = self.intentos = self.reintentos = self.agotados = 0
+        self.dormido_s = 0.0
+
+    def anotar(self, intentos: int, dormido: float, agotado: bool) -> None:
+        with self.lock:
+            self.llamadas += 1
+            self.intentos += intentos
+            self.reintentos += intentos - 1
+            self.agotados += agotado
+            self.dormido_s += dormido
+
+    def info(self) -> RetryInfo:
+        with self.lock:
+            return RetryInfo(self.llamadas, self.intentos, self.reintentos, self.agotados, self.dormido_s)
+
+def _esperas(backoff: float, factor: float, max_delay: Optional[float], jitter: Optional[str]):
+    """Generador de esperas entre intentos según la estrategia elegida."""
+    tope = float("inf") if max_delay is None else max_delay
+    delay = backoff
+    previo = backoff
+    while True:
+        if jitter == "full":           # U(0, exp) -> reparte a los clientes en el tiempo
+            yield random.uniform(0, min(tope, delay))
+        elif jitter == "decorrelated":  # U(base, 3 * anterior), acotado
+            previo = min(tope, random.uniform(backoff, previo * 3))
+            yield previo
+        else:
+            yield min(tope, delay)
+        delay *= factor
+
+def retry(n: int = 3, backoff: float = 0.1, exceptions: Tuple[type, ...] = (Exception,), *,
+          factor: float = 2.0, max_delay: Optional[float] = None,
+          jitter: Optional[str] = None, deadline: Optional[float] = None):
+    """
+    Reintenta la función si lanza alguna de `exceptions`, hasta `n` intentos en total.
+    - backoff/factor: espera inicial y multiplicador (exponencial)
+    - max_delay: tope de cada espera
+    - jitter: None | "full" | "decorrelated" (evita que muchos workers reintenten a la vez)
+    - deadline: segundos máximos desde el primer intento; si la siguiente espera lo
+      supera no se reintenta y se propaga la última excepción
+    Funciones async (coroutines) se reintentan con asyncio.sleep, sin bloquear el bucle.
+    Los rechazos de circuit_breaker/bulkhead (RechazoRapido) nunca se reintentan.
+    El wrapper expone retry_info() con intentos, reintentos y tiempo dormido.
+    """
+    if jitter not in (None, "full", "decorrelated"):
+        raise ValueError(f"jitter desconocido: {jitter!r}")
 
-def retry(n: int = 3, backoff: float = 0.1, exceptions: Tuple[type, ...] = (Exception,)):
     def decorator(func: Callable):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            delay = backoff
-            intento = 0
-            while True:
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
+        estado = _EstadoRetry()
+
+        def _siguiente(intento: int, esperas, t0: float) -> Optional[float]:
+            """Espera antes del próximo intento, o None si hay que rendirse."""
+            if intento >= n:
+                return None
+            delay = next(esperas)
+            if deadline is not None and time.monotonic() - t0 + delay > deadline:
+                return None
+            return delay
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                esperas = _esperas(backoff, factor, max_delay, jitter)
+                t0 = time.monotonic()
+                intento, dormido = 0, 0.0
+                while True:
+                    intento += 1
+                    try:
+                        res = await func(*args, **kwargs)
+                    except RechazoRapido:  # circuito abierto / bulkhead lleno: no insistir
+                        estado.anotar(intento, dormido, False)
+                        raise
+                    except exceptions:
+                        delay = _siguiente(intento, esperas, t0)
+                        if delay is None:
+                            estado.anotar(intento, dormido, True)
+                            raise
+                        await asyncio.sleep(delay)
+                        dormido += delay
+                    except BaseException:  # no reintentable
+                        estado.anotar(intento, dormido, False)
+                        raise
+                    else:
+                        estado.anotar(intento, dormido, False)
+                        return res
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                esperas = _esperas(backoff, factor, max_delay, jitter)
+                t0 = time.monotonic()
+                intento, dormido = 0, 0.0
+                while True:
                     intento += 1
-                    if intento >= n:
+                    try:
+                        res = func(*args, **kwargs)
+                    except RechazoRapido:  # circuito abierto / bulkhead lleno: no insistir
+                        estado.anotar(intento, dormido, False)
+                        raise
+                    except exceptions:
+                        delay = _siguiente(intento, esperas, t0)
+                        if delay is None:
+                            estado.anotar(intento, dormido, True)
+                            raise
+                        time.sleep(delay)
+                        dormido += delay
+                    except BaseException:  # no reintentable
+                        estado.anotar(intento, dormido, False)
                         raise
-                    time.sleep(delay)
-                    delay *= 2  # exponencial
+                    else:
+                        estado.anotar(intento, dormido, False)
+                        return res
+
+        wrapper.retry_info = estado.info  # type: ignore[attr-defined]
         return wrapper
     return decorator
 
 
+# ---------- Circuit breaker y bulkhead (componen con retry) ----------
+class CircuitoInfo(NamedTuple):
+    estado: str
+    llamadas: int
+    fallos: int
+    rechazadas: int
+    aperturas: int
+    tasa_fallos: float   # en la ventana actual
+
+class CircuitBreaker:
+    """
+    Circuit breaker con estados cerrado -> abierto -> semiabierto.
+    - Cerrado: se cuentan éxitos/fallos en una ventana deslizante de `ventana` segundos
+      (repartida en `cubetas`). Si hay >= min_llamadas y la tasa de fallos >= umbral, se abre.
+    - Abierto: todas las llamadas lanzan CircuitoAbierto durante `tiempo_abierto` segundos.
+    - Semiabierto: se dejan pasar hasta `pruebas` llamadas; un éxito cierra, un fallo reabre.
+      Solo deciden las admitidas como prueba en ese semiabierto: las que empezaron antes
+      (o en un semiabierto anterior) no tocan el estado.
+    Solo cuentan como fallo las excepciones de `exceptions`; una llamada cancelada o
+    interrumpida (BaseException que no es Exception) solo libera su hueco de prueba.
+    """
+    CERRADO, ABIERTO, SEMIABIERTO = "cerrado", "abierto", "semiabierto"
+
+    def __init__(self, *, umbral: float = 0.5, min_llamadas: int = 10, ventana: float = 30.0,
+                 cubetas: int = 10, tiempo_abierto: float = 5.0, pruebas: int = 1,
+                 exceptions: Tuple[type, ...] = (Exception,)):
+        if not 0 < umbral <= 1:
+            raise ValueError("umbral debe estar en (0, 1]")
+        self.umbral = umbral
+        self.min_llamadas = min_llamadas
+        self.ancho = ventana / cubetas
+        self.cubetas = cubetas
+        self.tiempo_abierto = tiempo_abierto
+        self.pruebas = pruebas
+        self.exceptions = exceptions
+        self._lock = threading.Lock()
+        self._ventana: "OrderedDict[int, list]" = OrderedDict()  # nº cubeta -> [llamadas, fallos]
+        self._estado = self.CERRADO
+        self._abierto_desde = 0.0
+        self._en_prueba = 0
+        self._generacion = 0   # nº de semiabierto actual; identifica a sus pruebas
+        self._llamadas = self._fallos = self._rechazadas = self._aperturas = 0
+
+    # --- ventana deslizante ---
+    def _cubeta(self, ahora: float) -> list:
+        idx = int(ahora // self.ancho)
+        while self._ventana and next(iter(self._ventana)) <= idx - self.cubetas:
+            self._ventana.popitem(last=False)
+        c = self._ventana.get(idx)
+        if c is None:
+            c = self._ventana[idx] = [0, 0]
+        return c
+
+    def _totales(self) -> Tuple[int, int]:
+        total = fallos = 0
+        for t, f in self._ventana.values():
+            total += t
+            fallos += f
+        return total, fallos
+
+    # --- transiciones ---
+    @property
+    def estado(self) -> str:
+        with self._lock:
+            return self._estado_actual(time.monotonic())
+
+    def _estado_actual(self, ahora: float) -> str:
+        if self._estado == self.ABIERTO and ahora - self._abierto_desde >= self.tiempo_abierto:
+            self._estado = self.SEMIABIERTO
+            self._en_prueba = 0
+            self._generacion += 1
+        return self._estado
+
+    def _abrir(self, ahora: float) -> None:
+        self._estado = self.ABIERTO
+        self._abierto_desde = ahora
+        self._aperturas += 1
+        self._ventana.clear()
+
+    def antes(self) -> Optional[int]:
+        """
+        Reserva un hueco para llamar o lanza CircuitoAbierto. Devuelve la generación
+        del semiabierto si la llamada entra como prueba (None si no); se pasa a despues().
+        """
+        with self._lock:
+            estado = self._estado_actual(time.monotonic())
+            if estado == self.ABIERTO or (estado == self.SEMIABIERTO and self._en_prueba >= self.pruebas):
+                self._rechazadas += 1
+                raise CircuitoAbierto(f"circuito abierto ({self._aperturas} aperturas)")
+            self._llamadas += 1
+            if estado == self.SEMIABIERTO:
+                self._en_prueba += 1
+                return self._generacion
+            return None
+
+    def despues(self, fallo: bool, prueba: Optional[int] = None) -> None:
+        with self._lock:
+            ahora = time.monotonic()
+            self._fallos += fallo
+            es_prueba = prueba is not None and prueba == self._generacion
+            if es_prueba:
+                self._en_prueba -= 1
+            if self._estado == self.SEMIABIERTO:
+                if not es_prueba:
+                    return          # empezó antes del semiabierto: no decide nada
+                if fallo:
+                    self._abrir(ahora)
+                else:
+                    self._estado = self.CERRADO
+                    self._ventana.clear()
+                return
+            c = self._cubeta(ahora)
+            c[0] += 1
+            c[1] += fallo
+            total, fallos = self._totales()
+            if self._estado == self.CERRADO and total >= self.min_llamadas and fallos / total >= self.umbral:
+                self._abrir(ahora)
+
+    def liberar(self, prueba: Optional[int]) -> None:
+        """La llamada no llegó a terminar (CancelledError, KeyboardInterrupt...): ni éxito ni fallo."""
+        with self._lock:
+            if prueba is not None and prueba == self._generacion:
+                self._en_prueba -= 1
+
+    def info(self) -> CircuitoInfo:
+        with self._lock:
+            estado = self._estado_actual(time.monotonic())
+            total, fallos = self._totales()
+            return CircuitoInfo(estado, self._llamadas, self._fallos, self._rechazadas,
+                                self._aperturas, fallos / total if total else 0.0)
+
+    def reiniciar(self) -> None:
+        with self._lock:
+            self._estado = self.CERRADO
+            self._ventana.clear()
+            self._en_prueba = 0
+
+    # --- decorador ---
+    def __call__(self, func: Callable):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                prueba = self.antes()
+                try:
+                    res = await func(*args, **kwargs)
+                except self.exceptions:
+                    self.despues(True, prueba)
+                    raise
+                except Exception:          # error no contado como fallo: la dependencia respondió
+                    self.despues(False, prueba)
+                    raise
+                except BaseException:      # cancelada/interrumpida: no hubo respuesta
+                    self.liberar(prueba)
+                    raise
+                self.despues(False, prueba)
+                return res
+        else:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                prueba = self.antes()
+                try:
+                    res = func(*args, **kwargs)
+                except self.exceptions:
+                    self.despues(True, prueba)
+                    raise
+                except Exception:          # error no contado como fallo: la dependencia respondió
+                    self.despues(False, prueba)
+                    raise
+                except BaseException:      # cancelada/interrumpida: no hubo respuesta
+                    self.liberar(prueba)
+                    raise
+                self.despues(False, prueba)
+                return res
+        wrapper.circuito = self  # type: ignore[attr-defined]
+        return wrapper
 
+def circuit_breaker(**opciones: Any) -> CircuitBreaker:
+    """@circuit_breaker(umbral=0.5, ventana=30, tiempo_abierto=5): ver CircuitBreaker."""
+    return CircuitBreaker(**opciones)
 
+def bulkhead(max_concurrentes: int, *, espera: Optional[float] = 0.0):
+    """
+    Limita las llamadas en vuelo a `max_concurrentes` (semáforo).
+    - espera: segundos máximos esperando hueco (0 = falla al instante, None = espera sin límite);
+      si no hay hueco se lanza BulkheadLleno
+    Hilos -> threading.BoundedSemaphore; coroutines -> un asyncio.Semaphore por event
+    loop (un semáforo asyncio queda ligado a su loop; el límite es por loop).
+    """
+    if max_concurrentes < 1:
+        raise ValueError("max_concurrentes debe ser >= 1")
+
+    def decorator(func: Callable):
+        if inspect.iscoroutinefunction(func):
+            semaforos: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = \
+                weakref.WeakKeyDictionary()
+
+            @wraps(func)
+            async def wrapper(*args, **kwargs):
+                loop = asyncio.get_running_loop()
+                sem_async = semaforos.get(loop)
+                if sem_async is None:
+                    sem_async = semaforos.setdefault(loop, asyncio.Semaphore(max_concurrentes))
+                if espera == 0:
+                    if sem_async.locked():
+                        raise BulkheadLleno(f"{func.__name__}: {max_concurrentes} llamadas en vuelo")
+                    await sem_async.acquire()
+                else:
+                    try:
+                        await asyncio.wait_for(sem_async.acquire(), espera)
+                    except asyncio.TimeoutError:
+                        raise BulkheadLleno(f"{func.__name__}: sin hueco tras {espera}s") from None
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    sem_async.release()
+        else:
+            sem = threading.BoundedSemaphore(max_concurrentes)
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if espera is None:
+                    ok = sem.acquire()
+                elif espera == 0:
+                    ok = sem.acquire(blocking=False)
+                else:
+                    ok = sem.acquire(timeout=espera)
+                if not ok:
+                    raise BulkheadLleno(f"{func.__name__}: {max_concurrentes} llamadas en vuelo")
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    sem.release()
+        return wrapper
+    return decorator
 
 
 # ---------- Decoradores genéricos ----------
+# Front-ends de metricas.instrumentar: registran en metricas.REGISTRO en lugar de imprimir
 def log_calls(func: Callable):
-    """Log simple: nombre y argumentos."""
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        print(f"[LOG] {func.__name__} args={args} kwargs={kwargs}")
-        res = func(*args, **kwargs)
-        print(f"[LOG] {func.__name__} -> {res}")
-        return res
-    return wrapper
+    """Log de nombre, argumentos y resultado (logging DEBUG, solo se formatea si está activo)."""
+    return instrumentar(func, muestreo=0, log=True)
+
+def cronometro(func: Optional[Callable] = None, *, muestreo: int = 1):
+    """Cronometra la ejecución (perf_counter_ns) -> histograma p50/p95/p99 en el registro."""
+    return instrumentar(func, muestreo=muestreo)
+
+def contador(func: Callable):
+    """Cuenta cuántas veces se llamó a la función (wrapper._count / wrapper.serie.llamadas)."""
+    return instrumentar(func, muestreo=0)
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    expiradas: int
+    sin_clave: int      # llamadas con argumentos no hashables (no se cachean)
+    maxsize: Optional[int]
+    currsize: int
+
+_KW_MARK = object()  # separa args de kwargs en la clave (evita colisiones)
+
+class _Fragmento:
+    """Un trozo de la caché: LRU (OrderedDict) + TTL opcional, protegido por su propio lock."""
+    __slots__ = ("datos", "lock", "maxsize", "hits", "misses", "evictions", "expiradas", "insertados")
+
+    def __init__(self, maxsize: Optional[int]):
+        self.datos: "OrderedDict[Any, Tuple[Any, float]]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = self.expiradas = 0
+        self.insertados = 0     # inserciones desde la última purga de caducadas
+
+    def purgar(self, ahora: float) -> None:
+        """Quita todas las entradas caducadas (con el lock tomado)."""
+        caducadas = [k for k, (_, expira) in self.datos.items() if expira <= ahora]
+        for k in caducadas:
+            del self.datos[k]
+        self.expiradas += len(caducadas)
+        self.insertados = 0
+
+def memoize(func: Optional[Callable] = None, *, maxsize: Optional[int] = 1024,
+            ttl: Optional[float] = None, fragmentos: int = 1):
+    """
+    Cachea resultados por (args, kwargs) — útil en validaciones costosas.
+    - maxsize: nº máximo de entradas (LRU); None = sin límite
+    - ttl: segundos de validez de cada entrada; None = no caduca
+    - fragmentos: nº de locks independientes (lock striping) para uso con muchos hilos;
+      maxsize se reparte entre ellos (redondeando hacia arriba)
+    Se usa como @memoize o @memoize(maxsize=..., ttl=...). Args no hashables -> sin caché.
+    Con ttl, las caducadas se quitan al consultarlas y en una purga completa cada
+    tantas inserciones como entradas haya (coste amortizado O(1), también con maxsize=None).
+    El wrapper expone cache_info() y cache_clear().
+    """
+    if func is None:
+        return lambda f: memoize(f, maxsize=maxsize, ttl=ttl, fragmentos=fragmentos)
+    if fragmentos < 1:
+        raise ValueError("fragmentos debe ser >= 1")
+    por_frag = None if maxsize is None else max(1, -(-maxsize // fragmentos))
+    frags = [_Fragmento(por_frag) for _ in range(fragmentos)]
+    sin_clave = 0
+    reloj = time.monotonic
 
-def cronometro(func: Callable):
-    """Cronometra la ejecución (ms)."""
     @wraps(func)
     def wrapper(*args, **kwargs):
-        t0 = time.time()
+        nonlocal sin_clave
+        key = args + (_KW_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
         try:
+            h = hash(key)
+        except TypeError:
+            with frags[0].lock:
+                sin_clave += 1
             return func(*args, **kwargs)
-        finally:
-            dt = (time.time() - t0) * 1000
-            print(f"[TIMER] {func.__name__} tardó {dt:.2f} ms")
-    return wrapper
+        frag = frags[h % fragmentos]
+        with frag.lock:
+            entrada = frag.datos.get(key)
+            if entrada is not None:
+                valor, expira = entrada
+                if ttl is None or expira > reloj():
+                    frag.datos.move_to_end(key)
+                    frag.hits += 1
+                    return valor
+                del frag.datos[key]
+                frag.expiradas += 1
+            frag.misses += 1
+        # Se calcula fuera del lock: dos hilos pueden calcular la misma clave a la vez
+        valor = func(*args, **kwargs)
+        with frag.lock:
+            if ttl is None:
+                frag.datos[key] = (valor, 0.0)
+            else:
+                ahora = reloj()
+                frag.datos[key] = (valor, ahora + ttl)
+                frag.insertados += 1
+                # tras purgar y quedar n entradas, la siguiente purga llega a las ~n inserciones
+                if 2 * frag.insertados >= max(len(frag.datos), 128):
+                    frag.purgar(ahora)
+            frag.datos.move_to_end(key)
+            if frag.maxsize is not None and len(frag.datos) > frag.maxsize:
+                frag.datos.popitem(last=False)
+                frag.evictions += 1
+        return valor
 
-def contador(func: Callable):
-    """Cuenta cuántas veces se llamó a la función (atributo ._count)."""
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        wrapper._count = getattr(wrapper, "_count", 0) + 1  # type: ignore[attr-defined]
-        return func(*args, **kwargs)
-    wrapper._count = 0  # type: ignore[attr-defined]
-    return wrapper
+    def cache_info() -> CacheInfo:
+        with frags[0].lock:
+            n_sin_clave = sin_clave
+        return CacheInfo(
+            hits=sum(f.hits for f in frags),
+            misses=sum(f.misses for f in frags),
+            evictions=sum(f.evictions for f in frags),
+            expiradas=sum(f.expiradas for f in frags),
+            sin_clave=n_sin_clave,
+            maxsize=maxsize,
+            currsize=sum(len(f.datos) for f in frags),
+        )
 
-def memoize(func: Callable):
-    """Cachea resultados por (args, kwargs) — útil en validaciones costosas."""
-    cache: Dict[Tuple[Any, Tuple[Tuple[str, Any], ...]], Any] = {}
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        key = (args, tuple(sorted(kwargs.items())))
-        if key in cache:
-            return cache[key]
-        res = func(*args, **kwargs)
-        cache[key] = res
-        return res
+    def cache_clear() -> None:
+        nonlocal sin_clave
+        for f in frags:
+            with f.lock:
+                f.datos.clear()
+                f.hits = f.misses = f.evictions = f.expiradas = f.insertados = 0
+        with frags[0].lock:
+            sin_clave = 0
+
+    wrapper.cache_info = cache_info  # type: ignore[attr-defined]
+    wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
     return wrapper
 
 def requiere_campos(*campos_obligatorios: str):
@@ -96,7 +541,8 @@ from funciones import procesar_formulario, REGLAS_BASE, check_email_telefono, ch
 # Decorar validadores (ejemplo; puedes elegir solo algunos)
 validar_email_logged = log_calls(cronometro((validar_email)))
 validar_telefono_es_timed = cronometro(validar_telefono_es)
-validar_password_counted = contador(validar_password)  # ahora acumula ._count
+validar_password_counted = contador(validar_password)  # ahora acumula ._count (= .serie.llamadas)
+validar_email_cache = memoize(maxsize=10_000, ttl=300)(validar_email)
 
 # Opción B: envolver el pipeline del formulario completo
 @log_calls
@@ -120,11 +566,17 @@ def politica_basica(valores: Dict[str, Any]):
     return True, ""
 
 if __name__ == "__main__":
+    import logging
+    logging.basicConfig(level=logging.DEBUG, format="[LOG] %(message)s")
+
     # 1) Probar validadores decorados
     print("email ok:", validar_email_logged("user@test.com"))
     print("tel ok:", validar_telefono_es_timed("612345678"))
     print("pwd ok:", validar_password_counted("Python123!"))
-    print("pwd calls:", validar_password_counted._count)  # type: ignore[attr-defined]
+    print("pwd calls:", validar_password_counted.serie.llamadas)  # type: ignore[attr-defined]
+    for e in ["user@test.com", "user@test.com", "mal@com"]:
+        validar_email_cache(e)
+    print("email cache:", validar_email_cache.cache_info())  # type: ignore[attr-defined]
 
     # 2) Pipeline observado (log + timer) con checks
     salida = procesar_formulario_observado(
@@ -143,4 +595,8 @@ if __name__ == "__main__":
         ok, msg = politica_basica({"email": "x@y.com", "password": ""})
         print(ok, msg)
     except ValueError as e:
-        print("POLÍTICA:", e)
\ No newline at end of file
+        print("POLÍTICA:", e)
+
+    # 4) Métricas acumuladas por los decoradores
+    print(REGISTRO.a_json(indent=2))
+    print(REGISTRO.a_prometheus())
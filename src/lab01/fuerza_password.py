@@ -0,0 +1,169 @@
+# fuerza_password.py
+"""
+Motor de fuerza de contraseñas en una sola pasada.
+
+Cada carácter se traduce (str.translate, en C) a un código de clase con una
+máscara de bits; str.count sobre el resultado da los recuentos sin volver a la regex.
+Sobre ese análisis se expresan las políticas del lab:
+  - POLITICA_BASICA    == validar_password(strict=False)
+  - POLITICA_ESTRICTA  == validar_password(strict=True)
+  - POLITICA_EXTRA     == validar_password_extra (>=12 y >=2 clases)
+"""
+from typing import Dict, NamedTuple, Tuple
+
+# Símbolos considerados (puedes ampliar)
+SIMBOLOS = r"""~`!@#$%^&*()_\-+={[}\]|\\:;"'<,>.?/=§±"""
+# Símbolos que exige el modo estricto (mismo conjunto que PASSWORD_STRICT_RE)
+SIMBOLOS_ESTRICTOS = "@#$%^&+=!"
+
+# Bits de clase
+MAYUS = 1
+MINUS = 2
+DIGITO = 4
+SIMBOLO = 8
+SIMBOLO_ESTRICTO = 16
+SALTO_LINEA = 32
+
+
+def _mascara(c: str) -> int:
+    m = 0
+    if "A" <= c <= "Z": m |= MAYUS
+    if "a" <= c <= "z": m |= MINUS
+    if c.isdecimal():   m |= DIGITO          # igual que \d en patrones str
+    if c in SIMBOLOS:   m |= SIMBOLO
+    if c in SIMBOLOS_ESTRICTOS: m |= SIMBOLO_ESTRICTO
+    if c == "\n":       m |= SALTO_LINEA     # '.' de las regex no lo acepta
+    return m
+
+
+class _TablaClases(dict):
+    """codepoint -> chr(máscara). ASCII precalculado; el resto se calcula y memoriza al vuelo."""
+
+    def __missing__(self, cp: int) -> str:
+        v = chr(_mascara(chr(cp)))
+        self[cp] = v
+        return v
+
+
+_TABLA = _TablaClases({cp: chr(_mascara(chr(cp))) for cp in range(128)})
+for _c in SIMBOLOS:
+    _TABLA[ord(_c)] = chr(_mascara(_c))
+
+
+class Analisis(NamedTuple):
+    """Recuentos por clase de una contraseña."""
+    longitud: int
+    mayusculas: int
+    minusculas: int
+    digitos: int
+    simbolos: int
+    simbolos_estrictos: int
+    saltos_linea: int
+
+    @property
+    def clases(self) -> int:
+        """Nº de clases presentes entre mayúscula, minúscula, dígito y símbolo."""
+        return ((self.mayusculas > 0) + (self.minusculas > 0)
+                + (self.digitos > 0) + (self.simbolos > 0))
+
+
+class Politica(NamedTuple):
+    """
+    Reglas de una política:
+      - min_len: longitud mínima
+      - min_clases: nº mínimo de clases (mayúscula/minúscula/dígito/símbolo)
+      - requiere: campos de Analisis que deben ser > 0
+      - linea_unica: semántica de las regex con '.' (sin saltos de línea,
+        salvo uno final que acepta '$')
+    """
+    min_len: int
+    min_clases: int = 0
+    requiere: Tuple[str, ...] = ()
+    linea_unica: bool = False
+
+
+class Puntuacion(NamedTuple):
+    ok: bool
+    analisis: Analisis
+    fallos: Tuple[str, ...]
+
+
+POLITICA_BASICA = Politica(8, requiere=("mayusculas", "digitos"), linea_unica=True)
+POLITICA_ESTRICTA = Politica(8, requiere=("mayusculas", "digitos", "simbolos_estrictos"), linea_unica=True)
+POLITICA_EXTRA = Politica(12, min_clases=2)
+
+_BITS_CAMPO: Dict[str, int] = {
+    "mayusculas": MAYUS,
+    "minusculas": MINUS,
+    "digitos": DIGITO,
+    "simbolos": SIMBOLO,
+    "simbolos_estrictos": SIMBOLO_ESTRICTO,
+    "saltos_linea": SALTO_LINEA,
+}
+_CLASES = (MAYUS, MINUS, DIGITO, SIMBOLO)
+# chr(máscara) -> índices de bit activos (orden de los campos de Analisis tras 'longitud')
+_BITS_DE: Dict[str, Tuple[int, ...]] = {
+    chr(m): tuple(i for i in range(6) if m >> i & 1) for m in range(64)
+}
+
+
+def _preparar(valor: str, linea_unica: bool) -> str:
+    s = valor or ""
+    if linea_unica and s.endswith("\n"):
+        s = s[:-1]
+    return s
+
+
+def analizar_password(valor: str, *, linea_unica: bool = False) -> Analisis:
+    """Clasifica todos los caracteres en una pasada y devuelve los recuentos."""
+    s = _preparar(valor, linea_unica)
+    t = s.translate(_TABLA)
+    cuenta = [0] * 6
+    for codigo in set(t):   # pocas clases distintas: str.count (en C) por cada una
+        n = t.count(codigo)
+        for i in _BITS_DE[codigo]:
+            cuenta[i] += n
+    return Analisis(len(s), *cuenta)
+
+
+def evaluar_password(valor: str, politica: Politica = POLITICA_BASICA) -> Puntuacion:
+    """Análisis completo + lista de reglas incumplidas ('min_len', 'min_clases', 'sin_<campo>', 'multilinea')."""
+    a = analizar_password(valor, linea_unica=politica.linea_unica)
+    fallos = []
+    if a.longitud < politica.min_len:
+        fallos.append("min_len")
+    if a.clases < politica.min_clases:
+        fallos.append("min_clases")
+    for campo in politica.requiere:
+        if not getattr(a, campo):
+            fallos.append(f"sin_{campo}")
+    if politica.linea_unica and a.saltos_linea:
+        fallos.append("multilinea")
+    return Puntuacion(not fallos, a, tuple(fallos))
+
+
+def cumple_politica(valor: str, politica: Politica = POLITICA_BASICA) -> bool:
+    """Camino rápido booleano: solo mira qué clases aparecen (sin contar)."""
+    s = _preparar(valor, politica.linea_unica)
+    if len(s) < politica.min_len:
+        return False
+    bits = 0
+    for codigo in set(s.translate(_TABLA)):
+        bits |= ord(codigo)
+    if politica.linea_unica and bits & SALTO_LINEA:
+        return False
+    for campo in politica.requiere:
+        if not bits & _BITS_CAMPO[campo]:
+            return False
+    if politica.min_clases:
+        clases = sum(1 for b in _CLASES if bits & b)
+        if clases < politica.min_clases:
+            return False
+    return True
+
+
+if __name__ == "__main__":
+    for p in ["python123", "Python123", "Python123!", "Short1!", "Abcdefghij1!", "AAAAAAAAAAAA1"]:
+        print(f"{p:>16} -> básica:{cumple_politica(p)}  estricta:{cumple_politica(p, POLITICA_ESTRICTA)}"
+              f"  extra:{cumple_politica(p, POLITICA_EXTRA)}")
+        print(" " * 20, evaluar_password(p, POLITICA_EXTRA))
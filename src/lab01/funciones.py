@@ -1,4 +1,6 @@
-from typing import Callable, Dict, List, Tuple, Any
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Any, Union
 from validaciones import (
     validar_email, validar_telefono_es, validar_password,
     normalizar_espacios, solo_digitos
@@ -89,16 +91,130 @@ def validar_valor(valor: Any, validadores: List[Tuple[Validador, str]]) -> Resul
             errores.append(msg)
     return ok, errores, valor
 
+def _evaluar_reglas(reglas: Dict[str, Dict[str, Any]],
+                    campos: Dict[str, Any]) -> Tuple[Dict[str, List[str]], Dict[str, Any]]:
+    """Camino genérico (sin compilar): recorre el dict de reglas campo a campo."""
+    errores: Dict[str, List[str]] = {}
+    valores_norm: Dict[str, Any] = {}
+    for campo, spec in reglas.items():
+        requerido = spec.get("requerido", False)
+        normalizadores = spec.get("normalizadores", [])
+        validadores = spec.get("validadores", [])
+
+        bruto = campos.get(campo, "")
+        valor = aplicar_normalizadores(bruto, normalizadores)
+
+        if requerido and (valor is None or str(valor).strip() == ""):
+            errores.setdefault(campo, []).append("Campo requerido")
+            valores_norm[campo] = valor
+            continue
+
+        ok, errs, val_out = validar_valor(valor, validadores)
+        if not ok:
+            errores.setdefault(campo, []).extend(errs)
+        valores_norm[campo] = val_out
+    return errores, valores_norm
+
+# ------------------------------------------------------------
+# PLAN COMPILADO DE REGLAS
+# ------------------------------------------------------------
+class _Cadena:
+    """Normalizadores encadenados en un único invocable (picklable, a diferencia de un closure)."""
+    __slots__ = ("funciones",)
+
+    def __init__(self, funciones: Tuple[Normalizador, ...]):
+        self.funciones = funciones
+
+    def __call__(self, valor: Any) -> Any:
+        for f in self.funciones:
+            valor = f(valor)
+        return valor
+
+def _componer(normalizadores: Tuple[Normalizador, ...]) -> Optional[Normalizador]:
+    """Aplana la cadena de normalizadores en una sola función (None si no hay)."""
+    if not normalizadores:
+        return None
+    if len(normalizadores) == 1:
+        return normalizadores[0]
+    return _Cadena(normalizadores)
+
+@dataclass(frozen=True)
+class PasoCampo:
+    """Trabajo precalculado para un campo: normalizar -> requerido -> validar."""
+    campo: str
+    requerido: bool
+    normalizadores: Tuple[Normalizador, ...]
+    validadores: Tuple[Tuple[Validador, str], ...]
+    normalizar: Optional[Normalizador] = field(default=None, compare=False, repr=False)
+
+@dataclass(frozen=True)
+class PlanReglas:
+    """
+    Reglas compiladas e inmutables (hashable): se pueden cachear o usar como clave.
+    Se obtienen con compilar_reglas() y se pasan a procesar_formulario(reglas=plan).
+    """
+    pasos: Tuple[PasoCampo, ...]
+
+    def evaluar(self, campos: Dict[str, Any]) -> Tuple[Dict[str, List[str]], Dict[str, Any]]:
+        """Normaliza y valida los campos ya des-aliasados. Devuelve (errores, valores)."""
+        errores: Dict[str, List[str]] = {}
+        valores: Dict[str, Any] = {}
+        for paso in self.pasos:
+            campo = paso.campo
+            valor = campos.get(campo, "")
+            if paso.normalizar is not None:
+                valor = paso.normalizar(valor)
+            if paso.requerido and (valor is None or str(valor).strip() == ""):
+                errores[campo] = ["Campo requerido"]
+                valores[campo] = valor
+                continue
+            errs = [msg for val_fn, msg in paso.validadores if not val_fn(valor)]
+            if errs:
+                errores[campo] = errs
+            valores[campo] = valor
+        return errores, valores
+
+def compilar_reglas(reglas: Optional[Dict[str, Dict[str, Any]]] = None) -> PlanReglas:
+    """
+    Compila un dict estilo REGLAS_BASE a un PlanReglas.
+    Reglas equivalentes devuelven el mismo objeto plan (caché LRU de 128 planes;
+    si algo de las reglas no es hashable se compila sin caché).
+    """
+    reglas = reglas or REGLAS_BASE
+    clave = tuple(
+        (
+            campo,
+            bool(spec.get("requerido", False)),
+            tuple(spec.get("normalizadores") or ()),
+            tuple(tuple(v) for v in spec.get("validadores") or ()),   # [fn, msg] -> (fn, msg)
+        )
+        for campo, spec in reglas.items()
+    )
+    try:
+        hash(clave)
+    except TypeError:
+        return _crear_plan(clave)
+    return _plan_cacheado(clave)
+
+def _crear_plan(clave: Tuple[Any, ...]) -> PlanReglas:
+    return PlanReglas(tuple(
+        PasoCampo(campo, req, norms, vals, normalizar=_componer(norms))
+        for campo, req, norms, vals in clave
+    ))
+
+_plan_cacheado = lru_cache(maxsize=128)(_crear_plan)
+
 # ------------------------------------------------------------
 # API REUTILIZABLE
 # ------------------------------------------------------------
 def procesar_formulario(*checks_globales: Callable[[Dict[str, Any]], Tuple[bool, str]],
-                        reglas: Dict[str, Dict[str, Any]] = None,
+                        reglas: Union[Dict[str, Dict[str, Any]], PlanReglas] = None,
                         **campos) -> Dict[str, Any]:
     """
     Procesa un formulario con reglas por campo y checks globales opcionales.
     - *checks_globales: funciones que reciben el dict de campos normalizados y devuelven (ok, error_msg)
     - reglas: diccionario de reglas por campo (normalizadores, validadores, requerido)
+      o un PlanReglas ya compilado con compilar_reglas() (evita recorrer el dict en cada llamada)
     - **campos: pares clave/valor del formulario
     Retorna dict con:
       {
@@ -110,29 +226,11 @@ def procesar_formulario(*checks_globales: Callable[[Dict[str, Any]], Tuple[bool,
 
     campos = _normalizar_claves(**campos)
 
-
-    reglas = reglas or REGLAS_BASE
-    errores: Dict[str, List[str]] = {}
-    valores_norm: Dict[str, Any] = {}
-
     # 1) Normalizar y validar cada campo definido en 'reglas'
-    for campo, spec in reglas.items():
-        requerido = spec.get("requerido", False)
-        normalizadores = spec.get("normalizadores", [])
-        validadores = spec.get("validadores", [])
-
-        bruto = campos.get(campo, "")
-        valor = aplicar_normalizadores(bruto, normalizadores)
-
-        if requerido and (valor is None or str(valor).strip() == ""):
-            errores.setdefault(campo, []).append("Campo requerido")
-            valores_norm[campo] = valor
-            continue
-
-        ok, errs, val_out = validar_valor(valor, validadores)
-        if not ok:
-            errores.setdefault(campo, []).extend(errs)
-        valores_norm[campo] = val_out
+    if isinstance(reglas, PlanReglas):
+        errores, valores_norm = reglas.evaluar(campos)
+    else:
+        errores, valores_norm = _evaluar_reglas(reglas or REGLAS_BASE, campos)
 
     # 2) Checks globales (e.g., coherencia entre campos)
     global_errs: List[str] = []
@@ -0,0 +1,170 @@
+# lote.py
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from funciones import ALIAS, PlanReglas, compilar_reglas
+
+CheckGlobal = Callable[[Dict[str, Any]], Tuple[bool, str]]
+Reglas = Union[Dict[str, Dict[str, Any]], PlanReglas, None]
+
+# Límite de claves distintas que se memorizan en la caché de alias (nombres de columna)
+_MAX_ALIAS_CACHE = 1024
+
+
+class _Motor:
+    """
+    Estado reutilizable entre formularios: plan compilado, checks globales
+    y caché de alias por nombre de columna.
+    """
+
+    def __init__(self, reglas: Reglas, checks: Sequence[CheckGlobal]):
+        self.plan = reglas if isinstance(reglas, PlanReglas) else compilar_reglas(reglas)
+        self.checks = tuple(checks)
+        self._alias: Dict[str, str] = {}
+
+    def _clave(self, k: str) -> str:
+        key = self._alias.get(k)
+        if key is None:
+            key = ALIAS.get(k.lower(), k)
+            if len(self._alias) < _MAX_ALIAS_CACHE:
+                self._alias[k] = key
+        return key
+
+    def procesar(self, formulario: Dict[str, Any]) -> Dict[str, Any]:
+        """Mismo resultado que procesar_formulario(*checks, reglas=..., **formulario)."""
+        alias = self._alias
+        campos: Dict[str, Any] = {}
+        for k, v in formulario.items():
+            key = alias.get(k)
+            campos[key if key is not None else self._clave(k)] = v
+
+        errores, valores = self.plan.evaluar(campos)
+        if self.checks:
+            global_errs = []
+            for chk in self.checks:
+                ok, msg = chk(valores)
+                if not ok and msg:
+                    global_errs.append(msg)
+            if global_errs:
+                errores["_global"] = global_errs
+
+        return {"ok": not errores, "errores": errores, "valores": valores}
+
+    def procesar_bloque(self, bloque: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        procesar = self.procesar
+        return [procesar(f) for f in bloque]
+
+
+# ------------------------------------------------------------
+# API DE LOTES
+# ------------------------------------------------------------
+def procesar_lote(formularios: Iterable[Dict[str, Any]],
+                  *checks_globales: CheckGlobal,
+                  reglas: Reglas = None) -> Iterator[Dict[str, Any]]:
+    """
+    Procesa formularios (dicts) uno tras otro y devuelve los resultados como stream.
+    - Las reglas se compilan una única vez para todo el lote (acepta también un PlanReglas).
+    - Cada resultado tiene la misma forma que el de procesar_formulario.
+    """
+    motor = _Motor(reglas, checks_globales)
+    procesar = motor.procesar
+    for formulario in formularios:
+        yield procesar(formulario)
+
+
+def filas_desde_columnas(columnas: Dict[str, Sequence[Any]]) -> Iterator[Dict[str, Any]]:
+    """
+    Convierte entrada columnar {campo: [v0, v1, ...]} en dicts por fila, de forma perezosa.
+    Todas las columnas deben tener la misma longitud.
+    """
+    nombres = tuple(columnas)
+    longitudes = {len(col) for col in columnas.values()}
+    if len(longitudes) > 1:
+        raise ValueError(f"Columnas con longitudes distintas: {sorted(longitudes)}")
+    for fila in zip(*columnas.values()):
+        yield dict(zip(nombres, fila))
+
+
+def procesar_columnas(columnas: Dict[str, Sequence[Any]],
+                      *checks_globales: CheckGlobal,
+                      reglas: Reglas = None) -> Iterator[Dict[str, Any]]:
+    """Igual que procesar_lote pero a partir de columnas paralelas."""
+    return procesar_lote(filas_desde_columnas(columnas), *checks_globales, reglas=reglas)
+
+
+# ------------------------------------------------------------
+# Ejecución en pool de procesos
+# ------------------------------------------------------------
+_motor_worker: Optional[_Motor] = None
+
+
+def _iniciar_worker(reglas, checks) -> None:
+    # Cada proceso compila las reglas una sola vez
+    global _motor_worker
+    _motor_worker = _Motor(reglas, checks)
+
+
+def _procesar_bloque_worker(bloque: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    assert _motor_worker is not None, "worker no inicializado"
+    return _motor_worker.procesar_bloque(bloque)
+
+
+def _bloques(it: Iterable[Any], tam: int) -> Iterator[List[Any]]:
+    it = iter(it)
+    while True:
+        bloque = list(islice(it, tam))
+        if not bloque:
+            return
+        yield bloque
+
+
+def procesar_lote_paralelo(formularios: Iterable[Dict[str, Any]],
+                           *checks_globales: CheckGlobal,
+                           reglas: Reglas = None,
+                           procesos: Optional[int] = None,
+                           tam_bloque: int = 5_000,
+                           en_vuelo: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Reparte el lote en bloques entre un pool de procesos y devuelve los resultados
+    en el mismo orden de entrada, como stream.
+    - reglas y checks deben ser picklables (funciones definidas a nivel de módulo).
+    - en_vuelo: nº máximo de bloques pendientes (por defecto 2 por proceso), para que
+      la memoria no crezca con el tamaño de la entrada.
+    """
+    if tam_bloque < 1:
+        raise ValueError("tam_bloque debe ser >= 1")
+    procesos = procesos or os.cpu_count() or 1
+    limite = en_vuelo or 2 * procesos
+    with ProcessPoolExecutor(max_workers=procesos,
+                             initializer=_iniciar_worker,
+                             initargs=(reglas, checks_globales)) as pool:
+        pendientes: deque = deque()
+        for bloque in _bloques(formularios, tam_bloque):
+            pendientes.append(pool.submit(_procesar_bloque_worker, bloque))
+            if len(pendientes) >= limite:
+                yield from pendientes.popleft().result()
+        while pendientes:
+            yield from pendientes.popleft().result()
+
+
+if __name__ == "__main__":
+    from funciones import check_email_telefono
+
+    formularios = [
+        {"email": "  Usuario@TEST.com ", "movil": "612 345 678", "password": "Python123!"},
+        {"mail": "admin@empresa.com", "pwd": "Python123!"},
+        {"correo": "mal@com", "tel": "12", "pass": "corta"},
+    ]
+    for res in procesar_lote(formularios, check_email_telefono):
+        print("LOTE:", res)
+
+    columnas = {
+        "email": ["a@b.com", "x@y"],
+        "telefono": ["612345678", ""],
+        "password": ["Python123", "python"],
+    }
+    for res in procesar_columnas(columnas):
+        print("COLUMNAS:", res)
@@ -0,0 +1,262 @@
+# metricas.py
+"""
+Registro de métricas en memoria para instrumentar funciones calientes.
+
+- Por función: nº de llamadas, errores e histograma de latencias (perf_counter_ns).
+- Histograma logarítmico en potencias de 2 de nanosegundos: observar es O(1)
+  y p50/p95/p99 se estiman interpolando dentro del bucket.
+- Muestreo configurable: con muestreo=N solo se cronometra 1 de cada N llamadas
+  (llamadas y errores se cuentan siempre); muestreo=0 solo cuenta.
+- Una serie por wrapper: dos decoraciones de la misma función no comparten
+  contador salvo que se les dé el mismo `nombre` explícito. El registro suelta
+  la serie de un wrapper cuando este desaparece (o con Registro.quitar).
+- Volcado como JSON o en formato de texto de Prometheus.
+"""
+from functools import update_wrapper, wraps
+import json
+import logging
+import threading
+import weakref
+from time import perf_counter_ns
+from types import MethodType
+from typing import Any, Callable, Dict, List, Optional
+
+_NUM_BUCKETS = 64  # int.bit_length() de una duración en ns (hasta ~292 años)
+
+logger = logging.getLogger(__name__)
+
+
+class Serie:
+    """Métricas de una función. Las actualizaciones van protegidas por un lock propio."""
+    __slots__ = ("nombre", "llamadas", "errores", "muestras", "suma_ns", "max_ns", "buckets", "lock",
+                 "__weakref__")
+
+    def __init__(self, nombre: str):
+        self.nombre = nombre
+        self.llamadas = 0
+        self.errores = 0
+        self.muestras = 0
+        self.suma_ns = 0
+        self.max_ns = 0
+        self.buckets: List[int] = [0] * _NUM_BUCKETS
+        self.lock = threading.Lock()
+
+    def contar(self) -> int:
+        with self.lock:
+            self.llamadas += 1
+            return self.llamadas
+
+    def error(self) -> None:
+        with self.lock:
+            self.errores += 1
+
+    def observar(self, ns: int) -> None:
+        with self.lock:
+            self.muestras += 1
+            self.suma_ns += ns
+            if ns > self.max_ns:
+                self.max_ns = ns
+            self.buckets[min(ns.bit_length(), _NUM_BUCKETS - 1)] += 1
+
+    def percentil(self, p: float) -> float:
+        """Latencia estimada (ns) del percentil p (0-100)."""
+        if not self.muestras:
+            return 0.0
+        objetivo = p / 100 * self.muestras
+        acumulado = 0
+        for i, n in enumerate(self.buckets):
+            if n and acumulado + n >= objetivo:
+                bajo = 0 if i == 0 else 1 << (i - 1)
+                alto = min(1 << i, self.max_ns + 1) if i else 1
+                return bajo + (alto - bajo) * (objetivo - acumulado) / n
+            acumulado += n
+        return float(self.max_ns)
+
+    def resumen(self) -> Dict[str, Any]:
+        with self.lock:
+            media = self.suma_ns / self.muestras if self.muestras else 0.0
+            return {
+                "llamadas": self.llamadas,
+                "errores": self.errores,
+                "muestras": self.muestras,
+                "media_ns": round(media, 1),
+                "p50_ns": round(self.percentil(50), 1),
+                "p95_ns": round(self.percentil(95), 1),
+                "p99_ns": round(self.percentil(99), 1),
+                "max_ns": self.max_ns,
+            }
+
+
+class Registro:
+    """
+    Colección de series por nombre de función.
+    Las series con nombre explícito (serie()) viven lo que el registro; las de cada
+    wrapper (nueva_serie()) se guardan con referencia débil y desaparecen con él,
+    así decorar closures o funciones de fábrica no hace crecer el registro.
+    """
+
+    def __init__(self):
+        self._series: Dict[str, Serie] = {}
+        self._propias: "weakref.WeakValueDictionary[str, Serie]" = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def serie(self, nombre: str) -> Serie:
+        """La serie `nombre` (compartida por todos los que pidan ese nombre)."""
+        s = self._series.get(nombre)
+        if s is None:
+            with self._lock:
+                s = self._series.setdefault(nombre, Serie(nombre))
+        return s
+
+    def nueva_serie(self, nombre: str) -> Serie:
+        """
+        Serie propia; si `nombre` ya existe se registra como "nombre#2", "nombre#3"...
+        El registro no la mantiene viva: quien la pide debe guardar la referencia.
+        """
+        with self._lock:
+            clave, i = nombre, 1
+            while clave in self._series or clave in self._propias:
+                i += 1
+                clave = f"{nombre}#{i}"
+            s = self._propias[clave] = Serie(clave)
+            return s
+
+    def quitar(self, nombre: str) -> None:
+        """Da de baja la serie `nombre` (deja de salir en los volcados)."""
+        with self._lock:
+            self._series.pop(nombre, None)
+            self._propias.pop(nombre, None)
+
+    def limpiar(self) -> None:
+        with self._lock:
+            self._series.clear()
+            self._propias.clear()
+
+    def _todas(self) -> List[Serie]:
+        with self._lock:
+            return list(self._series.values()) + list(self._propias.values())
+
+    def resumen(self) -> Dict[str, Dict[str, Any]]:
+        return {s.nombre: s.resumen() for s in self._todas()}
+
+    def a_json(self, **kwargs: Any) -> str:
+        return json.dumps(self.resumen(), **kwargs)
+
+    def a_prometheus(self, prefijo: str = "lab01") -> str:
+        """Texto de exposición de Prometheus: contador de llamadas/errores + histograma en segundos."""
+        series = self._todas()
+        lineas = [
+            f"# HELP {prefijo}_llamadas_total Llamadas por función",
+            f"# TYPE {prefijo}_llamadas_total counter",
+        ]
+        for s in series:
+            lineas.append(f'{prefijo}_llamadas_total{{funcion="{_etiqueta(s.nombre)}"}} {s.llamadas}')
+        lineas += [
+            f"# HELP {prefijo}_errores_total Llamadas que lanzaron excepción",
+            f"# TYPE {prefijo}_errores_total counter",
+        ]
+        for s in series:
+            lineas.append(f'{prefijo}_errores_total{{funcion="{_etiqueta(s.nombre)}"}} {s.errores}')
+        lineas += [
+            f"# HELP {prefijo}_latencia_segundos Latencia por función (muestreada)",
+            f"# TYPE {prefijo}_latencia_segundos histogram",
+        ]
+        for s in series:
+            with s.lock:
+                buckets, muestras, suma = list(s.buckets), s.muestras, s.suma_ns
+            etiqueta = _etiqueta(s.nombre)
+            usados = [i for i, n in enumerate(buckets) if n]
+            acumulado = 0
+            for i in range(usados[0], usados[-1] + 1) if usados else ():
+                acumulado += buckets[i]
+                le = ((1 << i) - 1) / 1e9  # el bucket i cubre duraciones < 2**i ns
+                lineas.append(f'{prefijo}_latencia_segundos_bucket{{funcion="{etiqueta}",le="{le:.9g}"}} {acumulado}')
+            lineas.append(f'{prefijo}_latencia_segundos_bucket{{funcion="{etiqueta}",le="+Inf"}} {muestras}')
+            lineas.append(f'{prefijo}_latencia_segundos_sum{{funcion="{etiqueta}"}} {suma / 1e9:.9g}')
+            lineas.append(f'{prefijo}_latencia_segundos_count{{funcion="{etiqueta}"}} {muestras}')
+        return "\n".join(lineas) + "\n"
+
+
+def _etiqueta(valor: str) -> str:
+    return valor.replace("\\", r"\\").replace('"', r'\"').replace("\n", r"\n")
+
+
+REGISTRO = Registro()
+
+
+class FuncionInstrumentada:
+    """
+    Lo que devuelve instrumentar: llamable como la función original (también como
+    método), con .serie y ._count (alias de serie.llamadas, como el antiguo contador).
+    """
+
+    def __init__(self, llamar: Callable, serie: Serie):
+        self._llamar = llamar
+        self.serie = serie
+
+    def __call__(self, *args, **kwargs):
+        return self._llamar(*args, **kwargs)
+
+    def __get__(self, obj: Any, tipo: Any = None):
+        return self if obj is None else MethodType(self, obj)
+
+    @property
+    def _count(self) -> int:
+        return self.serie.llamadas
+
+
+def instrumentar(func: Optional[Callable] = None, *, nombre: Optional[str] = None,
+                 muestreo: int = 1, registro: Optional[Registro] = None,
+                 log: bool = False):
+    """
+    Decorador base: cuenta llamadas y errores y cronometra 1 de cada `muestreo`.
+    - Cada wrapper tiene su propia serie (registrada como func.__qualname__, o
+      "qualname#2"... si ya existe); con `nombre` explícito se comparte la serie
+      de ese nombre
+    - muestreo=0: solo cuenta (sin cronometrar)
+    - log=True: emite args/resultado por logging a nivel DEBUG, formateando
+      solo si ese nivel está activo
+    El wrapper expone .serie con las métricas de la función.
+    """
+    if func is None:
+        return lambda f: instrumentar(f, nombre=nombre, muestreo=muestreo, registro=registro, log=log)
+    if muestreo < 0:
+        raise ValueError("muestreo debe ser >= 0")
+    reg = registro or REGISTRO
+    # Decoradores apilados sobre el mismo wrapper (p. ej. log_calls(cronometro(f))):
+    # comparten su serie y la llamada (y el error) ya la cuenta el wrapper interior
+    interior = getattr(func, "serie", None)
+    anidado = nombre is None and isinstance(interior, Serie)
+    if anidado:
+        serie = interior
+    elif nombre is not None:
+        serie = reg.serie(nombre)
+    else:
+        serie = reg.nueva_serie(func.__qualname__)
+    fname = func.__name__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        n = serie.llamadas + 1 if anidado else serie.contar()
+        traza = log and logger.isEnabledFor(logging.DEBUG)
+        if traza:
+            logger.debug("%s args=%r kwargs=%r", fname, args, kwargs)
+        cronometrar = muestreo and not n % muestreo
+        t0 = perf_counter_ns() if cronometrar else 0
+        try:
+            res = func(*args, **kwargs)
+        except BaseException:
+            if cronometrar:
+                serie.observar(perf_counter_ns() - t0)
+            if not anidado:
+                serie.error()
+            raise
+        if cronometrar:
+            serie.observar(perf_counter_ns() - t0)
+        if traza:
+            logger.debug("%s -> %r", fname, res)
+        return res
+
+    # updated=(): sin copiar func.__dict__, que en decoradores apilados trae el
+    # _llamar y la serie del wrapper interior y taparía los de esta capa
+    return update_wrapper(FuncionInstrumentada(wrapper, serie), func, updated=())
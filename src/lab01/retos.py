@@ -1,7 +1,10 @@
 # validaciones.py
 import re
+from functools import lru_cache
 from typing import Iterable
 
+from fuerza_password import SIMBOLOS, Politica, cumple_politica
+
 # =========================
 # Patrones compilados
 # =========================
@@ -17,8 +20,8 @@ PASSWORD_RE = re.compile(r'^(?=.*[A-Z])(?=.*\d).{8,}$')
 # Password estricta: 8+, al menos 1 mayúscula, 1 dígito y 1 símbolo permitido
 PASSWORD_STRICT_RE = re.compile(r'^(?=.*[A-Z])(?=.*\d)(?=.*[@#$%^&+=!]).{8,}$')
 
-# Símbolos considerados (puedes ampliar)
-_SIMBOLOS = r"""~`!@#$%^&*()_\-+={[}\]|\\:;"'<,>.?/=§±"""
+# Símbolos considerados (puedes ampliar en fuerza_password.SIMBOLOS)
+_SIMBOLOS = SIMBOLOS
 
 # =========================
 # Validadores
@@ -40,19 +43,14 @@ def validar_password_extra(valor: str, *, min_len: int = 12, min_clases: int = 2
       - Longitud mínima configurable (por defecto 12).
       - Debe contener al menos `min_clases` de estas 4 categorías:
         mayúscula, minúscula, dígito, símbolo.
-    Nota: Usa lógica en Python para contar clases (más claro que una regex compleja).
+    Nota: usa el motor de una pasada de fuerza_password (más claro que una regex compleja
+    y sin 4 búsquedas por llamada).
     """
-    s = valor or ""
-    if len(s) < min_len:
-        return False
-
-    clases = 0
-    if re.search(r'[A-Z]', s): clases += 1
-    if re.search(r'[a-z]', s): clases += 1
-    if re.search(r'\d', s):    clases += 1
-    if re.search(rf'[{re.escape(_SIMBOLOS)}]', s): clases += 1
+    return cumple_politica(valor, _politica_extra(min_len, min_clases))
 
-    return clases >= min_clases
+@lru_cache(maxsize=32)
+def _politica_extra(min_len: int, min_clases: int) -> Politica:
+    return Politica(min_len, min_clases=min_clases)
 
 def validar_cp_es(valor: str) -> bool:
     """
@@ -0,0 +1,218 @@
+import asyncio
+import time
+
+import pytest
+
+from decoradores import BulkheadLleno, CircuitBreaker, CircuitoAbierto, bulkhead, retry
+
+
+def test_bulkhead_async_sirve_en_varios_event_loops():
+    @bulkhead(1, espera=0.5)
+    async def tarea(x):
+        await asyncio.sleep(0)
+        return x
+
+    # Cada asyncio.run es un loop nuevo: el semáforo no puede ser el del primero
+    assert asyncio.run(tarea(1)) == 1
+    assert asyncio.run(tarea(2)) == 2
+
+
+def test_bulkhead_async_limita_dentro_del_loop():
+    @bulkhead(1, espera=0.01)
+    async def lenta():
+        await asyncio.sleep(0.1)
+
+    async def main():
+        return await asyncio.gather(lenta(), lenta(), return_exceptions=True)
+
+    res = asyncio.run(main())
+    assert sum(isinstance(r, BulkheadLleno) for r in res) == 1
+
+
+def _breaker_semiabierto() -> CircuitBreaker:
+    cb = CircuitBreaker(umbral=0.5, min_llamadas=1, tiempo_abierto=0.01, pruebas=1)
+    prueba = cb.antes()
+    cb.despues(True, prueba)
+    assert cb.estado == CircuitBreaker.ABIERTO
+    time.sleep(0.02)
+    return cb
+
+
+def test_llamada_previa_al_semiabierto_no_decide():
+    cb = CircuitBreaker(umbral=0.5, min_llamadas=2, tiempo_abierto=0.01, pruebas=1)
+    lenta = cb.antes()                        # empieza con el circuito cerrado
+    assert lenta is None
+    cb.despues(True, cb.antes())
+    cb.despues(True, cb.antes())
+    assert cb.estado == CircuitBreaker.ABIERTO
+    time.sleep(0.02)
+    prueba = cb.antes()                       # única prueba del semiabierto
+    assert prueba is not None
+    cb.despues(False, lenta)                  # la lenta termina ahora
+    assert cb.estado == CircuitBreaker.SEMIABIERTO
+    assert cb._en_prueba == 1
+    with pytest.raises(CircuitoAbierto):
+        cb.antes()                            # el hueco de prueba sigue ocupado
+    cb.despues(False, prueba)
+    assert cb.estado == CircuitBreaker.CERRADO
+
+
+def test_prueba_fallida_reabre():
+    cb = _breaker_semiabierto()
+    prueba = cb.antes()
+    cb.despues(True, prueba)
+    assert cb.estado == CircuitBreaker.ABIERTO
+
+
+def test_prueba_de_un_semiabierto_anterior_no_decide():
+    cb = CircuitBreaker(umbral=0.5, min_llamadas=1, tiempo_abierto=0.01, pruebas=2)
+    cb.despues(True, cb.antes())
+    time.sleep(0.02)
+    vieja = cb.antes()
+    cb.despues(True, cb.antes())              # otra prueba falla y reabre
+    time.sleep(0.02)
+    assert cb.estado == CircuitBreaker.SEMIABIERTO
+    cb.despues(False, vieja)                  # la vieja acaba en el semiabierto nuevo
+    assert cb.estado == CircuitBreaker.SEMIABIERTO
+    assert cb._en_prueba == 0
+
+
+def test_decorador_cierra_con_prueba_exitosa():
+    cb = _breaker_semiabierto()
+    assert cb(lambda: "ok")() == "ok"
+    assert cb.estado == CircuitBreaker.CERRADO
+
+
+def test_memoize_ttl_sin_maxsize_purga_caducadas():
+    from decoradores import memoize
+
+    @memoize(maxsize=None, ttl=0.01)
+    def doble(x):
+        return 2 * x
+
+    for i in range(100):
+        doble(i)
+    time.sleep(0.02)
+    for i in range(100, 300):          # claves nuevas: nunca se consultan las viejas
+        doble(i)
+    info = doble.cache_info()
+    assert info.currsize <= 200 and info.expiradas >= 100
+
+
+def test_memoize_caducada_se_recalcula_y_cuenta_sin_clave():
+    from decoradores import memoize
+    llamadas = []
+
+    @memoize(ttl=0.01)
+    def f(x):
+        llamadas.append(x)
+        return x
+
+    f(1)
+    f(1)
+    time.sleep(0.02)
+    f(1)
+    f([1])                             # no hashable: sin caché
+    info = f.cache_info()
+    assert llamadas == [1, 1, [1]]
+    assert (info.hits, info.misses, info.expiradas, info.sin_clave) == (1, 2, 1, 1)
+    f.cache_clear()
+    assert f.cache_info().sin_clave == 0
+
+
+def _falla_veces(n, exc=ValueError):
+    estado = {"llamadas": 0}
+
+    def f():
+        estado["llamadas"] += 1
+        if estado["llamadas"] <= n:
+            raise exc("fallo")
+        return "ok"
+    return f, estado
+
+
+def test_retry_reintenta_y_cuenta():
+    f, estado = _falla_veces(2)
+    g = retry(3, backoff=0.001)(f)
+    assert g() == "ok"
+    info = g.retry_info()
+    assert (info.llamadas, info.intentos, info.reintentos, info.agotados) == (1, 3, 2, 0)
+
+
+def test_retry_agota_y_no_reintenta_otras_excepciones():
+    f, estado = _falla_veces(5)
+    with pytest.raises(ValueError):
+        retry(2, backoff=0.001)(f)()
+    assert estado["llamadas"] == 2
+    f, estado = _falla_veces(5, KeyError)
+    with pytest.raises(KeyError):
+        retry(3, backoff=0.001, exceptions=(ValueError,))(f)()
+    assert estado["llamadas"] == 1
+
+
+def test_retry_respeta_deadline_y_max_delay():
+    f, estado = _falla_veces(10)
+    g = retry(10, backoff=0.05, factor=10, deadline=0.2)(f)
+    with pytest.raises(ValueError):
+        g()
+    assert g.retry_info().dormido_s <= 0.2 and estado["llamadas"] < 10
+    f, _ = _falla_veces(3)
+    g = retry(5, backoff=0.001, factor=100, max_delay=0.002, jitter="full")(f)
+    assert g() == "ok" and g.retry_info().dormido_s <= 3 * 0.002
+
+
+def test_retry_no_insiste_con_rechazo_rapido():
+    f, estado = _falla_veces(5, CircuitoAbierto)
+    with pytest.raises(CircuitoAbierto):
+        retry(5, backoff=0.001)(f)()
+    assert estado["llamadas"] == 1
+
+
+def test_retry_async_no_bloquea_el_loop():
+    llamadas = []
+
+    @retry(3, backoff=0.01)
+    async def f():
+        llamadas.append(1)
+        if len(llamadas) < 3:
+            raise ValueError
+        return "ok"
+
+    async def main():
+        otra = asyncio.create_task(asyncio.sleep(0.005, result="otra"))
+        return await f(), otra.done()
+
+    assert asyncio.run(main()) == ("ok", True)
+
+
+def test_retry_jitter_desconocido():
+    with pytest.raises(ValueError):
+        retry(jitter="mucho")
+
+
+def test_prueba_cancelada_no_cierra_ni_reabre():
+    cb = _breaker_semiabierto()
+
+    @cb
+    async def colgada():
+        await asyncio.sleep(10)
+
+    async def main():
+        tarea = asyncio.create_task(colgada())
+        await asyncio.sleep(0)
+        tarea.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await tarea
+
+    asyncio.run(main())
+    assert cb.estado == CircuitBreaker.SEMIABIERTO and cb._en_prueba == 0
+
+    @cb
+    def interrumpida():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        interrumpida()
+    assert cb.estado == CircuitBreaker.SEMIABIERTO and cb._en_prueba == 0
+    assert cb(lambda: "ok")() == "ok"        # el hueco de prueba quedó libre
+    assert cb.estado == CircuitBreaker.CERRADO
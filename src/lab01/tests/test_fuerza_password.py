@@ -0,0 +1,95 @@
+import re
+
+import pytest
+
+from fuerza_password import (
+    POLITICA_BASICA,
+    POLITICA_ESTRICTA,
+    POLITICA_EXTRA,
+    SIMBOLOS,
+    SIMBOLOS_ESTRICTOS,
+    Analisis,
+    Politica,
+    analizar_password,
+    cumple_politica,
+    evaluar_password,
+)
+from retos import PASSWORD_RE, PASSWORD_STRICT_RE, validar_password_extra
+
+
+def _extra_regex(valor, *, min_len=12, min_clases=2):
+    """validar_password_extra anterior a fuerza_password (4 re.search)."""
+    s = valor or ""
+    if len(s) < min_len:
+        return False
+    clases = 0
+    if re.search(r'[A-Z]', s): clases += 1
+    if re.search(r'[a-z]', s): clases += 1
+    if re.search(r'\d', s):    clases += 1
+    if re.search(rf'[{re.escape(SIMBOLOS)}]', s): clases += 1
+    return clases >= min_clases
+
+
+CASOS = [
+    "", None, "a", "Short1!", "python123", "Python123", "Python123!",
+    "abcdefghijkl", "ABCDEFGHIJKL", "AAAAAAAAAAAA1", "Abcdefghijk1", "Abcdefghij1!",
+    # saltos de línea: final (lo acepta '$'), intermedios y solo saltos
+    "Python123\n", "Python123!\n", "Python\n123!", "\nPython123!", "Python123!\n\n",
+    "abcdefghijk\n", "\n" * 12, "ABCDEFGHIJK\n1",
+    # no ASCII: letras acentuadas no son [A-Z]/[a-z]; dígitos Unicode sí son \d
+    "ÁÉÍÓÚÑáéíóúñ", "Ñandúñandú12", "Contraseña١٢٣", "ＰＡＳＳＷＯＲＤ１２３", "PASSWORD١",
+    "Pässwörd§±12", "пароль123456", "🔒🔒🔒🔒🔒🔒🔒🔒A1", "abcdefghijk\\", "abcdefghijk-",
+    "Tab\tTab\t123", "espacios    A1",
+]
+
+
+@pytest.mark.parametrize("valor", CASOS)
+def test_extra_igual_que_regex(valor):
+    assert validar_password_extra(valor) == _extra_regex(valor)
+    for min_len, min_clases in [(0, 0), (1, 1), (8, 3), (12, 4)]:
+        assert (validar_password_extra(valor, min_len=min_len, min_clases=min_clases)
+                == _extra_regex(valor, min_len=min_len, min_clases=min_clases))
+
+
+@pytest.mark.parametrize("valor", CASOS)
+def test_politicas_igual_que_regex(valor):
+    assert cumple_politica(valor, POLITICA_BASICA) == (PASSWORD_RE.match(valor or "") is not None)
+    assert cumple_politica(valor, POLITICA_ESTRICTA) == (PASSWORD_STRICT_RE.match(valor or "") is not None)
+    assert cumple_politica(valor, POLITICA_EXTRA) == _extra_regex(valor)
+
+
+@pytest.mark.parametrize("valor", CASOS)
+@pytest.mark.parametrize("politica", [POLITICA_BASICA, POLITICA_ESTRICTA, POLITICA_EXTRA,
+                                      Politica(4, min_clases=3, requiere=("minusculas",))])
+def test_evaluar_coincide_con_camino_rapido(valor, politica):
+    p = evaluar_password(valor, politica)
+    assert p.ok == cumple_politica(valor, politica)
+    assert p.ok == (p.fallos == ())
+
+
+@pytest.mark.parametrize("valor", CASOS)
+def test_analizar_cuenta_caracter_a_caracter(valor):
+    s = valor or ""
+    esperado = Analisis(
+        len(s),
+        len(re.findall(r"[A-Z]", s)),
+        len(re.findall(r"[a-z]", s)),
+        len(re.findall(r"\d", s)),
+        sum(c in SIMBOLOS for c in s),
+        sum(c in SIMBOLOS_ESTRICTOS for c in s),
+        s.count("\n"),
+    )
+    assert analizar_password(valor) == esperado
+
+
+def test_analizar_linea_unica_quita_solo_el_salto_final():
+    assert analizar_password("Ab1!\n", linea_unica=True) == Analisis(4, 1, 1, 1, 1, 1, 0)
+    assert analizar_password("Ab1!\n\n", linea_unica=True).saltos_linea == 1
+    assert analizar_password("", linea_unica=True) == Analisis(0, 0, 0, 0, 0, 0, 0)
+
+
+def test_fallos():
+    assert evaluar_password("", POLITICA_BASICA).fallos == ("min_len", "sin_mayusculas", "sin_digitos")
+    assert evaluar_password("Python\n123!", POLITICA_ESTRICTA).fallos == ("multilinea",)
+    assert evaluar_password("abcdefghijkl", POLITICA_EXTRA).fallos == ("min_clases",)
+    assert evaluar_password("Python123!\n", POLITICA_ESTRICTA) == evaluar_password("Python123!", POLITICA_ESTRICTA)
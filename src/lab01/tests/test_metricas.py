@@ -0,0 +1,84 @@
+import logging
+
+import pytest
+
+from decoradores import check_longitud_minima_factory, contador, cronometro, log_calls
+from metricas import Registro, instrumentar
+from validaciones import validar_password
+
+
+def test_cada_wrapper_tiene_su_serie():
+    a = contador(validar_password)
+    b = contador(validar_password)
+    t = cronometro(validar_password)
+    a("Python123!")
+    a("x")
+    b("Python123!")
+    assert (a._count, b._count, t._count) == (2, 1, 0)
+    assert a.serie is not b.serie and a.serie.nombre != b.serie.nombre
+
+    c1 = contador(check_longitud_minima_factory("password", 8))
+    c2 = contador(check_longitud_minima_factory("password", 4))
+    c1({"password": "x"})
+    c1({"password": "x"})
+    c2({"password": "x"})
+    assert (c1._count, c2._count) == (2, 1)
+
+
+def test_nombre_explicito_comparte():
+    reg = Registro()
+    a = instrumentar(validar_password, nombre="pwd", registro=reg)
+    b = instrumentar(validar_password, nombre="pwd", registro=reg)
+    a("x")
+    b("x")
+    assert a.serie is b.serie and a.serie.llamadas == 2
+
+
+@pytest.mark.parametrize("apilar", [lambda f: log_calls(cronometro(f)), lambda f: cronometro(log_calls(f))])
+def test_apilados_corren_las_dos_capas(apilar, caplog):
+    def doble(x):
+        return 2 * x
+
+    f = apilar(doble)
+    with caplog.at_level(logging.DEBUG, logger="metricas"):
+        assert f(2) == 4
+    assert any("doble args=(2,)" in r.getMessage() for r in caplog.records)
+    assert f.serie.llamadas == 1 and f.serie.muestras == 1
+
+
+def test_errores_se_cuentan_sin_muestreo():
+    @contador
+    def falla():
+        raise RuntimeError("x")
+
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            falla()
+    assert falla.serie.errores == 3 and falla.serie.muestras == 0
+
+
+def test_funciona_como_metodo():
+    class C:
+        @contador
+        def doble(self, x):
+            return 2 * x
+
+    assert C().doble(4) == 8 and C.doble._count == 1
+
+
+def test_series_de_wrappers_desaparecen_con_ellos():
+    import gc
+    reg = Registro()
+    for n in range(100):
+        instrumentar(check_longitud_minima_factory("password", n), registro=reg)({"password": "x"})
+    gc.collect()
+    assert reg.resumen() == {}
+
+    vivo = instrumentar(validar_password, registro=reg)
+    fijo = instrumentar(validar_password, nombre="pwd", registro=reg)
+    vivo("x")
+    fijo("x")
+    assert set(reg.resumen()) == {vivo.serie.nombre, "pwd"}
+    assert "validar_password" in reg.a_prometheus()
+    reg.quitar("pwd")
+    assert set(reg.resumen()) == {vivo.serie.nombre}
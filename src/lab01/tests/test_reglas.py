@@ -0,0 +1,56 @@
+import pickle
+
+from funciones import REGLAS_BASE, check_email_telefono, compilar_reglas, procesar_formulario
+from lote import procesar_columnas, procesar_lote
+
+FORMULARIOS = [
+    {"email": "  Usuario@TEST.com ", "movil": "612 345 678", "password": "Python123!"},
+    {"MAIL": "admin@empresa.com", "pwd": "Python123!"},
+    {"correo": "mal@com", "tel": "12", "pass": ""},
+]
+
+
+def test_plan_equivale_a_reglas_dict():
+    plan = compilar_reglas(REGLAS_BASE)
+    for f in FORMULARIOS:
+        esperado = procesar_formulario(check_email_telefono, reglas=REGLAS_BASE, **f)
+        assert procesar_formulario(check_email_telefono, reglas=plan, **f) == esperado
+
+
+def test_plan_cacheado_hashable_y_picklable():
+    plan = compilar_reglas(dict(REGLAS_BASE))
+    assert plan is compilar_reglas(REGLAS_BASE)
+    assert {plan: 1}[plan] == 1
+    assert pickle.loads(pickle.dumps(plan)) == plan
+
+
+def test_lote_y_columnas_equivalen_a_procesar_formulario():
+    esperado = [procesar_formulario(check_email_telefono, **f) for f in FORMULARIOS]
+    assert list(procesar_lote(FORMULARIOS, check_email_telefono)) == esperado
+
+    columnas = {"email": ["a@b.com", "x@y"], "telefono": ["612345678", ""], "password": ["Python123", ""]}
+    filas = [dict(zip(columnas, vals)) for vals in zip(*columnas.values())]
+    assert list(procesar_columnas(columnas)) == [procesar_formulario(**f) for f in filas]
+
+
+def test_validadores_como_lista_y_no_hashables():
+    reglas = {"email": {"validadores": [[lambda v: "@" in v, "Email inválido"]]}}
+    plan = compilar_reglas(reglas)
+    assert plan is compilar_reglas(reglas)
+    assert procesar_formulario(reglas=plan, email="x")["errores"] == {"email": ["Email inválido"]}
+
+    class NoHashable:
+        __hash__ = None
+
+        def __call__(self, v):
+            return v
+
+    reglas = {"email": {"normalizadores": [NoHashable()]}}
+    assert compilar_reglas(reglas) is not compilar_reglas(reglas)
+
+
+def test_cache_de_planes_acotada():
+    from funciones import _plan_cacheado
+    for i in range(300):
+        compilar_reglas({f"campo{i}": {"requerido": True}})
+    assert _plan_cacheado.cache_info().currsize <= _plan_cacheado.cache_info().maxsize
@@ -0,0 +1,64 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from retos import validar_cp_es
+from validaciones import validar_email, validar_password, validar_telefono_es
+from validaciones_columnas import (validar_cp_es_col, validar_email_col, validar_password_col,
+                                   validar_telefono_es_col)
+
+NULOS = [None, float("nan"), ""]
+
+EMAILS = ["a@b.co", "a@b.c", "user.name@mail.co", "mal@com", "x@y", "@b.com", "a@b.com\n",
+          "a@b.com\nx", "ñandú@correo.es", "a@b.co ", " a@b.co", "a@@b.co", "a@b.١٢"] + NULOS
+TELEFONOS = ["612345678", "612345678\n", "61234567", "6123456789", "612 345 678", "٦١٢٣٤٥٦٧٨",
+             "٦١٢٣٤٥٦٧٨\n", "612345678 ", "\n612345678", "６１２３４５６７８"] + NULOS
+PASSWORDS = ["Python123", "python123", "PYTHON123", "Python123!", "Short1!", "Python1\n",
+             "Python12\n", "Pyth\non123", "Ñandú١٢٣45", "Abcdefg٣", "        A1"] + NULOS
+CPS = ["01001", "52006", "00000", "53000", "99000", " 28013 ", "28013\n", "2801", "280133",
+       "٢٨٠١٣", "２８０１３", "28 13", "0100a"] + NULOS
+
+
+def _escalar(validador, v):
+    # el validador escalar hace `valor or ""`: NaN no es falsy y no es str
+    if isinstance(v, float) and math.isnan(v):
+        return False
+    return validador(v)
+
+
+CASOS = [
+    (validar_email_col, validar_email, EMAILS),
+    (validar_telefono_es_col, validar_telefono_es, TELEFONOS),
+    (validar_password_col, validar_password, PASSWORDS),
+    (lambda c: validar_password_col(c, strict=True), lambda v: validar_password(v, strict=True), PASSWORDS),
+    (validar_cp_es_col, validar_cp_es, CPS),
+]
+CONTENEDORES = {
+    "lista": lambda vals: list(vals),
+    "ndarray": lambda vals: np.array(vals, dtype=object),
+    "ndarray_str": lambda vals: np.array([v for v in vals if isinstance(v, str)]),
+    "series": lambda vals: pd.Series(vals, index=range(100, 100 + len(vals)), name="col"),
+}
+
+
+@pytest.mark.parametrize("col, escalar, valores", CASOS)
+@pytest.mark.parametrize("contenedor", CONTENEDORES)
+def test_mascara_igual_que_el_validador_escalar(col, escalar, valores, contenedor):
+    entrada = CONTENEDORES[contenedor](valores)
+    esperado = [_escalar(escalar, v) for v in (entrada.tolist() if contenedor != "lista" else entrada)]
+    mascara = col(entrada)
+    if contenedor == "lista":
+        assert isinstance(mascara, list)
+    elif contenedor == "series":
+        assert isinstance(mascara, pd.Series) and mascara.index.equals(entrada.index)
+        assert mascara.name == "col"
+    else:
+        assert isinstance(mascara, np.ndarray) and mascara.dtype == bool
+    assert list(map(bool, mascara)) == esperado
+
+
+def test_columna_vacia():
+    assert validar_email_col([]) == []
+    assert validar_cp_es_col(np.array([], dtype=str)).size == 0
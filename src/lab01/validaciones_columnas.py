@@ -0,0 +1,166 @@
+# validaciones_columnas.py
+"""
+Versiones "por columna" de los validadores de validaciones.py / retos.py.
+
+Cada función acepta una lista (o cualquier iterable), un array de NumPy o una
+Series de pandas y devuelve una máscara booleana del mismo tipo de contenedor:
+  - lista/iterable -> list[bool]
+  - np.ndarray     -> np.ndarray[bool]
+  - pd.Series      -> pd.Series[bool] (mismo índice)
+
+Estrategia: filtros baratos primero (longitud, '@', clase de caracteres) que
+descartan o aceptan la mayoría de filas sin pasar por la regex; solo los casos
+dudosos llegan a la regex, que sigue siendo la fuente de verdad.
+Valores vacíos / None / NaN (y cualquier no-str) se consideran inválidos, en
+cualquier contenedor.
+"""
+from typing import Any, Callable, Iterable, List
+
+from validaciones import EMAIL_RE, PASSWORD_RE, PASSWORD_STRICT_RE, TEL_ES_RE
+from retos import validar_cp_es
+
+try:  # NumPy/pandas son opcionales: sin ellos solo se usa el camino de listas
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# "a@b.co" es el email más corto que acepta EMAIL_RE
+_EMAIL_MIN = 6
+_PWD_MIN = 8
+
+
+# =========================
+# Despacho por tipo de contenedor
+# =========================
+def _es_series(valores: Any) -> bool:
+    return hasattr(valores, "index") and hasattr(valores, "str") and hasattr(valores, "to_numpy")
+
+
+def _a_array(valores: Any):
+    """Array 'U' de NumPy; None/NaN/no-str se convierten a "" para imitar `valor or ""`."""
+    arr = valores.to_numpy(dtype=object) if _es_series(valores) else np.asarray(valores)
+    if arr.dtype.kind != "U":
+        arr = np.array([v if isinstance(v, str) else "" for v in arr.ravel()], dtype=str)
+    return arr
+
+
+def _columna(valores: Any,
+             por_lista: Callable[[Iterable[Any]], List[bool]],
+             por_array: Callable[[Any], Any]):
+    if np is not None and (isinstance(valores, np.ndarray) or _es_series(valores)):
+        mascara = por_array(_a_array(valores))
+        if _es_series(valores):
+            return type(valores)(mascara, index=valores.index, name=getattr(valores, "name", None))
+        return mascara
+    return por_lista(valores)
+
+
+def _refinar(arr, seguros, dudosos, match):
+    """Combina filas ya aceptadas (seguros) con la regex aplicada solo a los dudosos."""
+    mascara = seguros.copy()
+    idx = np.flatnonzero(dudosos)
+    if idx.size:
+        mascara[idx] = [match(s) is not None for s in arr[idx].tolist()]
+    return mascara
+
+
+# =========================
+# Email
+# =========================
+def _email_lista(valores: Iterable[Any]) -> List[bool]:
+    match = EMAIL_RE.match
+    return [isinstance(v, str) and len(v) >= _EMAIL_MIN and "@" in v and match(v) is not None
+            for v in valores]
+
+
+def _email_array(arr):
+    # np.char.find/str_len no compensan aquí: '@' y longitud se comprueban igual de rápido
+    # en el bucle de la lista, que evita la regex para las filas descartadas
+    return np.fromiter(_email_lista(arr.tolist()), dtype=bool, count=arr.size)
+
+
+def validar_email_col(valores: Any):
+    """Máscara de validar_email para una columna completa."""
+    return _columna(valores, _email_lista, _email_array)
+
+
+# =========================
+# Teléfono ES
+# =========================
+def _telefono_lista(valores: Iterable[Any]) -> List[bool]:
+    match = TEL_ES_RE.match
+    # 9 dígitos decimales -> válido sin regex; 10 chars puede ser "9 dígitos + \n" (lo acepta '$')
+    return [isinstance(v, str) and ((len(v) == 9 and v.isdecimal()) or (len(v) == 10 and match(v) is not None))
+            for v in valores]
+
+
+def _telefono_array(arr):
+    lens = np.char.str_len(arr)
+    seguros = (lens == 9) & np.char.isdecimal(arr)
+    return _refinar(arr, seguros, lens == 10, TEL_ES_RE.match)
+
+
+def validar_telefono_es_col(valores: Any):
+    """Máscara de validar_telefono_es (normaliza antes con solo_digitos si hace falta)."""
+    return _columna(valores, _telefono_lista, _telefono_array)
+
+
+# =========================
+# Password
+# =========================
+def validar_password_col(valores: Any, *, strict: bool = False):
+    """Máscara de validar_password(strict=...) para una columna completa."""
+    match = (PASSWORD_STRICT_RE if strict else PASSWORD_RE).match
+
+    def por_lista(vals: Iterable[Any]) -> List[bool]:
+        return [isinstance(v, str) and len(v) >= _PWD_MIN and match(v) is not None for v in vals]
+
+    def por_array(arr):
+        dudosos = np.char.str_len(arr) >= _PWD_MIN
+        return _refinar(arr, np.zeros(arr.shape, dtype=bool), dudosos, match)
+
+    return _columna(valores, por_lista, por_array)
+
+
+# =========================
+# Código postal ES
+# =========================
+def _cp_lista(valores: Iterable[Any]) -> List[bool]:
+    res = []
+    for v in valores:
+        if not v or not isinstance(v, str):
+            res.append(False)
+        elif len(v) == 5 and v.isascii() and v.isdigit():
+            res.append("01" <= v[:2] <= "52")
+        else:
+            res.append(validar_cp_es(v))  # espacios alrededor, dígitos no ASCII...
+    return res
+
+
+def _cp_array(arr):
+    lens = np.char.str_len(arr)
+    # ASCII puro: todos los caracteres entre '0' y '9' -> comparación lexicográfica sin regex
+    ascii5 = (lens == 5) & np.char.isdecimal(arr) & (np.char.str_len(np.char.encode(arr, "utf-8")) == 5)
+    prov = arr.astype("U2")
+    seguros = ascii5 & (prov >= "01") & (prov <= "52")
+    mascara = seguros.copy()
+    idx = np.flatnonzero(~ascii5 & (lens >= 5))
+    if idx.size:
+        mascara[idx] = [validar_cp_es(s) for s in arr[idx].tolist()]
+    return mascara
+
+
+def validar_cp_es_col(valores: Any):
+    """Máscara de validar_cp_es (retos.py) para una columna completa."""
+    return _columna(valores, _cp_lista, _cp_array)
+
+
+if __name__ == "__main__":
+    emails = ["a@b.com", "mal@com", "user.name@mail.co", "x@y", None, ""]
+    tels = ["612345678", "612 345 678", "12345", "612345678\n"]
+    pwds = ["python123", "Python123", "Python123!", "Short1!"]
+    cps = ["01001", "52006", "00000", "99000", " 28013 "]
+    print("email:", validar_email_col(emails))
+    print("tel:  ", validar_telefono_es_col(tels))
+    print("pwd:  ", validar_password_col(pwds), validar_password_col(pwds, strict=True))
+    print("cp:   ", validar_cp_es_col(cps))